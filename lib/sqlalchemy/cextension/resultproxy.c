@@ -32,6 +32,9 @@ typedef struct {
     PyObject *row;
     PyObject *processors;
     PyObject *keymap;
+    /* processed values, or NULL if not memoizing */
+    PyObject **memo;
+    Py_ssize_t memo_len;
 } BaseRowProxy;
 
 /****************
@@ -70,13 +73,139 @@ safe_rowproxy_reconstructor(PyObject *self, PyObject *args)
     return (PyObject *)obj;
 }
 
+static void
+BaseRowProxy_clearmemo(BaseRowProxy *self)
+{
+    Py_ssize_t i;
+
+    if (self->memo == NULL)
+        return;
+
+    for (i = 0; i < self->memo_len; i++) {
+        Py_XDECREF(self->memo[i]);
+    }
+    PyMem_Free(self->memo);
+    self->memo = NULL;
+    self->memo_len = 0;
+}
+
+static int
+BaseRowProxy_initmemo(BaseRowProxy *self)
+{
+    Py_ssize_t length, i;
+
+    BaseRowProxy_clearmemo(self);
+
+    length = PySequence_Length(self->row);
+    if (length < 0)
+        return -1;
+
+    self->memo = PyMem_New(PyObject *, length);
+    if (self->memo == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    for (i = 0; i < length; i++) {
+        self->memo[i] = NULL;
+    }
+    self->memo_len = length;
+    return 0;
+}
+
+/* Return a new reference to the value at the given index, running the
+ * column's processor upon first access only.
+ */
+static PyObject *
+BaseRowProxy_memoized(BaseRowProxy *self, Py_ssize_t index)
+{
+    PyObject *processor, *value, *processed_value;
+
+    if (index < 0 || index >= self->memo_len) {
+        PyErr_SetString(PyExc_IndexError, "row index out of range");
+        return NULL;
+    }
+
+    if (self->memo[index] == NULL) {
+        processor = PyList_GetItem(self->processors, index);
+        if (processor == NULL)
+            return NULL;
+
+        value = PySequence_GetItem(self->row, index);
+        if (value == NULL)
+            return NULL;
+
+        if (processor != Py_None) {
+            processed_value = PyObject_CallFunctionObjArgs(processor, value,
+                                                           NULL);
+            Py_DECREF(value);
+            if (processed_value == NULL)
+                return NULL;
+        } else {
+            processed_value = value;
+        }
+
+        /* the processor may have replaced the row */
+        if (self->memo == NULL || index >= self->memo_len)
+            return processed_value;
+        Py_XDECREF(self->memo[index]);
+        self->memo[index] = processed_value;
+    }
+
+    Py_INCREF(self->memo[index]);
+    return self->memo[index];
+}
+
+static PyObject *
+BaseRowProxy_memoizedvalues(BaseRowProxy *self, PyObject *slice, int astuple)
+{
+    Py_ssize_t start, stop, step, slicelength, i;
+    PyObject *result, *value;
+
+    if (slice == NULL) {
+        start = 0;
+        step = 1;
+        slicelength = self->memo_len;
+    }
+#if PY_MAJOR_VERSION >= 3
+    else if (PySlice_GetIndicesEx(slice, self->memo_len,
+#else
+    else if (PySlice_GetIndicesEx((PySliceObject *)slice, self->memo_len,
+#endif
+                                  &start, &stop, &step, &slicelength) < 0) {
+        return NULL;
+    }
+
+    if (astuple) {
+        result = PyTuple_New(slicelength);
+    } else {
+        result = PyList_New(slicelength);
+    }
+    if (result == NULL)
+        return NULL;
+
+    for (i = 0; i < slicelength; i++, start += step) {
+        value = BaseRowProxy_memoized(self, start);
+        if (value == NULL) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        if (astuple) {
+            PyTuple_SET_ITEM(result, i, value);
+        } else {
+            PyList_SET_ITEM(result, i, value);
+        }
+    }
+    return result;
+}
+
 static int
 BaseRowProxy_init(BaseRowProxy *self, PyObject *args, PyObject *kwds)
 {
-    PyObject *parent, *row, *processors, *keymap;
+    PyObject *parent, *row, *processors, *keymap, *memoize = NULL;
+    int memoize_flag;
 
-    if (!PyArg_UnpackTuple(args, "BaseRowProxy", 4, 4,
-                           &parent, &row, &processors, &keymap))
+    if (!PyArg_UnpackTuple(args, "BaseRowProxy", 4, 5,
+                           &parent, &row, &processors, &keymap, &memoize))
         return -1;
 
     Py_INCREF(parent);
@@ -103,6 +232,15 @@ BaseRowProxy_init(BaseRowProxy *self, PyObject *args, PyObject *kwds)
     Py_INCREF(keymap);
     self->keymap = keymap;
 
+    if (memoize != NULL) {
+        memoize_flag = PyObject_IsTrue(memoize);
+        if (memoize_flag < 0)
+            return -1;
+        if (memoize_flag)
+            return BaseRowProxy_initmemo(self);
+    }
+    BaseRowProxy_clearmemo(self);
+
     return 0;
 }
 
@@ -153,6 +291,7 @@ BaseRowProxy_dealloc(BaseRowProxy *self)
     Py_XDECREF(self->row);
     Py_XDECREF(self->processors);
     Py_XDECREF(self->keymap);
+    BaseRowProxy_clearmemo(self);
 #if PY_MAJOR_VERSION >= 3
     Py_TYPE(self)->tp_free((PyObject *)self);
 #else
@@ -218,6 +357,8 @@ BaseRowProxy_processvalues(PyObject *values, PyObject *processors, int astuple)
 static PyListObject *
 BaseRowProxy_values(BaseRowProxy *self)
 {
+    if (self->memo != NULL)
+        return (PyListObject *)BaseRowProxy_memoizedvalues(self, NULL, 0);
     return (PyListObject *)BaseRowProxy_processvalues(self->row,
                                                       self->processors, 0);
 }
@@ -227,7 +368,10 @@ BaseRowProxy_iter(BaseRowProxy *self)
 {
     PyObject *values, *result;
 
-    values = BaseRowProxy_processvalues(self->row, self->processors, 1);
+    if (self->memo != NULL)
+        values = BaseRowProxy_memoizedvalues(self, NULL, 1);
+    else
+        values = BaseRowProxy_processvalues(self->row, self->processors, 1);
     if (values == NULL)
         return NULL;
 
@@ -272,6 +416,9 @@ BaseRowProxy_subscript(BaseRowProxy *self, PyObject *key)
             /* -1 can be either the actual value, or an error flag. */
             return NULL;
     } else if (PySlice_Check(key)) {
+        if (self->memo != NULL)
+            return BaseRowProxy_memoizedvalues(self, key, 1);
+
         values = PyObject_GetItem(self->row, key);
         if (values == NULL)
             return NULL;
@@ -355,6 +502,10 @@ BaseRowProxy_subscript(BaseRowProxy *self, PyObject *key)
             /* -1 can be either the actual value, or an error flag. */
             return NULL;
     }
+
+    if (self->memo != NULL)
+        return BaseRowProxy_memoized(self, index);
+
     processor = PyList_GetItem(self->processors, index);
     if (processor == NULL)
         return NULL;
@@ -510,6 +661,9 @@ BaseRowProxy_setrow(BaseRowProxy *self, PyObject *value, void *closure)
     Py_INCREF(value);
     self->row = value;
 
+    if (self->memo != NULL)
+        return BaseRowProxy_initmemo(self);
+
     return 0;
 }
 
@@ -539,6 +693,9 @@ BaseRowProxy_setprocessors(BaseRowProxy *self, PyObject *value, void *closure)
     Py_INCREF(value);
     self->processors = value;
 
+    if (self->memo != NULL)
+        return BaseRowProxy_initmemo(self);
+
     return 0;
 }
 
@@ -571,6 +728,34 @@ BaseRowProxy_setkeymap(BaseRowProxy *self, PyObject *value, void *closure)
     return 0;
 }
 
+static PyObject *
+BaseRowProxy_getmemo(BaseRowProxy *self, void *closure)
+{
+    return PyBool_FromLong(self->memo != NULL);
+}
+
+static int
+BaseRowProxy_setmemo(BaseRowProxy *self, PyObject *value, void *closure)
+{
+    int memoize;
+
+    if (value == NULL) {
+        PyErr_SetString(PyExc_TypeError,
+                        "Cannot delete the 'memo' attribute");
+        return -1;
+    }
+
+    memoize = PyObject_IsTrue(value);
+    if (memoize < 0)
+        return -1;
+
+    if (memoize)
+        return BaseRowProxy_initmemo(self);
+
+    BaseRowProxy_clearmemo(self);
+    return 0;
+}
+
 static PyGetSetDef BaseRowProxy_getseters[] = {
     {"_parent",
      (getter)BaseRowProxy_getparent, (setter)BaseRowProxy_setparent,
@@ -588,6 +773,10 @@ static PyGetSetDef BaseRowProxy_getseters[] = {
      (getter)BaseRowProxy_getkeymap, (setter)BaseRowProxy_setkeymap,
      "Key to (processor, index) dict",
      NULL},
+    {"_memo",
+     (getter)BaseRowProxy_getmemo, (setter)BaseRowProxy_setmemo,
+     "Whether processed values are memoized",
+     NULL},
     {NULL}
 };
 
@@ -175,9 +175,300 @@ distill_params(PyObject *self, PyObject *args)
 	}
 }
 
+/*
+    Given a sequence of (key, processor) pairs, where processor may be
+    None, and a sequence of compiled parameter dictionaries, return a
+    list of positional parameter sequences in which each value has been
+    passed through its processor.  Each sequence is a tuple if
+    sequence_format is tuple, otherwise the list of values is passed
+    to sequence_format.
+ */
+static PyObject *
+positional_bind_params(PyObject *self, PyObject *args)
+{
+	PyObject *plan, *compiled_parameters, *sequence_format;
+	PyObject *plan_seq, *params_seq, *result;
+	PyObject *entry, *params, *key, *processor, *value, *row, *converted;
+	Py_ssize_t num_params, num_rows, i, j;
+	int as_tuple;
+
+	if (!PyArg_UnpackTuple(args, "_positional_bind_params", 3, 3,
+				&plan, &compiled_parameters, &sequence_format)) {
+		return NULL;
+	}
+
+	plan_seq = PySequence_Fast(plan, "plan must be a sequence");
+	if (plan_seq == NULL) {
+		return NULL;
+	}
+	num_params = PySequence_Fast_GET_SIZE(plan_seq);
+	for (j = 0; j < num_params; j++) {
+		entry = PySequence_Fast_GET_ITEM(plan_seq, j);
+		if (!PyTuple_Check(entry) || PyTuple_GET_SIZE(entry) != 2) {
+			PyErr_SetString(PyExc_TypeError,
+					"plan entries must be (key, processor) tuples");
+			Py_DECREF(plan_seq);
+			return NULL;
+		}
+	}
+
+	params_seq = PySequence_Fast(compiled_parameters,
+					"compiled parameters must be a sequence");
+	if (params_seq == NULL) {
+		Py_DECREF(plan_seq);
+		return NULL;
+	}
+	num_rows = PySequence_Fast_GET_SIZE(params_seq);
+
+	result = PyList_New(num_rows);
+	if (result == NULL) {
+		goto fail;
+	}
+
+	as_tuple = (sequence_format == (PyObject *)&PyTuple_Type);
+
+	for (i = 0; i < num_rows; i++) {
+		params = PySequence_Fast_GET_ITEM(params_seq, i);
+		if (!PyDict_Check(params)) {
+			PyErr_SetString(PyExc_TypeError,
+					"compiled parameters must be dictionaries");
+			goto fail;
+		}
+
+		if (as_tuple) {
+			row = PyTuple_New(num_params);
+		}
+		else {
+			row = PyList_New(num_params);
+		}
+		if (row == NULL) {
+			goto fail;
+		}
+
+		for (j = 0; j < num_params; j++) {
+			entry = PySequence_Fast_GET_ITEM(plan_seq, j);
+			key = PyTuple_GET_ITEM(entry, 0);
+			processor = PyTuple_GET_ITEM(entry, 1);
+
+			/* borrowed reference */
+			value = PyDict_GetItem(params, key);
+			if (value == NULL) {
+				PyErr_SetObject(PyExc_KeyError, key);
+				Py_DECREF(row);
+				goto fail;
+			}
+
+			if (processor != Py_None) {
+				value = PyObject_CallFunctionObjArgs(processor, value, NULL);
+				if (value == NULL) {
+					Py_DECREF(row);
+					goto fail;
+				}
+			}
+			else {
+				Py_INCREF(value);
+			}
+
+			/* steals the reference to value */
+			if (as_tuple) {
+				PyTuple_SET_ITEM(row, j, value);
+			}
+			else {
+				PyList_SET_ITEM(row, j, value);
+			}
+		}
+
+		if (!as_tuple) {
+			converted = PyObject_CallFunctionObjArgs(sequence_format, row, NULL);
+			Py_DECREF(row);
+			if (converted == NULL) {
+				goto fail;
+			}
+			row = converted;
+		}
+
+		/* steals the reference to row */
+		PyList_SET_ITEM(result, i, row);
+	}
+
+	Py_DECREF(plan_seq);
+	Py_DECREF(params_seq);
+	return result;
+
+fail:
+	Py_XDECREF(result);
+	Py_DECREF(plan_seq);
+	Py_DECREF(params_seq);
+	return NULL;
+}
+
+/*
+    Given a sequence of (key, processor) pairs and a sequence of compiled
+    parameter dictionaries, return a list of copies of those dictionaries
+    in which the value of each key present has been passed through its
+    processor.
+ */
+static PyObject *
+keyed_bind_params(PyObject *self, PyObject *args)
+{
+	PyObject *processors, *compiled_parameters;
+	PyObject *processors_seq, *params_seq, *result;
+	PyObject *entry, *params, *key, *processor, *value, *row;
+	Py_ssize_t num_processors, num_rows, i, j;
+
+	if (!PyArg_UnpackTuple(args, "_keyed_bind_params", 2, 2,
+				&processors, &compiled_parameters)) {
+		return NULL;
+	}
+
+	processors_seq = PySequence_Fast(processors,
+					"processors must be a sequence");
+	if (processors_seq == NULL) {
+		return NULL;
+	}
+	num_processors = PySequence_Fast_GET_SIZE(processors_seq);
+	for (j = 0; j < num_processors; j++) {
+		entry = PySequence_Fast_GET_ITEM(processors_seq, j);
+		if (!PyTuple_Check(entry) || PyTuple_GET_SIZE(entry) != 2) {
+			PyErr_SetString(PyExc_TypeError,
+					"processors must be (key, processor) tuples");
+			Py_DECREF(processors_seq);
+			return NULL;
+		}
+	}
+
+	params_seq = PySequence_Fast(compiled_parameters,
+					"compiled parameters must be a sequence");
+	if (params_seq == NULL) {
+		Py_DECREF(processors_seq);
+		return NULL;
+	}
+	num_rows = PySequence_Fast_GET_SIZE(params_seq);
+
+	result = PyList_New(num_rows);
+	if (result == NULL) {
+		goto fail;
+	}
+
+	for (i = 0; i < num_rows; i++) {
+		params = PySequence_Fast_GET_ITEM(params_seq, i);
+		if (!PyDict_Check(params)) {
+			PyErr_SetString(PyExc_TypeError,
+					"compiled parameters must be dictionaries");
+			goto fail;
+		}
+
+		row = PyDict_Copy(params);
+		if (row == NULL) {
+			goto fail;
+		}
+
+		for (j = 0; j < num_processors; j++) {
+			entry = PySequence_Fast_GET_ITEM(processors_seq, j);
+			key = PyTuple_GET_ITEM(entry, 0);
+			processor = PyTuple_GET_ITEM(entry, 1);
+
+			/* borrowed reference */
+			value = PyDict_GetItem(row, key);
+			if (value == NULL) {
+				continue;
+			}
+
+			value = PyObject_CallFunctionObjArgs(processor, value, NULL);
+			if (value == NULL) {
+				Py_DECREF(row);
+				goto fail;
+			}
+			if (PyDict_SetItem(row, key, value) == -1) {
+				Py_DECREF(value);
+				Py_DECREF(row);
+				goto fail;
+			}
+			Py_DECREF(value);
+		}
+
+		/* steals the reference to row */
+		PyList_SET_ITEM(result, i, row);
+	}
+
+	Py_DECREF(processors_seq);
+	Py_DECREF(params_seq);
+	return result;
+
+fail:
+	Py_XDECREF(result);
+	Py_DECREF(processors_seq);
+	Py_DECREF(params_seq);
+	return NULL;
+}
+
+/*
+    Given a dictionary, a result row and a sequence of (key, column)
+    pairs, set each key in the dictionary to the value of its column
+    in the row.
+ */
+static PyObject *
+populate_columns(PyObject *self, PyObject *args)
+{
+	PyObject *dict, *row, *plan;
+	PyObject *plan_seq, *entry, *key, *column, *value;
+	Py_ssize_t num_columns, i;
+	int is_dict, status;
+
+	if (!PyArg_UnpackTuple(args, "_populate_columns", 3, 3,
+				&dict, &row, &plan)) {
+		return NULL;
+	}
+
+	plan_seq = PySequence_Fast(plan, "plan must be a sequence");
+	if (plan_seq == NULL) {
+		return NULL;
+	}
+	num_columns = PySequence_Fast_GET_SIZE(plan_seq);
+	is_dict = PyDict_Check(dict);
+
+	for (i = 0; i < num_columns; i++) {
+		entry = PySequence_Fast_GET_ITEM(plan_seq, i);
+		if (!PyTuple_Check(entry) || PyTuple_GET_SIZE(entry) != 2) {
+			PyErr_SetString(PyExc_TypeError,
+					"plan entries must be (key, column) tuples");
+			Py_DECREF(plan_seq);
+			return NULL;
+		}
+		key = PyTuple_GET_ITEM(entry, 0);
+		column = PyTuple_GET_ITEM(entry, 1);
+
+		value = PyObject_GetItem(row, column);
+		if (value == NULL) {
+			Py_DECREF(plan_seq);
+			return NULL;
+		}
+		if (is_dict) {
+			status = PyDict_SetItem(dict, key, value);
+		}
+		else {
+			status = PyObject_SetItem(dict, key, value);
+		}
+		Py_DECREF(value);
+		if (status == -1) {
+			Py_DECREF(plan_seq);
+			return NULL;
+		}
+	}
+
+	Py_DECREF(plan_seq);
+	Py_RETURN_NONE;
+}
+
 static PyMethodDef module_methods[] = {
     {"_distill_params", distill_params, METH_VARARGS,
      "Distill an execute() parameter structure."},
+    {"_positional_bind_params", positional_bind_params, METH_VARARGS,
+     "Process compiled parameters into positional DBAPI parameters."},
+    {"_keyed_bind_params", keyed_bind_params, METH_VARARGS,
+     "Process compiled parameters into keyed DBAPI parameters."},
+    {"_populate_columns", populate_columns, METH_VARARGS,
+     "Populate a dictionary with column values from a result row."},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
@@ -5,7 +5,7 @@ Currently includes MySQL and Drizzle.
 """
 
 from . import Connector
-from ..engine import base as engine_base, default
+from ..engine import base as engine_base, default, result as _result
 from ..sql import operators as sql_operators
 from .. import exc, log, schema, sql, types as sqltypes, util, processors
 import re
@@ -24,6 +24,22 @@ class MySQLDBExecutionContext(Connector):
         else:
             return self.cursor.rowcount
 
+    def create_cursor(self):
+        # a server side cursor still being read blocks all other
+        # use of the connection; read in its remaining rows first.
+        _result.ExclusiveBufferedRowResultProxy.release_stream(
+                                        self._dbapi_connection)
+        return super(MySQLDBExecutionContext, self).create_cursor()
+
+    def create_server_side_cursor(self):
+        return self._dbapi_connection.cursor(self.dialect._sscursor)
+
+    def get_result_proxy(self):
+        if self._is_server_side:
+            return _result.ExclusiveBufferedRowResultProxy(self)
+        else:
+            return super(MySQLDBExecutionContext, self).get_result_proxy()
+
 
 class MySQLDBCompiler(Connector):
     def visit_mod_binary(self, binary, operator, **kw):
@@ -51,11 +67,37 @@ class MySQLDBConnector(Connector):
 
     default_paramstyle = 'format'
 
+    def __init__(self, server_side_cursors=False, **kwargs):
+        super(MySQLDBConnector, self).__init__(**kwargs)
+        self.server_side_cursors = server_side_cursors
+        self._sscursor = self._sscursor_cls()
+        self.supports_server_side_cursors = self._sscursor is not None
+
     @classmethod
     def dbapi(cls):
         # is overridden when pymysql is used
         return __import__('MySQLdb')
 
+    def _sscursor_cls(self):
+        if self.dbapi is None:
+            return None
+        try:
+            return __import__(
+                        self.dbapi.__name__ + '.cursors'
+                        ).cursors.SSCursor
+        except (AttributeError, ImportError):
+            return None
+
+    def do_commit(self, dbapi_connection):
+        _result.ExclusiveBufferedRowResultProxy.release_stream(
+                                        dbapi_connection)
+        super(MySQLDBConnector, self).do_commit(dbapi_connection)
+
+    def do_rollback(self, dbapi_connection):
+        _result.ExclusiveBufferedRowResultProxy.release_stream(
+                                        dbapi_connection)
+        super(MySQLDBConnector, self).do_rollback(dbapi_connection)
+
     def do_executemany(self, cursor, statement, parameters, context=None):
         rowcount = cursor.executemany(statement, parameters)
         if context is not None:
@@ -39,6 +39,26 @@ return encoded strings::
     # set client encoding to utf8; all strings come back as utf8 str
     create_engine('mysql+mysqldb:///mydb?charset=utf8&use_unicode=0')
 
+Server Side Cursors
+-------------------
+
+The ``stream_results=True`` execution option, as well as the
+:meth:`.Query.yield_per` method, makes use of the MySQL-python
+``SSCursor`` cursor class, which reads rows from the server as they are
+fetched rather than buffering the full result in memory first.  The
+``server_side_cursors=True`` argument to :func:`.create_engine` enables
+this for all SELECT statements.  The pymysql dialect supports the same
+behavior using pymysql's own ``SSCursor``.
+
+MySQL doesn't allow any other statement to be emitted on a connection
+while the rows of such a cursor remain unread.  If another statement
+is executed on the same connection, or the transaction is committed or
+rolled back, before all rows have been fetched, the remaining rows are
+first read into the result's buffer, after which the result continues
+to return rows normally.
+
+.. versionadded:: 0.9.0
+
 Known Issues
 -------------
 
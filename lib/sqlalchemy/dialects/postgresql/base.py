@@ -1337,6 +1337,7 @@ class PGDialect(default.DefaultDialect):
     supports_default_values = True
     supports_empty_insert = False
     supports_multivalues_insert = True
+    supports_multivalues_insert_returning = True
     default_paramstyle = 'pyformat'
     ischema_names = ischema_names
     colspecs = colspecs
@@ -601,6 +601,7 @@ class SQLiteDialect(default.DefaultDialect):
     supports_cast = True
     supports_multivalues_insert = True
     supports_right_nested_joins = False
+    max_bind_parameters = 999
 
     default_paramstyle = 'qmark'
     execution_ctx_cls = SQLiteExecutionContext
@@ -635,6 +636,9 @@ class SQLiteDialect(default.DefaultDialect):
             self.supports_multivalues_insert = \
                                 self.dbapi.sqlite_version_info >= (3, 7, 11)
                                 #  http://www.sqlite.org/releaselog/3_7_11.html
+            if self.dbapi.sqlite_version_info >= (3, 32, 0):
+                # http://www.sqlite.org/releaselog/3_32_0.html
+                self.max_bind_parameters = 32766
 
             # see http://www.sqlalchemy.org/trac/ticket/2568
             # as well as http://www.sqlite.org/src/info/600482d161
@@ -193,6 +193,13 @@ require unicode, however, so that non-``unicode`` values passed inadvertently
 will emit a warning.  Pysqlite will emit an error if a non-``unicode`` string
 is passed containing non-ASCII characters.
 
+Streaming Results
+-----------------
+
+Pysqlite cursors don't buffer results; each row is produced by SQLite as
+it's fetched.  The ``stream_results`` execution option therefore has no
+additional effect with this dialect, as results are always streamed.
+
 .. _pysqlite_serializable:
 
 Serializable Transaction Isolation
@@ -138,6 +138,16 @@ def create_engine(*args, **kwargs):
            By default, result row names match case-sensitively.
            In version 0.7 and prior, all matches were case-insensitive.
 
+    :param compiled_cache_size=500: the number of compiled SQL
+        statements kept in the :attr:`.Engine.compiled_cache`, which is
+        used by default for the ``compiled_cache`` execution option, so
+        that executing a statement which is structurally equivalent to a
+        previous one doesn't compile it again.  The least recently used
+        statements are discarded once the size is exceeded.  Set to 0
+        to disable the cache.
+
+        .. versionadded:: 0.9.0
+
     :param connect_args: a dictionary of options which will be
         passed directly to the DBAPI's ``connect()`` method as
         additional keyword arguments.  See the example
@@ -237,6 +247,17 @@ def create_engine(*args, **kwargs):
         Microsoft SQL Server.   Set this to ``False`` to disable
         the automatic usage of RETURNING.
 
+    :param multivalues_insert_returning=False: When ``True``, the ORM
+        will INSERT a series of pending objects which require newly
+        generated primary key values using a single INSERT statement
+        with multiple VALUES clauses and a RETURNING clause, rather than
+        one INSERT per object, on those backends where the rows of
+        RETURNING are delivered in the order of the VALUES clauses;
+        currently Postgresql.  Has no effect elsewhere, or if
+        ``implicit_returning`` is disabled.
+
+        .. versionadded:: 0.9.0
+
     :param label_length=None: optional integer value which limits
         the size of dynamically generated column labels to that many
         characters. If less than 6, labels are generated as
@@ -293,6 +314,35 @@ def create_engine(*args, **kwargs):
         of 0 indicates no limit; to disable pooling, set ``poolclass`` to
         :class:`~sqlalchemy.pool.NullPool` instead.
 
+    :param pool_min_idle=0: the number of idle connections which a
+        :class:`~sqlalchemy.pool.QueuePool` attempts to keep open, up to
+        ``pool_size``.  A background thread opens connections to replace
+        those checked out, and reconnects idle connections before they
+        reach the ``pool_recycle`` time.  See the ``min_idle`` argument
+        of :class:`~sqlalchemy.pool.QueuePool`.
+
+        .. versionadded:: 0.9.0
+
+    :param pool_prewarm=False: if True along with ``pool_min_idle``,
+        ``pool_min_idle`` connections are opened when the engine is
+        created, rather than by the background thread.
+
+        .. versionadded:: 0.9.0
+
+    :param pool_pre_ping=False: if True, test that each connection is
+        alive upon checkout, replacing it if not; a detected disconnect
+        then replaces only those connections opened before it, rather
+        than the whole pool.  See the ``pre_ping`` argument to
+        :class:`.Pool`.
+
+        .. versionadded:: 0.9.0
+
+    :param pool_pre_ping_idle=0: with ``pool_pre_ping``, only test
+        connections which have been idle in the pool for at least
+        this many seconds.
+
+        .. versionadded:: 0.9.0
+
     :param pool_recycle=-1: this setting causes the pool to recycle
         connections after the given number of seconds has passed. It
         defaults to -1, or no timeout. For example, setting to 3600
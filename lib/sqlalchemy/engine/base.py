@@ -151,9 +151,12 @@ class Connection(Connectable):
         :param compiled_cache: Available on: Connection.
           A dictionary where :class:`.Compiled` objects
           will be cached when the :class:`.Connection` compiles a clause
-          expression into a :class:`.Compiled` object.
-          It is the user's responsibility to
-          manage the size of this dictionary, which will have keys
+          expression into a :class:`.Compiled` object.  By default, this
+          is the :attr:`.Engine.compiled_cache` of the :class:`.Engine`,
+          whose size is set using the ``compiled_cache_size`` argument
+          to :func:`.create_engine`; ``None`` disables caching.
+          When a dictionary is given, it is the user's responsibility to
+          manage its size; it will have keys
           corresponding to the dialect, clause element, the column
           names within the VALUES or SET clause of an INSERT or UPDATE,
           as well as the "batch" mode for an INSERT or UPDATE statement.
@@ -181,6 +184,33 @@ class Connection(Connectable):
           is returned to the connection pool, i.e.
           the :meth:`.Connection.close` method is called.
 
+        :param memoize_row_values: Available on: Connection, statement.
+          When ``True``, rows returned by the result run the type-level
+          result processor for each column at most once, upon first
+          access, retaining the processed value within the row.  This
+          benefits code which accesses the same columns of a row
+          repeatedly, where processing is expensive, such as conversion
+          to ``Decimal``.  Note that values which are mutable, such as
+          those of :class:`.PickleType`, are then shared between accesses.
+
+          .. versionadded:: 0.9.0
+
+        :param multivalues_chunk_size: Available on: Connection, statement.
+          The number of rows per statement when executing an
+          :func:`.insert` construct given multiple rows via
+          :meth:`.Insert.values`.  The rows are split into chunks of this
+          size; the chunk-shaped statement is compiled once and invoked
+          for all full chunks using ``cursor.executemany()``, followed by
+          one statement for any remaining rows.  Chunking also takes place
+          automatically, without this option, when the rows would exceed
+          the dialect's limit on the number of bound parameters in one
+          statement, such as 999 on older SQLite versions and 2100 on
+          SQL Server; the limit also caps a size given here.  The chunks
+          are run within a transaction, which is begun if one isn't
+          already in progress.
+
+          .. versionadded:: 0.9.0
+
         :param no_parameters: When ``True``, if the final parameter
           list or dictionary is totally empty, will invoke the
           statement on the cursor as ``cursor.execute(statement)``,
@@ -198,8 +228,10 @@ class Connection(Connectable):
         :param stream_results: Available on: Connection, statement.
           Indicate to the dialect that results should be
           "streamed" and not pre-buffered, if possible.  This is a limitation
-          of many DBAPIs.  The flag is currently understood only by the
-          psycopg2 dialect.
+          of many DBAPIs.  The flag applies to SELECT statements on dialects
+          which support "server side" cursors, currently the psycopg2,
+          MySQL-python and pymysql dialects; pysqlite always streams
+          results.
 
         """
         c = self._clone()
@@ -732,6 +764,16 @@ class Connection(Connectable):
                     fn(self, elem, multiparams, params)
 
         distilled_params = _distill_params(multiparams, params)
+        if not distilled_params and \
+                getattr(elem, '_has_multi_parameters', False):
+            chunk_size = self._multivalues_chunk_size(elem)
+            if chunk_size is not None:
+                ret = self._execute_multivalues_insert(elem, chunk_size)
+                if self._has_events:
+                    self.dispatch.after_execute(self,
+                        elem, multiparams, params, ret)
+                return ret
+
         if distilled_params:
             # note this is usually dict but we support RowProxy
             # as well; but dict.keys() as an iterator is OK
@@ -740,32 +782,175 @@ class Connection(Connectable):
             keys = []
 
         dialect = self.dialect
+        extracted_params = compiled_sql = key = None
         if 'compiled_cache' in self._execution_options:
-            key = dialect, elem, tuple(keys), len(distilled_params) > 1
-            if key in self._execution_options['compiled_cache']:
-                compiled_sql = self._execution_options['compiled_cache'][key]
-            else:
-                compiled_sql = elem.compile(
-                                dialect=dialect, column_keys=keys,
-                                inline=len(distilled_params) > 1)
-                self._execution_options['compiled_cache'][key] = compiled_sql
+            compiled_cache = self._execution_options['compiled_cache']
+            explicit_cache = True
         else:
+            compiled_cache = self.engine.compiled_cache
+            explicit_cache = False
+
+        if compiled_cache is not None:
+            if dialect._supports_structural_cache_key:
+                elem_cache_key = elem._generate_cache_key()
+                if elem_cache_key is not None:
+                    cache_key, extracted_params = elem_cache_key
+                    key = dialect, cache_key, tuple(keys), \
+                                len(distilled_params) > 1
+                    try:
+                        compiled_sql = compiled_cache[key]
+                    except KeyError:
+                        pass
+                    except TypeError:
+                        # structural key contains an unhashable element
+                        key = extracted_params = None
+
+            if key is None and explicit_cache:
+                # a cache given via execution_options() may also be
+                # keyed on the statement object itself.  The engine-wide
+                # cache isn't, as such an entry only matches the
+                # identical object, which it would keep alive while
+                # pushing out entries that are reusable.
+                key = dialect, elem, tuple(keys), len(distilled_params) > 1
+                compiled_sql = compiled_cache.get(key)
+
+        if compiled_sql is None:
             compiled_sql = elem.compile(
                             dialect=dialect, column_keys=keys,
                             inline=len(distilled_params) > 1)
+            if key is not None:
+                if extracted_params is not None:
+                    compiled_sql._cache_key_bind_positions = dict(
+                        (bindparam._identifying_key, idx)
+                        for idx, bindparam in enumerate(extracted_params)
+                    )
+                compiled_cache[key] = compiled_sql
+
+        if compiled_sql.statement is elem:
+            extracted_params = None
 
         ret = self._execute_context(
             dialect,
             dialect.execution_ctx_cls._init_compiled,
             compiled_sql,
             distilled_params,
-            compiled_sql, distilled_params
+            compiled_sql, distilled_params, elem, extracted_params
         )
         if self._has_events:
             self.dispatch.after_execute(self,
                 elem, multiparams, params, ret)
         return ret
 
+    def _multivalues_chunk_size(self, elem):
+        """Return the number of rows per statement to use when executing
+        a multiple-VALUES INSERT, or ``None`` if it should be executed
+        as a single statement."""
+
+        keys = elem._multivalues_chunk_keys()
+        if not keys:
+            return None
+
+        size = elem._execution_options.get('multivalues_chunk_size',
+                    self._execution_options.get('multivalues_chunk_size'))
+
+        limit = self.dialect.max_bind_parameters
+        if limit is not None:
+            # columns not present in the VALUES clause may each
+            # render one bound parameter for a default, shared by all rows
+            extra = len(elem.table.c) - len(keys)
+            max_rows = max((limit - extra) // len(keys), 1)
+            if size is None or size > max_rows:
+                size = max_rows
+
+        if size is None or size >= len(elem.parameters):
+            return None
+        return size
+
+    def _execute_multivalues_insert(self, elem, chunk_size):
+        """Execute a multiple-VALUES INSERT as a series of statements of
+        ``chunk_size`` rows each.
+
+        All full chunks share one compiled statement and are sent
+        in one ``cursor.executemany()`` call; the remaining rows, if any,
+        are sent as a second statement.  The :class:`.ResultProxy` of the
+        last statement is returned, with a ``rowcount`` totalling all
+        statements.
+
+        """
+
+        rows = elem.parameters
+        full = len(rows) - len(rows) % chunk_size
+
+        # the individual results mustn't close a connection
+        # that's to be closed along with the final result
+        close_with_result = self.should_close_with_result
+        self.should_close_with_result = False
+
+        if self.in_transaction():
+            trans = None
+        else:
+            trans = self.begin()
+        try:
+            rowcount = 0
+            if full:
+                ret = self._execute_multivalues_chunks(
+                                elem, rows[0:full], chunk_size)
+                rowcount += ret.rowcount
+            if full < len(rows):
+                ret = self._execute_multivalues_chunks(
+                                elem, rows[full:], len(rows) - full)
+                rowcount += ret.rowcount
+            if trans is not None:
+                trans.commit()
+        except:
+            with util.safe_reraise():
+                if trans is not None:
+                    trans.rollback()
+                if close_with_result:
+                    self.close()
+        finally:
+            self.should_close_with_result = close_with_result
+
+        # ResultProxy.rowcount is memoized
+        ret.rowcount = rowcount
+        if ret.closed and close_with_result:
+            self.close()
+        return ret
+
+    def _execute_multivalues_chunks(self, elem, rows, chunk_size):
+        """Execute the given rows of a multiple-VALUES INSERT as
+        statements of ``chunk_size`` rows each, in one call."""
+
+        dialect = self.dialect
+        chunk = elem._multivalues_chunk(rows[0:chunk_size])
+
+        compiled_sql = key = None
+        compiled_cache = self._execution_options.get('compiled_cache',
+                                            self.engine.compiled_cache)
+        if compiled_cache is not None:
+            key = chunk._multivalues_chunk_cache_key()
+            if key is not None:
+                key = (dialect, ) + key
+                compiled_sql = compiled_cache.get(key)
+
+        if compiled_sql is None:
+            compiled_sql = chunk.compile(dialect=dialect, inline=True)
+            if key is not None:
+                compiled_cache[key] = compiled_sql
+
+        params = [
+            chunk._multivalues_chunk_params(rows[idx:idx + chunk_size])
+            for idx in range(0, len(rows), chunk_size)
+        ]
+
+        return self._execute_context(
+            dialect,
+            dialect.execution_ctx_cls._init_compiled,
+            compiled_sql,
+            params,
+            compiled_sql, params, chunk
+        )
+
     def _execute_compiled(self, compiled, multiparams, params):
         """Execute a sql.Compiled object."""
 
@@ -1026,10 +1211,16 @@ class Connection(Connectable):
             if self._is_disconnect:
                 del self._is_disconnect
                 dbapi_conn_wrapper = self.connection
+                connection_record = getattr(dbapi_conn_wrapper,
+                                        '_connection_record', None)
                 self.invalidate(e)
                 if not hasattr(dbapi_conn_wrapper, '_pool') or \
                         dbapi_conn_wrapper._pool is self.engine.pool:
-                    self.engine.dispose()
+                    if self.engine.pool._pre_ping and \
+                            connection_record is not None:
+                        self.engine.pool._invalidate(connection_record)
+                    else:
+                        self.engine.dispose()
             if self.should_close_with_result:
                 self.close()
 
@@ -1300,9 +1491,22 @@ class Engine(Connectable, log.Identified):
     _has_events = False
     _connection_cls = Connection
 
+    compiled_cache = None
+    """The :class:`.util.LRUCache` of :class:`.Compiled` objects used by
+    default for connections of this :class:`.Engine`, or None if
+    ``compiled_cache_size`` was zero.
+
+    The cache's ``hits``, ``misses`` and ``evictions`` attributes
+    count lookups and removals of compiled statements.
+
+    .. versionadded:: 0.9.0
+
+    """
+
     def __init__(self, pool, dialect, url,
                         logging_name=None, echo=None, proxy=None,
-                        execution_options=None
+                        execution_options=None,
+                        compiled_cache_size=500
                         ):
         self.pool = pool
         self.url = url
@@ -1315,6 +1519,8 @@ class Engine(Connectable, log.Identified):
         log.instance_logger(self, echoflag=echo)
         if proxy:
             interfaces.ConnectionProxy._adapt_listener(self, proxy)
+        if compiled_cache_size:
+            self.compiled_cache = util.LRUCache(compiled_cache_size)
         if execution_options:
             self.update_execution_options(**execution_options)
 
@@ -1431,7 +1637,9 @@ class Engine(Connectable, log.Identified):
         A new connection pool is created immediately after the old one has
         been disposed.   This new pool, like all SQLAlchemy connection pools,
         does not make any actual connections to the database until one is
-        first requested.
+        first requested, unless the pool is configured to keep idle
+        connections open, in which case these are opened in the
+        background.
 
         This method has two general use cases:
 
@@ -1698,6 +1906,7 @@ class OptionEngine(Engine):
         self.echo = proxied.echo
         log.instance_logger(self, echoflag=self.echo)
         self.dispatch = self.dispatch._join(proxied.dispatch)
+        self.compiled_cache = proxied.compiled_cache
         self._execution_options = proxied._execution_options
         self.update_execution_options(**execution_options)
 
@@ -18,6 +18,7 @@ from . import reflection, interfaces, result
 from ..sql import compiler, expression
 from .. import types as sqltypes
 from .. import exc, util, pool, processors
+from .util import _positional_bind_params, _keyed_bind_params
 import codecs
 import weakref
 from .. import event
@@ -26,6 +27,12 @@ AUTOCOMMIT_REGEXP = re.compile(
             r'\s*(?:UPDATE|INSERT|CREATE|DELETE|DROP|ALTER)',
             re.I | re.UNICODE)
 
+# When we're handed literal SQL, ensure it's a SELECT-query
+# before using a server side cursor.
+SERVER_SIDE_CURSOR_RE = re.compile(
+            r'\s*SELECT',
+            re.I | re.UNICODE)
+
 
 class DefaultDialect(interfaces.Dialect):
     """Default implementation of Dialect"""
@@ -95,6 +102,12 @@ class DefaultDialect(interfaces.Dialect):
     supports_default_values = False
     supports_empty_insert = True
     supports_multivalues_insert = False
+    supports_multivalues_insert_returning = False
+    multivalues_insert_returning = False
+    max_bind_parameters = None
+
+    supports_server_side_cursors = False
+    server_side_cursors = False
 
     server_version_info = None
 
@@ -110,6 +123,7 @@ class DefaultDialect(interfaces.Dialect):
     def __init__(self, convert_unicode=False,
                  encoding='utf-8', paramstyle=None, dbapi=None,
                  implicit_returning=None,
+                 multivalues_insert_returning=None,
                  supports_right_nested_joins=None,
                  case_sensitive=True,
                  label_length=None, **kwargs):
@@ -132,6 +146,8 @@ class DefaultDialect(interfaces.Dialect):
             self.paramstyle = self.default_paramstyle
         if implicit_returning is not None:
             self.implicit_returning = implicit_returning
+        if multivalues_insert_returning is not None:
+            self.multivalues_insert_returning = multivalues_insert_returning
         self.positional = self.paramstyle in ('qmark', 'format', 'numeric')
         self.identifier_preparer = self.preparer(self)
         self.type_compiler = self.type_compiler(self)
@@ -164,6 +180,17 @@ class DefaultDialect(interfaces.Dialect):
     def _type_memos(self):
         return weakref.WeakKeyDictionary()
 
+    @util.memoized_property
+    def _supports_structural_cache_key(self):
+        """True if a compiled statement may be shared among structurally
+        equivalent statements within a ``compiled_cache``.
+
+        Compilers which render bound values inline (i.e. those with
+        ``ansi_bind_rules``) produce SQL that's specific to those values.
+
+        """
+        return not self.statement_compiler.ansi_bind_rules
+
     @property
     def dialect_description(self):
         return self.name + "+" + self.driver
@@ -348,6 +375,27 @@ class DefaultDialect(interfaces.Dialect):
     def do_close(self, dbapi_connection):
         dbapi_connection.close()
 
+    @util.memoized_property
+    def _dialect_specific_select_one(self):
+        return str(expression.select([1]).compile(dialect=self))
+
+    def do_ping(self, dbapi_connection):
+        cursor = None
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute(self._dialect_specific_select_one)
+        except self.dbapi.Error as err:
+            if self.is_disconnect(err, dbapi_connection, cursor):
+                return False
+            raise
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except self.dbapi.Error:
+                    pass
+        return True
+
     def create_xid(self):
         """Create a random two-phase transaction ID.
 
@@ -394,10 +442,12 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     result_map = None
     compiled = None
     statement = None
+    invoked_statement = None
     postfetch_cols = None
     prefetch_cols = None
     _is_implicit_returning = False
     _is_explicit_returning = False
+    _is_server_side = False
 
     # a hook for SQLite's translation of
     # result column names
@@ -439,7 +489,8 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     @classmethod
     def _init_compiled(cls, dialect, connection, dbapi_connection,
-                    compiled, parameters):
+                    compiled, parameters, invoked_statement=None,
+                    extracted_parameters=None):
         """Initialize execution context for a Compiled construct."""
 
         self = cls.__new__(cls)
@@ -449,6 +500,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         self.engine = connection.engine
 
         self.compiled = compiled
+        self.invoked_statement = invoked_statement
 
         if not compiled.can_execute:
             raise exc.ArgumentError("Not an executable clause")
@@ -480,10 +532,12 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                                             not compiled.statement._returning)
 
         if not parameters:
-            self.compiled_parameters = [compiled.construct_params()]
+            self.compiled_parameters = [compiled.construct_params(
+                            extracted_parameters=extracted_parameters)]
         else:
             self.compiled_parameters = \
-                        [compiled.construct_params(m, _group_number=grp) for
+                        [compiled.construct_params(m, _group_number=grp,
+                            extracted_parameters=extracted_parameters) for
                                         grp, m in enumerate(parameters)]
 
             self.executemany = len(parameters) > 1
@@ -494,40 +548,31 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             self.prefetch_cols = self.compiled.prefetch
             self.__process_defaults()
 
-        processors = compiled._bind_processors
-
         # Convert the dictionary of bind parameter values
         # into a dict or list to be sent to the DBAPI's
         # execute() or executemany() method.
-        parameters = []
         if dialect.positional:
+            parameters = _positional_bind_params(
+                                compiled._positional_processors,
+                                self.compiled_parameters,
+                                dialect.execute_sequence_format)
+        elif not dialect.supports_unicode_statements:
+            processors = compiled._bind_processors
+            parameters = []
             for compiled_params in self.compiled_parameters:
-                param = []
-                for key in self.compiled.positiontup:
+                param = {}
+                for key in compiled_params:
                     if key in processors:
-                        param.append(processors[key](compiled_params[key]))
+                        param[dialect._encoder(key)[0]] = \
+                                    processors[key](compiled_params[key])
                     else:
-                        param.append(compiled_params[key])
-                parameters.append(dialect.execute_sequence_format(param))
-        else:
-            encode = not dialect.supports_unicode_statements
-            for compiled_params in self.compiled_parameters:
-                param = {}
-                if encode:
-                    for key in compiled_params:
-                        if key in processors:
-                            param[dialect._encoder(key)[0]] = \
-                                        processors[key](compiled_params[key])
-                        else:
-                            param[dialect._encoder(key)[0]] = \
-                                    compiled_params[key]
-                else:
-                    for key in compiled_params:
-                        if key in processors:
-                            param[key] = processors[key](compiled_params[key])
-                        else:
-                            param[key] = compiled_params[key]
+                        param[dialect._encoder(key)[0]] = \
+                                compiled_params[key]
                 parameters.append(param)
+        else:
+            parameters = _keyed_bind_params(
+                                compiled._keyed_processors,
+                                self.compiled_parameters)
         self.parameters = dialect.execute_sequence_format(parameters)
 
         return self
@@ -650,8 +695,34 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     def should_autocommit_text(self, statement):
         return AUTOCOMMIT_REGEXP.match(statement)
 
+    def _use_server_side_cursor(self):
+        if not self.dialect.supports_server_side_cursors:
+            return False
+
+        if not self.execution_options.get('stream_results',
+                                    self.dialect.server_side_cursors):
+            return False
+
+        # only statements returning rows are streamed
+        if self.compiled is not None and \
+                not isinstance(self.compiled.statement,
+                                expression.TextClause):
+            return isinstance(self.compiled.statement,
+                                expression.Selectable)
+        else:
+            return bool(self.statement and
+                            SERVER_SIDE_CURSOR_RE.match(self.statement))
+
     def create_cursor(self):
-        return self._dbapi_connection.cursor()
+        if self._use_server_side_cursor():
+            self._is_server_side = True
+            return self.create_server_side_cursor()
+        else:
+            self._is_server_side = False
+            return self._dbapi_connection.cursor()
+
+    def create_server_side_cursor(self):
+        raise NotImplementedError()
 
     def pre_exec(self):
         pass
@@ -701,7 +772,10 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         pass
 
     def get_result_proxy(self):
-        return result.ResultProxy(self)
+        if self._is_server_side:
+            return result.BufferedRowResultProxy(self)
+        else:
+            return result.ResultProxy(self)
 
     @property
     def rowcount(self):
@@ -108,6 +108,37 @@ class Dialect(object):
       the "implicit" functionality is not used and inserted_primary_key
       will not be available.
 
+    supports_multivalues_insert_returning
+      True if an INSERT with multiple VALUES clauses and a RETURNING
+      clause returns its rows in the same order as the VALUES clauses.
+      The ORM uses this to INSERT many rows requiring newly generated
+      primary keys in one statement, if ``multivalues_insert_returning``
+      is also enabled.
+
+    multivalues_insert_returning
+      True if the ORM should INSERT rows requiring newly generated
+      primary keys using a multiple VALUES INSERT with RETURNING, on
+      dialects which set ``supports_multivalues_insert_returning``.
+      Established by the ``multivalues_insert_returning`` argument
+      to :func:`.create_engine`.
+
+    max_bind_parameters
+      The maximum number of bound parameters the database accepts in
+      a single statement, or ``None`` if there's no practical limit.
+      A multiple-VALUES INSERT which would exceed this limit is
+      executed as a series of smaller statements.
+
+    supports_server_side_cursors
+      True if the dialect can return rows using a "server side" cursor,
+      which reads rows from the database as they are fetched rather than
+      buffering the full result in the client; this is used for SELECT
+      statements when the ``stream_results`` execution option is set.
+
+    server_side_cursors
+      True if server side cursors should be used for all SELECT
+      statements by default, on dialects which set
+      ``supports_server_side_cursors``.
+
     dbapi_type_map
       A mapping of DB-API type objects present in this Dialect's
       DB-API implementation mapped to TypeEngine implementations used
@@ -485,6 +516,20 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def do_ping(self, dbapi_connection):
+        """Test that a DBAPI connection is still alive.
+
+        This hook is called by the :class:`.Pool` upon checkout when
+        ``pre_ping`` is enabled.  Returns False if the connection has
+        been disconnected, as determined by :meth:`.is_disconnect`;
+        other errors are raised.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        raise NotImplementedError()
+
     def create_xid(self):
         """Create a two-phase transaction ID.
 
@@ -713,6 +758,17 @@ class ExecutionContext(object):
 
         raise NotImplementedError()
 
+    def create_server_side_cursor(self):
+        """Return a new "server side" cursor generated from this
+        ExecutionContext's connection.
+
+        Called by :meth:`create_cursor` in place of
+        ``connection.cursor()`` when the statement's results are to be
+        streamed, for dialects which set ``supports_server_side_cursors``.
+        """
+
+        raise NotImplementedError()
+
     def pre_exec(self):
         """Called before an execution of a compiled statement.
 
@@ -12,6 +12,7 @@ and :class:`.RowProxy."""
 from .. import exc, util
 from ..sql import expression, sqltypes
 import collections
+import weakref
 
 # This reconstructor is necessary so that pickles with the C extension or
 # without use the same Binary format.
@@ -35,16 +36,22 @@ except ImportError:
 try:
     from sqlalchemy.cresultproxy import BaseRowProxy
 except ImportError:
+    _unprocessed = util.symbol('UNPROCESSED')
+
     class BaseRowProxy(object):
-        __slots__ = ('_parent', '_row', '_processors', '_keymap')
+        __slots__ = ('_parent', '_row', '_processors', '_keymap', '_memo')
 
-        def __init__(self, parent, row, processors, keymap):
+        def __init__(self, parent, row, processors, keymap, memoize=False):
             """RowProxy objects are constructed by ResultProxy objects."""
 
             self._parent = parent
             self._row = row
             self._processors = processors
             self._keymap = keymap
+            if memoize:
+                self._memo = [_unprocessed] * len(row)
+            else:
+                self._memo = None
 
         def __reduce__(self):
             return (rowproxy_reconstructor,
@@ -54,7 +61,20 @@ except ImportError:
             """Return the values represented by this RowProxy as a list."""
             return list(self)
 
+        def _memoized(self, processor, index):
+            value = self._memo[index]
+            if value is _unprocessed:
+                value = self._row[index]
+                if processor is not None:
+                    value = processor(value)
+                self._memo[index] = value
+            return value
+
         def __iter__(self):
+            if self._memo is not None:
+                for index, processor in enumerate(self._processors):
+                    yield self._memoized(processor, index)
+                return
             for processor, value in zip(self._processors, self._row):
                 if processor is None:
                     yield value
@@ -71,6 +91,11 @@ except ImportError:
                 processor, obj, index = self._parent._key_fallback(key)
             except TypeError:
                 if isinstance(key, slice):
+                    if self._memo is not None:
+                        return tuple(
+                            self._memoized(self._processors[index], index)
+                            for index in range(len(self._row))[key]
+                        )
                     l = []
                     for processor, value in zip(self._processors[key],
                                                  self._row[key]):
@@ -85,7 +110,9 @@ except ImportError:
                 raise exc.InvalidRequestError(
                         "Ambiguous column name '%s' in result set! "
                         "try 'use_labels' option on select statement." % key)
-            if processor is not None:
+            if self._memo is not None:
+                return self._memoized(processor, index)
+            elif processor is not None:
                 return processor(self._row[index])
             else:
                 return self._row[index]
@@ -122,6 +149,7 @@ class RowProxy(BaseRowProxy):
         self._row = state['_row']
         self._processors = parent._processors
         self._keymap = parent._keymap
+        self._memo = None
 
     __hash__ = None
 
@@ -155,6 +183,21 @@ class RowProxy(BaseRowProxy):
     def itervalues(self):
         return iter(self)
 
+class MemoizedRowProxy(RowProxy):
+    """A :class:`.RowProxy` which runs the type processor for each
+    column at most once, on first access, and retains the processed
+    value for subsequent accesses.
+
+    Used by :class:`.ResultProxy` when the ``memoize_row_values``
+    execution option is set.
+
+    """
+    __slots__ = ()
+
+    def __init__(self, parent, row, processors, keymap):
+        super(MemoizedRowProxy, self).__init__(
+                    parent, row, processors, keymap, True)
+
 try:
     # Register RowProxy with Sequence,
     # so sequence protocol is implemented
@@ -251,10 +294,70 @@ class ResultMetaData(object):
         # high precedence keymap.
         keymap.update(primary_keymap)
 
+        # a compiled statement retrieved from the compiled cache
+        # using a structural key may have been compiled from a
+        # different, but equivalent, statement than the one invoked;
+        # link the invoked statement's columns to the same records.
+        # Columns not linked here are resolved on demand by
+        # _key_fallback(), which compiles the invoked statement.
+        invoked = context.invoked_statement
+        if invoked is not None and context.compiled is not None and \
+                invoked is not context.compiled.statement:
+            for compiled_col, invoked_col in zip(
+                    self._result_columns(context.compiled.statement),
+                    self._result_columns(invoked)):
+                if invoked_col not in keymap:
+                    rec = keymap.get(compiled_col)
+                    if rec is not None:
+                        keymap[invoked_col] = rec
+            self._unlinked = (invoked, dialect)
+
         if parent._echo:
             context.engine.logger.debug(
                 "Col %r", tuple(x[0] for x in metadata))
 
+    _unlinked = None
+
+    @classmethod
+    def _result_columns(cls, statement):
+        # the inner columns of a structurally equivalent
+        # statement line up in the same way
+        if isinstance(statement, expression.CompoundSelect):
+            return cls._result_columns(statement.selects[0])
+        elif isinstance(statement, expression.Select):
+            return list(statement.inner_columns)
+        else:
+            return getattr(statement, '_returning', None) or []
+
+    def _link_invoked(self):
+        """Compile the invoked statement in order to locate the result
+        column objects it would have produced, and link them to the
+        records of the equivalent cached statement."""
+
+        invoked, dialect = self._unlinked
+        self._unlinked = None
+        keymap = self._keymap
+        positions = dict(
+            (colname if self.case_sensitive else colname.lower(), i)
+            for i, colname in enumerate(self.keys)
+        )
+        compiled = invoked.compile(dialect=dialect)
+        for colname, (name, objects, type_) in compiled.result_map.items():
+            if colname not in positions:
+                continue
+            processor, obj, index = keymap[positions[colname]]
+            rec = (processor, objects, index)
+            if not self.case_sensitive:
+                name = name.lower()
+            # string keys are re-pointed at the invoked statement's
+            # objects, leaving ambiguous names in place
+            for strkey in (colname, name):
+                if keymap.get(strkey, rec)[2] is not None:
+                    keymap[strkey] = rec
+            for obj in objects:
+                if obj not in keymap:
+                    keymap[obj] = rec
+
     @util.pending_deprecation("0.8", "sqlite dialect uses "
                     "_translate_colname() now")
     def _set_keymap_synonym(self, name, origname):
@@ -307,6 +410,14 @@ class ResultMetaData(object):
                         break
                 else:
                     result = None
+            # expressions without a label are only ever targeted by
+            # identity, which the inner column linkage already covers
+            if result is None and key._label and \
+                    self._unlinked is not None:
+                self._link_invoked()
+                if key in map:
+                    return map[key]
+                return self._key_fallback(key, raiseerr)
         if result is None:
             if raiseerr:
                 raise exc.NoSuchColumnError(
@@ -371,6 +482,7 @@ class ResultProxy(object):
     """
 
     _process_row = RowProxy
+    _memoized_process_row = MemoizedRowProxy
     out_parameters = None
     _can_close_connection = False
     _metadata = None
@@ -383,6 +495,8 @@ class ResultProxy(object):
         self.connection = context.root_connection
         self._echo = self.connection._echo and \
                         context.engine._should_log_debug()
+        if context.execution_options.get('memoize_row_values', False):
+            self._process_row = self._memoized_process_row
         self._init_metadata()
 
     def _init_metadata(self):
@@ -825,6 +939,69 @@ class ResultProxy(object):
         else:
             return None
 
+    def fetch_columns(self, batch_size=None):
+        """Fetch the remaining rows in column-oriented form.
+
+        Returns an iterator which yields, for each batch of up to
+        ``batch_size`` rows, a list containing one list of values per
+        column, in the order of :meth:`.ResultProxy.keys`::
+
+            result = conn.execute(select([table.c.x, table.c.y]))
+            for xs, ys in result.fetch_columns(batch_size=10000):
+                total += sum(xs)
+
+        No :class:`.RowProxy` is created; each column's result processor,
+        if any, is applied across the batch's values for that column at
+        once.  The lists are suitable for passing along to constructors
+        such as ``array.array()`` or ``numpy.array()``.
+
+        If ``batch_size`` is omitted, all remaining rows are fetched
+        as a single batch.  The result is closed once all rows
+        are consumed.
+
+        .. versionadded:: 0.9.0
+
+        """
+        if self._metadata is None:
+            self._non_result()
+        return self._iterate_columns(batch_size)
+
+    def _iterate_columns(self, batch_size):
+        while True:
+            rows = self._fetch_column_batch(batch_size)
+            if not rows:
+                break
+
+            processors = self._metadata._processors
+            yield [
+                list(values) if processor is None
+                else list(map(processor, values))
+                for processor, values in zip(processors, zip(*rows))
+            ]
+
+            if batch_size is None:
+                break
+
+    def _fetch_column_batch(self, size):
+        """Fetch unprocessed rows on behalf of fetch_columns()."""
+
+        try:
+            if size is None:
+                rows = self._fetchall_impl()
+            else:
+                rows = self._fetchmany_impl(size)
+            if self._echo:
+                log = self.context.engine.logger.debug
+                for row in rows:
+                    log("Row %r", row)
+            if size is None or not rows:
+                self.close()
+            return rows
+        except Exception as e:
+            self.connection._handle_dbapi_exception(
+                                    e, None, None,
+                                    self.cursor, self.context)
+
 
 class BufferedRowResultProxy(ResultProxy):
     """A ResultProxy with row buffering behavior.
@@ -891,6 +1068,51 @@ class BufferedRowResultProxy(ResultProxy):
         self.__rowbuffer = collections.deque()
         return ret
 
+    def _buffer_remaining_rows(self):
+        self.__rowbuffer.extend(self.cursor.fetchall())
+
+
+class ExclusiveBufferedRowResultProxy(BufferedRowResultProxy):
+    """A :class:`.BufferedRowResultProxy` for a server side cursor
+    whose rows must be read in full before its DBAPI connection may
+    execute another statement.
+
+    This is the case for the MySQL "SSCursor" cursor classes.  While its
+    rows remain unread, the result is registered with the DBAPI
+    connection; the dialect calls :meth:`release_stream` before using the
+    connection for anything else, which reads the remaining rows into
+    the result's buffer.  The result then continues to return rows from
+    that buffer.
+
+    """
+
+    _stream_key = '_sa_exclusive_stream'
+
+    def _init_metadata(self):
+        super(ExclusiveBufferedRowResultProxy, self)._init_metadata()
+        self.context._dbapi_connection.info[self._stream_key] = \
+                                    weakref.ref(self)
+
+    @classmethod
+    def release_stream(cls, dbapi_connection):
+        """Buffer the remaining rows of the result streaming from the
+        given DBAPI connection, if any."""
+
+        ref = dbapi_connection.info.pop(cls._stream_key, None)
+        if ref is not None:
+            result = ref()
+            if result is not None and not result.closed:
+                result._buffer_remaining_rows()
+
+    def close(self, _autoclose_connection=True):
+        if not self.closed:
+            info = self.context._dbapi_connection.info
+            ref = info.get(self._stream_key)
+            if ref is not None and ref() is self:
+                del info[self._stream_key]
+        super(ExclusiveBufferedRowResultProxy, self).close(
+                                _autoclose_connection=_autoclose_connection)
+
 
 class FullyBufferedResultProxy(ResultProxy):
     """A result proxy that buffers rows fully upon creation.
@@ -959,6 +1181,9 @@ class BufferedColumnResultProxy(ResultProxy):
 
     _process_row = BufferedColumnRow
 
+    # values are processed up front
+    _memoized_process_row = BufferedColumnRow
+
     def _init_metadata(self):
         super(BufferedColumnResultProxy, self)._init_metadata()
         metadata = self._metadata
@@ -972,6 +1197,18 @@ class BufferedColumnResultProxy(ResultProxy):
             keymap[k] = (None, obj, index)
         self._metadata._keymap = keymap
 
+    def _fetch_column_batch(self, size):
+        # rows must be fully processed before requesting more
+        # from the DBAPI; the processed rows are passed along
+        # as processors in the metadata have been replaced with None.
+        if self.closed:
+            # closed by fetchone() upon exhausting the rows
+            return []
+        elif size is None:
+            return self.fetchall()
+        else:
+            return self.fetchmany(size)
+
     def fetchall(self):
         # can't call cursor.fetchall(), since rows must be
         # fully processed before requesting more from the DBAPI.
@@ -102,7 +102,11 @@ class DefaultEngineStrategy(EngineStrategy):
                          'recycle': 'pool_recycle',
                          'events': 'pool_events',
                          'use_threadlocal': 'pool_threadlocal',
-                         'reset_on_return': 'pool_reset_on_return'}
+                         'reset_on_return': 'pool_reset_on_return',
+                         'min_idle': 'pool_min_idle',
+                         'prewarm': 'pool_prewarm',
+                         'pre_ping': 'pool_pre_ping',
+                         'pre_ping_idle': 'pool_pre_ping_idle'}
             for k in util.get_cls_kwargs(poolclass):
                 tk = translate.get(k, k)
                 if tk in kwargs:
@@ -157,6 +161,8 @@ class DefaultEngineStrategy(EngineStrategy):
                 dialect.initialize(c)
             event.listen(pool, 'first_connect', first_connect)
 
+            pool._start()
+
         return engine
 
 
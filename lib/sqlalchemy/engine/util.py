@@ -87,8 +87,40 @@ def py_fallback():
             else:
                 return [multiparams]
 
+    def _positional_bind_params(plan, compiled_parameters,
+                                                sequence_format):
+        """Given a list of (key, processor) pairs, where processor may be
+        None, and a list of compiled parameter dictionaries, return a list
+        of positional parameter sequences with each value processed.
+
+        """
+        return [
+            sequence_format([
+                processor(params[key]) if processor is not None
+                else params[key]
+                for key, processor in plan
+            ])
+            for params in compiled_parameters
+        ]
+
+    def _keyed_bind_params(processors, compiled_parameters):
+        """Given a list of (key, processor) pairs and a list of compiled
+        parameter dictionaries, return a list of copies of those
+        dictionaries with the value of each key present processed.
+
+        """
+        result = []
+        for params in compiled_parameters:
+            params = dict(params)
+            for key, processor in processors:
+                if key in params:
+                    params[key] = processor(params[key])
+            result.append(params)
+        return result
+
     return locals()
 try:
-    from sqlalchemy.cutils import _distill_params
+    from sqlalchemy.cutils import _distill_params, \
+        _positional_bind_params, _keyed_bind_params
 except ImportError:
     globals().update(py_fallback())
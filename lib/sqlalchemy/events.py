@@ -357,6 +357,68 @@ class PoolEvents(event.Events):
 
         """
 
+    def checkout_wait(self, pool, wait_time):
+        """Called when a connection is retrieved from a pool which had
+        reached its overflow limit, so that the checkout may have had to
+        wait for a connection to be returned.
+
+        Only :class:`.QueuePool` and its subclasses emit this event.
+
+        :param pool:
+          The :class:`.Pool`
+
+        :param wait_time:
+          The number of seconds spent waiting for a connection.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+    def checkout_timeout(self, pool):
+        """Called when a checkout gives up waiting for a connection to be
+        returned, just before :class:`~sqlalchemy.exc.TimeoutError`
+        is raised.
+
+        Only :class:`.QueuePool` and its subclasses emit this event.
+
+        :param pool:
+          The :class:`.Pool`
+
+        .. versionadded:: 0.9.0
+
+        """
+
+    def recycle(self, dbapi_connection, connection_record):
+        """Called when a connection is to be closed and replaced as it has
+        exceeded the pool's ``recycle`` time.
+
+        :param dbapi_con:
+          A raw DB-API connection, which is about to be closed.
+
+        :param con_record:
+          The ``_ConnectionRecord`` that persistently manages the connection
+
+        .. versionadded:: 0.9.0
+
+        """
+
+    def invalidate(self, dbapi_connection, connection_record, exception):
+        """Called when a connection is invalidated, before it is closed.
+
+        :param dbapi_con:
+          A raw DB-API connection, which is about to be closed.
+
+        :param con_record:
+          The ``_ConnectionRecord`` that persistently manages the connection
+
+        :param exception:
+          The exception which caused the invalidation, if any; may be
+          None.
+
+        .. versionadded:: 0.9.0
+
+        """
+
 
 
 class ConnectionEvents(event.Events):
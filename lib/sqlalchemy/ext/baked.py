@@ -0,0 +1,303 @@
+# ext/baked.py
+# Copyright (C) 2005-2013 the SQLAlchemy authors and contributors <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Baked query extension.
+
+Provides a creational pattern for the :class:`.query.Query` object which
+allows the fully constructed object, the result of its
+:meth:`.Query._compile_context` step as well as the compiled SQL string to
+be cached across executions, such that repeated invocations of the same
+query structure skip Python-level query construction, loader strategy
+setup and SQL compilation.
+
+A :class:`.BakedQuery` is built from a series of Python callables, each
+of which receives a :class:`.Query` (or the :class:`.Session`, for the
+first) and returns a new one.  The identity of the code object of each
+callable forms the cache key, so the callables must not embed per-call
+values; these are instead supplied as :func:`.bindparam` objects whose
+values are passed to :meth:`.Result.params`::
+
+    from sqlalchemy.ext import baked
+    from sqlalchemy import bindparam
+
+    bakery = baked.bakery()
+
+    def lookup(session, user_id):
+        baked_query = bakery(lambda session: session.query(User))
+        baked_query += lambda q: q.filter(User.id == bindparam('id'))
+
+        return baked_query(session).params(id=user_id).one()
+
+The first call of ``lookup()`` builds and caches the
+:class:`.QueryContext`; subsequent calls locate the cached context
+and compiled statement and only invoke the statement with new bound
+values.
+
+"""
+
+import copy
+
+from .. import exc as sa_exc
+from .. import util
+from ..orm import exc as orm_exc
+from ..orm.query import Query
+
+__all__ = ['BakedQuery', 'Result', 'bakery']
+
+
+class BakedQuery(object):
+    """A builder object for :class:`.query.Query` objects."""
+
+    def __init__(self, bakery, initial_fn, args=()):
+        self._cache_key = ()
+        self._update_cache_key(initial_fn, args)
+        self.steps = [initial_fn]
+        self._spoiled = False
+        self._bakery = bakery
+
+    @classmethod
+    def bakery(cls, size=200):
+        """Construct a new bakery.
+
+        The bakery is a callable which produces new :class:`.BakedQuery`
+        objects, all sharing a single :class:`.util.LRUCache` of the given
+        size in which the baked :class:`.QueryContext` objects and
+        their compiled SQL are stored.
+
+        """
+        _bakery = util.LRUCache(size)
+
+        def call(initial_fn, *args):
+            return cls(_bakery, initial_fn, args)
+
+        return call
+
+    def _clone(self):
+        b1 = BakedQuery.__new__(BakedQuery)
+        b1._cache_key = self._cache_key
+        b1.steps = list(self.steps)
+        b1._bakery = self._bakery
+        b1._spoiled = self._spoiled
+        return b1
+
+    def _update_cache_key(self, fn, args=()):
+        self._cache_key += (fn.__code__,) + args
+
+    def __iadd__(self, other):
+        if isinstance(other, tuple):
+            self.add_criteria(*other)
+        else:
+            self.add_criteria(other)
+        return self
+
+    def __add__(self, other):
+        if isinstance(other, tuple):
+            return self.with_criteria(*other)
+        else:
+            return self.with_criteria(other)
+
+    def add_criteria(self, fn, *args):
+        """Add a criteria function to this :class:`.BakedQuery`.
+
+        This is equivalent to using the ``+=`` operator to
+        modify a :class:`.BakedQuery` in-place.
+
+        Any additional positional arguments are added to the cache key;
+        they should be hashable values which select between otherwise
+        identical criteria functions.
+
+        """
+        self._update_cache_key(fn, args)
+        self.steps.append(fn)
+        return self
+
+    def with_criteria(self, fn, *args):
+        """Add a criteria function to a :class:`.BakedQuery` cloned from
+        this one.
+
+        This is equivalent to using the ``+`` operator to
+        produce a new :class:`.BakedQuery` with modifications.
+
+        """
+        return self._clone().add_criteria(fn, *args)
+
+    def for_session(self, session):
+        """Return a :class:`.Result` object for this :class:`.BakedQuery`.
+
+        This is equivalent to calling the :class:`.BakedQuery` as a
+        Python callable, e.g. ``result = my_baked_query(session)``.
+
+        """
+        return Result(self, session)
+
+    def __call__(self, session):
+        return self.for_session(session)
+
+    def spoil(self, full=False):
+        """Cancel any query caching that will occur on this
+        :class:`.BakedQuery` object.
+
+        The :class:`.BakedQuery` can continue to be used normally, however
+        additional creational functions will not be cached; they will be
+        called on every invocation.
+
+        This is to support the case where a particular step in constructing
+        a baked query disqualifies the query from being cacheable, such
+        as a variant that relies upon some uncacheable value.
+
+        :param full: if False, only functions added to this
+         :class:`.BakedQuery` object subsequent to the spoil step will be
+         non-cached; the state of the :class:`.BakedQuery` up until
+         this point will be pulled from the cache.   If True, then the
+         entire :class:`.Query` object is built from scratch each
+         time, with all creational functions being called on each
+         invocation.
+
+        """
+        if not full:
+            _spoil_point = self._clone()
+            _spoil_point._cache_key += ('_query_only', )
+            self.steps = [_spoil_point._retrieve_baked_query]
+        self._spoiled = True
+        return self
+
+    def _retrieve_baked_query(self, session):
+        try:
+            query = self._bakery[self._cache_key]
+        except KeyError:
+            query = self._as_query(session)
+            self._bakery[self._cache_key] = query.with_session(None)
+            return query
+        else:
+            return query.with_session(session)
+
+    def _as_query(self, session):
+        query = self.steps[0](session)
+
+        for step in self.steps[1:]:
+            query = step(query)
+        return query
+
+    def _bake(self, session):
+        query = self._as_query(session)
+
+        context = query._compile_context()
+
+        # subquery eager loaders produce their Query objects up
+        # front within _compile_context(); these refer to the
+        # Session in use at bake time, so are detached here and
+        # re-associated on each execution.
+        for key, value in list(context.attributes.items()):
+            if key[0] == 'subquery' and isinstance(value, Query):
+                context.attributes[key] = value.with_session(None)
+
+        context.session = None
+        context.query = query = query.with_session(None)
+        query._execution_options = query._execution_options.union(
+                                    {"compiled_cache": self._bakery})
+        self._bakery[self._cache_key] = context
+        return context
+
+
+class Result(object):
+    """Invokes a :class:`.BakedQuery` against a :class:`.Session`.
+
+    The :class:`.Result` object is where the actual :class:`.query.Query`
+    object gets created, or retrieved from the cache,
+    against a target :class:`.Session`, and is then invoked for results.
+
+    """
+
+    def __init__(self, bq, session):
+        self.bq = bq
+        self.session = session
+        self._params = {}
+
+    def params(self, *args, **kw):
+        """Specify parameters to be replaced into the string SQL statement."""
+
+        if len(args) == 1:
+            kw.update(args[0])
+        elif len(args) > 0:
+            raise sa_exc.ArgumentError(
+                "params() takes zero or one positional argument, "
+                "which is a dictionary.")
+        self._params.update(kw)
+        return self
+
+    def _as_query(self):
+        return self.bq._as_query(self.session).params(self._params)
+
+    def __str__(self):
+        return str(self._as_query())
+
+    def __iter__(self):
+        bq = self.bq
+        if bq._spoiled:
+            return iter(self._as_query())
+
+        try:
+            baked_context = bq._bakery[bq._cache_key]
+        except KeyError:
+            baked_context = bq._bake(self.session)
+
+        context = copy.copy(baked_context)
+        context.session = self.session
+        context.attributes = attributes = context.attributes.copy()
+
+        for key, value in list(attributes.items()):
+            if key[0] == 'subquery' and isinstance(value, Query):
+                attributes[key] = value.with_session(self.session).\
+                                    params(self._params)
+
+        context.statement.use_labels = True
+        q = context.query.params(self._params).with_session(self.session)
+        context.query = q
+
+        if q._autoflush and not q._populate_existing:
+            self.session._autoflush()
+        return q._execute_and_instances(context)
+
+    def all(self):
+        """Return all rows.
+
+        Equivalent to :meth:`.Query.all`.
+
+        """
+        return list(self)
+
+    def first(self):
+        """Return the first row.
+
+        Equivalent to :meth:`.Query.first`.
+
+        """
+        bq = self.bq.with_criteria(lambda q: q.slice(0, 1))
+        ret = list(bq.for_session(self.session).params(self._params))
+        if len(ret) > 0:
+            return ret[0]
+        else:
+            return None
+
+    def one(self):
+        """Return exactly one result or raise an exception.
+
+        Equivalent to :meth:`.Query.one`.
+
+        """
+        ret = list(self)
+
+        l = len(ret)
+        if l == 1:
+            return ret[0]
+        elif l == 0:
+            raise orm_exc.NoResultFound("No row was found for one()")
+        else:
+            raise orm_exc.MultipleResultsFound(
+                "Multiple rows were found for one()")
+
+
+bakery = BakedQuery.bakery
@@ -379,6 +379,90 @@ def subqueryload_all(*keys):
     return _strategies.EagerLazyOption(keys, lazy="subquery", chained=True)
 
 
+def selectinload(*keys, **kw):
+    """Return a ``MapperOption`` that will convert the property
+    of the given name or series of mapped attributes
+    into a "select IN" eager load.
+
+    Used with :meth:`~sqlalchemy.orm.query.Query.options`.
+
+    "select IN" eager loading emits an additional SELECT for each
+    relationship after the parent rows are loaded, which joins the
+    related table to the parent table and limits the parent's join
+    columns to an IN of those values present in the loaded parent
+    objects.  Unlike :func:`subqueryload`, the original query is not
+    re-executed.
+
+    examples::
+
+        # select IN-load the "orders" collection on "User"
+        query(User).options(selectinload(User.orders))
+
+        # select IN-load the "keywords" collection on each "Item",
+        # but not the "items" collection on "Order" - those
+        # remain lazily loaded.
+        query(Order).options(selectinload(Order.items, Item.keywords))
+
+        # to select IN-load across both, use selectinload_all()
+        query(Order).options(selectinload_all(Order.items, Item.keywords))
+
+    :func:`selectinload` also accepts a keyword argument ``chunksize``
+    which indicates the maximum number of parent objects represented in
+    a single IN clause; larger sets of parents are loaded using
+    multiple statements.  Defaults to 500::
+
+        query(User).options(selectinload(User.orders, chunksize=100))
+
+    .. versionadded:: 0.9.0
+
+    See also:  :func:`joinedload`, :func:`subqueryload`, :func:`lazyload`
+
+    """
+    chunksize = kw.pop('chunksize', None)
+    if chunksize is not None:
+        return (
+            _strategies.EagerLazyOption(keys, lazy="selectin"),
+            _strategies.SelectInChunksizeOption(keys, chunksize)
+        )
+    else:
+        return _strategies.EagerLazyOption(keys, lazy="selectin")
+
+
+def selectinload_all(*keys, **kw):
+    """Return a ``MapperOption`` that will convert all properties along the
+    given dot-separated path or series of mapped attributes
+    into a "select IN" eager load.
+
+    Used with :meth:`~sqlalchemy.orm.query.Query.options`.
+
+    For example::
+
+        query.options(selectinload_all('orders.items.keywords'))...
+
+    will set all of ``orders``, ``orders.items``, and
+    ``orders.items.keywords`` to load using "select IN" eager loading.
+
+    The keyword argument ``chunksize`` is accepted as well, which
+    applies to each property along the path.
+
+    .. versionadded:: 0.9.0
+
+    See also:  :func:`selectinload`, :func:`subqueryload_all`
+
+    """
+    chunksize = kw.pop('chunksize', None)
+    if chunksize is not None:
+        return (
+            _strategies.EagerLazyOption(keys, lazy="selectin",
+                                            chained=True),
+            _strategies.SelectInChunksizeOption(keys, chunksize,
+                                            chained=True)
+        )
+    else:
+        return _strategies.EagerLazyOption(keys, lazy="selectin",
+                                            chained=True)
+
+
 def lazyload(*keys):
     """Return a ``MapperOption`` that will convert the property of the given
     name or series of mapped attributes into a lazy load.
@@ -404,6 +488,31 @@ def lazyload_all(*keys):
     return _strategies.EagerLazyOption(keys, lazy=True, chained=True)
 
 
+def batchload(*keys):
+    """Return a ``MapperOption`` that will convert the property of the given
+    name or series of mapped attributes into a batched lazy load.
+
+    Used with :meth:`~sqlalchemy.orm.query.Query.options`.
+
+    A batched lazy load emits SQL the first time the attribute is
+    accessed on any one object, as with :func:`lazyload`; the same
+    attribute is loaded at that time for all other objects in the
+    :class:`.Session` which were loaded by the same query, using IN
+    against the join columns of those objects, as with
+    :func:`selectinload`.  This avoids emitting one SELECT per object
+    when iterating through the attribute on each object of a result::
+
+        for user in session.query(User).options(batchload(User.orders)):
+            print user.orders   # first access loads orders for all users
+
+    .. versionadded:: 0.9.0
+
+    See also:  :func:`lazyload`, :func:`selectinload`
+
+    """
+    return _strategies.EagerLazyOption(keys, lazy="batch")
+
+
 def noload(*keys):
     """Return a ``MapperOption`` that will convert the property of the
     given name or series of mapped attributes into a non-load.
@@ -343,13 +343,6 @@ class Event(object):
         self.op = op
         self.parent_token = self.impl.parent_token
 
-    @classmethod
-    def _token_gen(self, op):
-        @util.memoized_property
-        def gen(self):
-            return Event(self, op)
-        return gen
-
     @property
     def key(self):
         return self.impl.key
@@ -360,6 +353,10 @@ class Event(object):
 class AttributeImpl(object):
     """internal implementation for instrumented attributes."""
 
+    __slots__ = ('class_', 'key', 'callable_', 'dispatch', 'trackparent',
+                    'parent_token', 'is_equal', 'expire_missing',
+                    '_append_token', '_remove_token', '_replace_token')
+
     def __init__(self, class_, key,
                     callable_, dispatch, trackparent=False, extension=None,
                     compare_function=None, active_history=False,
@@ -431,6 +428,13 @@ class AttributeImpl(object):
 
         self.expire_missing = expire_missing
 
+        self._init_tokens()
+
+    def _init_tokens(self):
+        self._append_token = Event(self, OP_APPEND)
+        self._remove_token = Event(self, OP_REMOVE)
+        self._replace_token = Event(self, OP_REPLACE)
+
     def __str__(self):
         return "%s.%s" % (self.class_.__name__, self.key)
 
@@ -515,7 +519,7 @@ class AttributeImpl(object):
         ``InstrumentedAttribute`` constructor.
 
         """
-        state.callables[self.key] = callable_
+        state._set_callable(self.key, callable_)
 
     def get_history(self, state, dict_, passive=PASSIVE_OFF):
         raise NotImplementedError()
@@ -627,6 +631,8 @@ class AttributeImpl(object):
 class ScalarAttributeImpl(AttributeImpl):
     """represents a scalar value-holding InstrumentedAttribute."""
 
+    __slots__ = ()
+
     accepts_scalar_loader = True
     uses_objects = False
     supports_population = True
@@ -662,8 +668,9 @@ class ScalarAttributeImpl(AttributeImpl):
         state._modified_event(dict_, self, old)
         dict_[self.key] = value
 
-    _replace_token = _append_token = Event._token_gen(OP_REPLACE)
-    _remove_token = Event._token_gen(OP_REMOVE)
+    def _init_tokens(self):
+        self._replace_token = self._append_token = Event(self, OP_REPLACE)
+        self._remove_token = Event(self, OP_REMOVE)
 
     def fire_replace_event(self, state, dict_, value, previous, initiator):
         for fn in self.dispatch.set:
@@ -687,6 +694,8 @@ class ScalarObjectAttributeImpl(ScalarAttributeImpl):
 
     """
 
+    __slots__ = ()
+
     accepts_scalar_loader = False
     uses_objects = True
     supports_population = True
@@ -792,6 +801,8 @@ class CollectionAttributeImpl(AttributeImpl):
     semantics to the orm layer independent of the user data implementation.
 
     """
+    __slots__ = ('copy', 'collection_factory')
+
     accepts_scalar_loader = False
     uses_objects = True
     supports_population = True
@@ -854,9 +865,6 @@ class CollectionAttributeImpl(AttributeImpl):
 
         return [(instance_state(o), o) for o in current]
 
-    _append_token = Event._token_gen(OP_APPEND)
-    _remove_token = Event._token_gen(OP_REMOVE)
-
     def fire_append_event(self, state, dict_, value, initiator):
         for fn in self.dispatch.append:
             value = fn(state, value, initiator or self._append_token)
@@ -1163,6 +1171,8 @@ class History(History):
 
     """
 
+    __slots__ = ()
+
     def __bool__(self):
         return self != HISTORY_BLANK
     __nonzero__ = __bool__
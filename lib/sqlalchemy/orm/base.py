@@ -361,6 +361,7 @@ class _InspectionAttr(object):
     here intact for forwards-compatibility.
 
     """
+    __slots__ = ()
 
     is_selectable = False
     """Return True if this object is an instance of :class:`.Selectable`."""
@@ -74,6 +74,9 @@ class DescriptorProperty(MapperProperty):
         proxy_attr.impl = _ProxyImpl(self.key)
         mapper.class_manager.instrument_attribute(self.key, proxy_attr)
 
+    def _row_processor_cache_key(self, context, path, row, adapter):
+        return (self, )
+
 
 @util.langhelpers.dependency_for("sqlalchemy.orm.properties")
 class CompositeProperty(DescriptorProperty):
@@ -40,7 +40,12 @@ class DynaLoader(strategies.AbstractRelationshipLoader):
             backref=self.parent_property.back_populates,
         )
 
+    def _row_processor_cache_key(self, row, adapter):
+        return (self, )
+
 class DynamicAttributeImpl(attributes.AttributeImpl):
+    __slots__ = ('target_mapper', 'order_by', 'query_class')
+
     uses_objects = True
     accepts_scalar_loader = False
     supports_population = False
@@ -76,9 +81,6 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
             history = self._get_collection_history(state, passive)
             return history.added_plus_unchanged
 
-    _append_token = attributes.Event._token_gen(attributes.OP_APPEND)
-    _remove_token = attributes.Event._token_gen(attributes.OP_REMOVE)
-
     def fire_append_event(self, state, dict_, value, initiator,
                                                     collection_history=None):
         if collection_history is None:
@@ -108,11 +110,12 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
     def _modified_event(self, state, dict_):
 
         if self.key not in state.committed_state:
-            state.committed_state[self.key] = CollectionHistory(self, state)
+            previous = CollectionHistory(self, state)
+        else:
+            previous = attributes.NEVER_SET
 
-        state._modified_event(dict_,
-                                self,
-                                attributes.NEVER_SET)
+        # a new CollectionHistory becomes the committed value
+        state._modified_event(dict_, self, previous)
 
         # this is a hack to allow the fixtures.ComparableEntity fixture
         # to work
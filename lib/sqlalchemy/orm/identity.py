@@ -6,12 +6,14 @@
 
 import weakref
 from . import attributes
+from .state import _no_ref
 from .. import util
 
 class IdentityMap(dict):
     def __init__(self):
         self._modified = set()
         self._wr = weakref.ref(self)
+        self._unique_key_index = weakref.WeakValueDictionary()
 
     def replace(self, state):
         raise NotImplementedError()
@@ -32,12 +34,44 @@ class IdentityMap(dict):
             self._modified.add(state)
 
     def _manage_removed_state(self, state):
-        del state._instance_dict
+        state._instance_dict = _no_ref
         self._modified.discard(state)
 
     def _dirty_states(self):
         return self._modified
 
+    def _index_unique_keys(self, state, dict_):
+        """Index the given state on the values of its mapper's
+        unique keys."""
+
+        mapper = state.manager.mapper
+        index = self._unique_key_index
+        for key in mapper.unique_keys:
+            values = mapper._unique_key_from_state(key, state, dict_)
+            if values is not None:
+                index[(mapper.base_mapper, key, values)] = state
+
+    def get_unique(self, mapper, key, values):
+        """Return the object present in this identity map whose values
+        for the given unique key columns of the given mapper are
+        ``values``, or None.
+
+        """
+        index_key = (mapper.base_mapper, key, values)
+        state = self._unique_key_index.get(index_key)
+        if state is None or not self.contains_state(state):
+            return None
+
+        o = state.obj()
+        if o is None or not state.manager.mapper.isa(mapper):
+            return None
+
+        # values may have changed since the state was indexed
+        if mapper._unique_key_from_state(key, state, state.dict) != values:
+            self._unique_key_index.pop(index_key, None)
+            return None
+        return o
+
     def check_modified(self):
         """return True if any InstanceStates present have been marked
         as 'modified'.
@@ -88,6 +88,18 @@ class MapperProperty(_MappedAttribute, _InspectionAttr):
         """
         return None, None, None
 
+    def _row_processor_cache_key(self, context, path, row, adapter):
+        """Return a hashable key identifying the functions returned by
+        :meth:`.create_row_processor` for the given arguments.
+
+        Row processors with equal keys may be reused by
+        :func:`.loading.instance_processor` for subsequent queries
+        against the same mapper.  None indicates the row processors
+        depend on per-query state and must be created each time.
+
+        """
+        return None
+
     def cascade_iterator(self, type_, state, visited_instances=None,
                             halt_on=None):
         """Iterate through instances related to the given instance for
@@ -444,6 +456,10 @@ class StrategizedProperty(MapperProperty):
                     create_row_processor(context, path,
                                     mapper, row, adapter)
 
+    def _row_processor_cache_key(self, context, path, row, adapter):
+        return self._get_context_strategy(context, path).\
+                    _row_processor_cache_key(row, adapter)
+
     def do_init(self):
         self._strategies = {}
         self.strategy = self.__init_strategy(self.strategy_class)
@@ -782,5 +798,15 @@ class LoaderStrategy(object):
 
         return None, None, None
 
+    def _row_processor_cache_key(self, row, adapter):
+        """Return a hashable key identifying the functions returned by
+        create_row_processor for the given row and adapter, or None
+        if they can't be reused across queries.
+
+        StrategizedProperty delegates its _row_processor_cache_key
+        method directly to this method. """
+
+        return None
+
     def __str__(self):
         return str(self.parent_property)
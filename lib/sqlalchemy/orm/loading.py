@@ -23,6 +23,21 @@ from .. import exc as sa_exc
 _new_runid = util.counter()
 
 
+def py_fallback():
+    def _populate_columns(dict_, row, plan):
+        """Given a sequence of (key, column) pairs, populate the given
+        dictionary with the value of each column in the given row."""
+
+        for key, col in plan:
+            dict_[key] = row[col]
+
+    return locals()
+try:
+    from sqlalchemy.cutils import _populate_columns
+except ImportError:
+    globals().update(py_fallback())
+
+
 def instances(query, cursor, context):
     """Return an ORM result as an iterator."""
     session = query.session
@@ -52,10 +67,11 @@ def instances(query, cursor, context):
                     for query_entity in query._entities
                 ]))
 
-    while True:
-        context.progress = {}
-        context.partials = {}
+    stream_rows = query._stream_rows
+    readonly = context.readonly
+    expunge_yielded = query._expunge_yielded and not readonly
 
+    while True:
         if query._yield_per:
             fetch = cursor.fetchmany(query._yield_per)
             if not fetch:
@@ -63,35 +79,62 @@ def instances(query, cursor, context):
         else:
             fetch = cursor.fetchall()
 
-        if custom_rows:
-            rows = []
-            for row in fetch:
-                process[0](row, rows)
-        elif single_entity:
-            rows = [process[0](row, None) for row in fetch]
+        if readonly:
+            # objects from prior batches are no longer needed for
+            # uniqueness; don't keep them alive for the whole result
+            context.readonly_identity_map.clear()
+
+        if stream_rows:
+            # process and yield one row at a time, so that only
+            # a single row's results and state are held here.
+            chunks = ([row] for row in fetch)
         else:
-            rows = [util.KeyedTuple([proc(row, None) for proc in process],
-                                    labels) for row in fetch]
+            chunks = (fetch, )
+
+        for chunk in chunks:
+            context.progress = {}
+            context.partials = {}
+
+            if custom_rows:
+                rows = []
+                for row in chunk:
+                    process[0](row, rows)
+            elif single_entity:
+                rows = [process[0](row, None) for row in chunk]
+            else:
+                rows = [util.KeyedTuple([proc(row, None) for proc in process],
+                                        labels) for row in chunk]
+
+            if filtered:
+                rows = util.unique_list(rows, filter_fn)
+
+            if context.refresh_state and query._only_load_props \
+                        and context.refresh_state in context.progress:
+                context.refresh_state._commit(
+                        context.refresh_state.dict, query._only_load_props)
+                context.progress.pop(context.refresh_state)
 
-        if filtered:
-            rows = util.unique_list(rows, filter_fn)
+            if not readonly:
+                statelib.InstanceState._commit_all_states(
+                    list(context.progress.items()),
+                    session.identity_map
+                )
 
-        if context.refresh_state and query._only_load_props \
-                    and context.refresh_state in context.progress:
-            context.refresh_state._commit(
-                    context.refresh_state.dict, query._only_load_props)
-            context.progress.pop(context.refresh_state)
+            for state, (dict_, attrs) in context.partials.items():
+                state._commit(dict_, attrs)
 
-        statelib.InstanceState._commit_all_states(
-            list(context.progress.items()),
-            session.identity_map
-        )
+            for post_load in context.post_load:
+                post_load(context)
 
-        for state, (dict_, attrs) in context.partials.items():
-            state._commit(dict_, attrs)
+            if expunge_yielded:
+                loaded = list(context.progress)
 
-        for row in rows:
-            yield row
+            for row in rows:
+                yield row
+
+            if expunge_yielded:
+                for state in loaded:
+                    session._expunge_state(state)
 
         if not query._yield_per:
             break
@@ -270,6 +313,7 @@ def instance_processor(mapper, context, path, adapter,
     new_populators = []
     existing_populators = []
     eager_populators = []
+    batched_populators = []
 
     load_path = context.query._current_path + path \
                 if context.query._current_path.path \
@@ -286,23 +330,31 @@ def instance_processor(mapper, context, path, adapter,
             _populators(mapper, context, path, row, adapter,
                             new_populators,
                             existing_populators,
-                            eager_populators
+                            eager_populators,
+                            batched_populators
             )
 
-        if isnew:
-            populators = new_populators
-        else:
-            populators = existing_populators
-
         if only_load_props is None:
+            if isnew:
+                populators = batched_populators
+            else:
+                populators = existing_populators
             for key, populator in populators:
                 populator(state, dict_, row)
         elif only_load_props:
+            if isnew:
+                populators = new_populators
+            else:
+                populators = existing_populators
             for key, populator in populators:
                 if key in only_load_props:
                     populator(state, dict_, row)
 
-    session_identity_map = context.session.identity_map
+    readonly = context.readonly
+    if readonly:
+        session_identity_map = context.readonly_identity_map
+    else:
+        session_identity_map = context.session.identity_map
 
     listeners = mapper.dispatch
 
@@ -323,7 +375,8 @@ def instance_processor(mapper, context, path, adapter,
             _populators(mapper, context, path, row, adapter,
                             new_populators,
                             existing_populators,
-                            eager_populators
+                            eager_populators,
+                            batched_populators
             )
 
         if translate_row:
@@ -421,9 +474,13 @@ def instance_processor(mapper, context, path, adapter,
             state = attributes.instance_state(instance)
             state.key = identitykey
 
-            # attach instance to session.
-            state.session_id = context.session.hash_key
-            session_identity_map.add(state)
+            if readonly:
+                # leave the instance detached
+                session_identity_map[identitykey] = instance
+            else:
+                # attach instance to session.
+                state.session_id = context.session.hash_key
+                session_identity_map.add(state)
 
         if currentload or populate_existing:
             # state is being fully loaded, so populate.
@@ -445,7 +502,8 @@ def instance_processor(mapper, context, path, adapter,
                 populate_state(state, dict_, row, isnew, only_load_props)
 
             if loaded_instance:
-                state.manager.dispatch.load(state, context)
+                if not readonly:
+                    state.manager.dispatch.load(state, context)
             elif isnew:
                 state.manager.dispatch.refresh(state, context, only_load_props)
 
@@ -497,12 +555,30 @@ def instance_processor(mapper, context, path, adapter,
 
 
 def _populators(mapper, context, path, row, adapter,
-        new_populators, existing_populators, eager_populators):
+        new_populators, existing_populators, eager_populators,
+        batched_populators):
     """Produce a collection of attribute level row processor
-    callables."""
+    callables.
+
+    When every property of the mapper reports a cache key for the
+    given path and row, the populators are stored on the mapper
+    and reused for subsequent queries producing the same keys.
+
+    """
+
+    pops = (new_populators, existing_populators,
+                        eager_populators, batched_populators)
+
+    cache_key = _populators_cache_key(mapper, context, path, row, adapter)
+    if cache_key is not None:
+        cached = mapper._populators_cache.get(cache_key)
+        if cached is not None:
+            for pop, cached_pop in zip(pops, cached):
+                pop.extend(cached_pop)
+            return
 
     delayed_populators = []
-    pops = (new_populators, existing_populators, delayed_populators,
+    row_pops = (new_populators, existing_populators, delayed_populators,
                         eager_populators)
 
     for prop in mapper._props.values():
@@ -512,11 +588,67 @@ def _populators(mapper, context, path, row, adapter,
                                     path,
                                     mapper, row, adapter)):
             if pop is not None:
-                pops[i].append((prop.key, pop))
+                row_pops[i].append((prop.key, pop))
 
     if delayed_populators:
         new_populators.extend(delayed_populators)
 
+    batched_populators.extend(_batch_column_populators(new_populators))
+
+    if cache_key is not None:
+        mapper._populators_cache[cache_key] = tuple(
+                                    tuple(pop) for pop in pops)
+
+
+def _populators_cache_key(mapper, context, path, row, adapter):
+    """Return a key identifying the populators :func:`._populators`
+    produces for the given arguments, or None if they can't be cached."""
+
+    if adapter is not None:
+        return None
+
+    key = [path.path]
+    for prop in mapper._props.values():
+        prop_key = prop._row_processor_cache_key(
+                                    context, path, row, adapter)
+        if prop_key is None:
+            return None
+        key.append(prop_key)
+    return tuple(key)
+
+
+def _batch_column_populators(populators):
+    """Combine consecutive column populators produced by
+    :class:`.ColumnLoader` into single populators which fetch all of
+    their columns at once."""
+
+    batched = []
+    run = []
+    for key, populator in populators:
+        if getattr(populator, 'fetch_column', None) is not None:
+            run.append((key, populator))
+            continue
+        _append_column_run(batched, run)
+        run = []
+        batched.append((key, populator))
+    _append_column_run(batched, run)
+    return batched
+
+
+def _append_column_run(batched, run):
+    if len(run) > 1:
+        plan = tuple((key, populator.fetch_column)
+                        for key, populator in run)
+        batched.append((None, _column_batch_populator(plan)))
+    else:
+        batched.extend(run)
+
+
+def _column_batch_populator(plan):
+    def populate_columns(state, dict_, row):
+        _populate_columns(dict_, row, plan)
+    return populate_columns
+
 
 def _configure_subclass_mapper(mapper, context, path, adapter):
     """Produce a mapper level row processor callable factory for mappers
@@ -112,6 +112,7 @@ class Mapper(_InspectionAttr):
                  passive_updates=True,
                  eager_defaults=False,
                  legacy_is_orphan=False,
+                 unique_keys=None,
                  _compiled_cache_size=100,
                  ):
         """Return a new :class:`~.Mapper` object.
@@ -418,6 +419,19 @@ class Mapper(_InspectionAttr):
            This is normally simply the primary key of the ``local_table``, but
            can be overridden here.
 
+        :param unique_keys: A list of :class:`.Column` objects, or of
+           lists of :class:`.Column` objects, each of which defines a set
+           of columns other than the primary key that uniquely identifies
+           a row, such as a column with a UNIQUE constraint.
+
+           Objects present in the :class:`.Session` are indexed on the
+           values of these columns, so that a many-to-one
+           :func:`.relationship` which refers to one of these keys, as
+           well as :meth:`.Query.get_unique`, can locate the object
+           without emitting SQL, in the same way as for a primary key.
+
+           .. versionadded:: 0.9.0
+
         :param version_id_col: A :class:`.Column`
            that will be used to keep a running version id of mapped entities
            in the database.  This is used during save operations to ensure that
@@ -473,6 +487,9 @@ class Mapper(_InspectionAttr):
         self.class_manager = None
 
         self._primary_key_argument = util.to_list(primary_key)
+        self._unique_keys_argument = [
+                        tuple(util.to_list(key))
+                        for key in util.to_list(unique_keys, ())]
         self.non_primary = non_primary
 
         if order_by is not False:
@@ -564,6 +581,7 @@ class Mapper(_InspectionAttr):
             self._configure_properties()
             self._configure_polymorphic_setter()
             self._configure_pks()
+            self._configure_unique_keys()
             Mapper._new_mappers = True
             self._log("constructed")
             self._expire_memoizations()
@@ -693,6 +711,19 @@ class Mapper(_InspectionAttr):
 
     """
 
+    unique_keys = ()
+    """A tuple of tuples of :class:`.Column` objects, each of which
+    comprises a key other than the primary key which uniquely identifies
+    a row of the mapped table, as configured using the ``unique_keys``
+    argument.
+
+    The keys of inherited mappers are included.
+
+    This is a *read only* attribute determined during mapper construction.
+    Behavior is undefined if directly modified.
+
+    """
+
     class_ = None
     """The Python class which this :class:`.Mapper` maps.
 
@@ -1184,6 +1215,25 @@ class Mapper(_InspectionAttr):
             self.primary_key = tuple(primary_key)
             self._log("Identified primary key columns: %s", primary_key)
 
+    def _configure_unique_keys(self):
+        if self.inherits and not self.concrete:
+            unique_keys = list(self.inherits.unique_keys)
+        else:
+            unique_keys = []
+
+        for key in self._unique_keys_argument:
+            columns = tuple(self.mapped_table.corresponding_column(c)
+                                for c in key)
+            if any(c is None for c in columns):
+                raise sa_exc.ArgumentError(
+                    "Mapper %s could not locate unique key columns %s "
+                    "in mapped table '%s'" %
+                    (self, ", ".join("'%s'" % c for c in key),
+                    self.mapped_table.description))
+            unique_keys.append(columns)
+
+        self.unique_keys = tuple(unique_keys)
+
     def _configure_properties(self):
 
         # Column and other ClauseElement objects which are mapped
@@ -2004,6 +2054,29 @@ class Mapper(_InspectionAttr):
         return sql.and_(*[k == v for (k, v) in params]), \
                 util.column_dict(params)
 
+    @_memoized_configured_property
+    def _unique_key_clauses(self):
+        """create "get clauses" for each unique key, used by many-to-one
+        lazyloads to locate items in the identity map by unique key.
+
+        """
+        return [
+            sql.and_(*[c == sql.bindparam(None, type_=c.type) for c in key])
+            for key in self.unique_keys
+        ]
+
+    def _unique_key_from_state(self, key, state, dict_):
+        """Return the values of the given unique key columns for the given
+        state, or None if any aren't loaded."""
+
+        values = []
+        for col in key:
+            prop = self._columntoproperty[col]
+            if prop.key not in dict_:
+                return None
+            values.append(dict_[prop.key])
+        return tuple(values)
+
     @_memoized_configured_property
     def _equivalent_columns(self):
         """Create a map of all *equivalent* columns, based on
@@ -2367,6 +2440,10 @@ class Mapper(_InspectionAttr):
     def _compiled_cache(self):
         return util.LRUCache(self._compiled_cache_size)
 
+    @_memoized_configured_property
+    def _populators_cache(self):
+        return util.LRUCache(self._compiled_cache_size)
+
     @_memoized_configured_property
     def _sorted_tables(self):
         table_to_mapper = {}
@@ -41,6 +41,8 @@ class PathRegistry(object):
 
     """
 
+    __slots__ = ()
+
     def __eq__(self, other):
         return other is not None and \
             self.path == other.path
@@ -134,6 +136,8 @@ class RootRegistry(PathRegistry):
     paths are maintained per-root-mapper.
 
     """
+    __slots__ = ()
+
     path = ()
 
     def __getitem__(self, entity):
@@ -141,6 +145,8 @@ class RootRegistry(PathRegistry):
 PathRegistry.root = RootRegistry()
 
 class TokenRegistry(PathRegistry):
+    __slots__ = ('token', 'parent', 'path')
+
     def __init__(self, parent, token):
         self.token = token
         self.parent = parent
@@ -150,6 +156,8 @@ class TokenRegistry(PathRegistry):
         raise NotImplementedError()
 
 class PropRegistry(PathRegistry):
+    __slots__ = ('prop', 'parent', 'path')
+
     def __init__(self, parent, prop):
         # restate this path in terms of the
         # given MapperProperty's parent.
@@ -176,7 +184,7 @@ class PropRegistry(PathRegistry):
 
 
 class EntityRegistry(PathRegistry, dict):
-    is_aliased_class = False
+    __slots__ = ('key', 'parent', 'is_aliased_class', 'path')
 
     def __init__(self, parent, entity):
         self.key = entity
@@ -9,7 +9,8 @@ and DELETE statements on behalf of a :class:`.Mapper` and its descending
 mappers.
 
 The functions here are called only by the unit of work functions
-in unitofwork.py.
+in unitofwork.py, as well as by the "bulk" methods of
+:class:`.Session`.
 
 """
 
@@ -120,6 +121,147 @@ def delete_obj(base_mapper, states, uowtransaction):
         mapper.dispatch.after_delete(mapper, connection, state)
 
 
+def _bulk_insert(mapper, mappings, session_transaction, isstates,
+                                                return_defaults):
+    """Issue ``INSERT`` statements for a list of dictionaries or
+    states on behalf of :meth:`.Session.bulk_insert_mappings` and
+    :meth:`.Session.bulk_save_objects`.
+
+    The unit of work is bypassed entirely; no events are emitted,
+    the identity map is not consulted and relationships are not
+    processed.  Rows are grouped into ``executemany()`` calls wherever
+    the sets of keys present are the same.
+
+    """
+    base_mapper = mapper.base_mapper
+
+    cached_connections = _cached_connection_dict(base_mapper)
+
+    if session_transaction.session.connection_callable:
+        raise NotImplementedError(
+            "connection_callable / per-instance sharding "
+            "not supported in bulk_insert()")
+
+    if isstates:
+        states = list(mappings)
+        mappings = [state.dict for state in states]
+    else:
+        mappings = list(mappings)
+
+    connection = session_transaction.connection(base_mapper)
+    for table, super_mapper in base_mapper._sorted_tables.items():
+        if not mapper.isa(super_mapper):
+            continue
+
+        insert = _collect_insert_commands(base_mapper, None, table, [
+                    (None, mapping, mapper, connection,
+                        False, None, None)
+                    for mapping in mappings], bulk=True)
+
+        if insert:
+            _emit_insert_statements(base_mapper, None,
+                                    cached_connections,
+                                    table, insert,
+                                    bookkeeping=return_defaults)
+
+    if return_defaults and isstates:
+        identity_cls = mapper._identity_class
+        identity_props = [mapper._columntoproperty[col].key
+                                for col in mapper.primary_key]
+        for state in states:
+            state.key = (identity_cls,
+                            tuple([state.dict[key] for key in identity_props]))
+
+
+def _bulk_update(mapper, mappings, session_transaction, isstates,
+                                                update_changed_only):
+    """Issue ``UPDATE`` statements for a list of dictionaries or
+    states on behalf of :meth:`.Session.bulk_update_mappings` and
+    :meth:`.Session.bulk_save_objects`.
+
+    Each dictionary must include the primary key attributes, which
+    locate the row to be updated; all other keys present are
+    rendered in the SET clause.
+
+    """
+    base_mapper = mapper.base_mapper
+
+    cached_connections = _cached_connection_dict(base_mapper)
+
+    if session_transaction.session.connection_callable:
+        raise NotImplementedError(
+            "connection_callable / per-instance sharding "
+            "not supported in bulk_update()")
+
+    if isstates:
+        if update_changed_only:
+            mappings = [_changed_dict(mapper, state) for state in mappings]
+        else:
+            mappings = [state.dict for state in mappings]
+    else:
+        mappings = list(mappings)
+
+    connection = session_transaction.connection(base_mapper)
+    for table, super_mapper in base_mapper._sorted_tables.items():
+        if not mapper.isa(super_mapper):
+            continue
+
+        update = _collect_bulk_update_commands(mapper, table,
+                                                mappings, connection)
+
+        if update:
+            _emit_update_statements(base_mapper, None,
+                                    cached_connections,
+                                    super_mapper, table, update,
+                                    bookkeeping=False)
+
+
+def _bulk_delete(mapper, mappings, session_transaction):
+    """Issue ``DELETE`` statements for a list of primary key
+    dictionaries on behalf of :meth:`.Session.bulk_delete_mappings`.
+
+    """
+    base_mapper = mapper.base_mapper
+
+    cached_connections = _cached_connection_dict(base_mapper)
+
+    if session_transaction.session.connection_callable:
+        raise NotImplementedError(
+            "connection_callable / per-instance sharding "
+            "not supported in bulk_delete()")
+
+    mappings = list(mappings)
+
+    connection = session_transaction.connection(base_mapper)
+    table_to_mapper = base_mapper._sorted_tables
+
+    for table in reversed(list(table_to_mapper.keys())):
+        super_mapper = table_to_mapper[table]
+        if not mapper.isa(super_mapper):
+            continue
+
+        delete = _collect_bulk_delete_commands(mapper, table,
+                                                mappings, connection)
+
+        if delete:
+            _emit_delete_statements(base_mapper, None,
+                        cached_connections, super_mapper, table, delete)
+
+
+def _changed_dict(mapper, state):
+    """Return the primary key and modified attributes of the given
+    state as a dictionary suitable for :func:`._bulk_update`."""
+
+    dict_ = state.dict
+    committed_state = state.committed_state
+    pk_keys = set(mapper._columntoproperty[col].key
+                            for col in mapper.primary_key)
+    return dict(
+        (k, v) for k, v in dict_.items()
+        if k in committed_state or k in pk_keys
+    )
+
+
 def _organize_states_for_save(base_mapper, states, uowtransaction):
     """Make an initial pass across a set of states for INSERT or
     UPDATE.
@@ -229,10 +371,15 @@ def _organize_states_for_delete(base_mapper, states, uowtransaction):
 
 
 def _collect_insert_commands(base_mapper, uowtransaction, table,
-                                                states_to_insert):
+                                                states_to_insert, bulk=False):
     """Identify sets of values to use in INSERT statements for a
     list of states.
 
+    When ``bulk`` is set, the "states" are plain dictionaries of
+    attribute values with no :class:`.InstanceState` present, so the
+    polymorphic identity, usually established when the object is
+    constructed, is supplied here if not present.
+
     """
     insert = []
     for state, state_dict, mapper, connection, has_identity, \
@@ -255,6 +402,10 @@ def _collect_insert_commands(base_mapper, uowtransaction, table,
                 prop = mapper._columntoproperty[col]
                 value = state_dict.get(prop.key, None)
 
+                if value is None and bulk and \
+                        col is mapper.polymorphic_on:
+                    value = mapper.polymorphic_identity
+
                 if value is None:
                     if col in pks:
                         has_all_pks = False
@@ -388,6 +539,53 @@ def _collect_update_commands(base_mapper, uowtransaction,
     return update
 
 
+def _collect_bulk_update_commands(mapper, table, mappings, connection):
+    """Identify sets of values to use in UPDATE statements for a
+    list of dictionaries passed to :func:`._bulk_update`.
+
+    Unlike :func:`._collect_update_commands`, no attribute history is
+    available; the primary key values present locate the row and all
+    other values present are updated.
+
+    """
+    if table not in mapper._pks_by_table:
+        return []
+
+    pks = mapper._pks_by_table[table]
+    cols = [(col, mapper._columntoproperty[col].key)
+                for col in mapper._cols_by_table[table]]
+
+    update = []
+    for mapping in mappings:
+        params = {}
+        value_params = {}
+
+        hasdata = False
+        for col, key in cols:
+            if col in pks:
+                value = mapping.get(key)
+                if value is None:
+                    raise orm_exc.FlushError(
+                            "Can't update table "
+                            "using NULL for primary "
+                            "key value")
+                params[col._label] = value
+            elif key in mapping:
+                value = mapping[key]
+                if col is mapper.version_id_col:
+                    params[col._label] = value
+                    params[col.key] = mapper.version_id_generator(value)
+                elif isinstance(value, sql.ClauseElement):
+                    value_params[col] = value
+                else:
+                    params[col.key] = value
+                hasdata = True
+        if hasdata:
+            update.append((None, mapping, params, mapper,
+                            connection, value_params))
+    return update
+
+
 def _collect_post_update_commands(base_mapper, uowtransaction, table,
                         states_to_update, post_update_cols):
     """Identify sets of values to use in UPDATE statements for a
@@ -458,10 +656,49 @@ def _collect_delete_commands(base_mapper, uowtransaction, table,
     return delete
 
 
+def _collect_bulk_delete_commands(mapper, table, mappings, connection):
+    """Identify values to use in DELETE statements for a list of
+    primary key dictionaries passed to :func:`._bulk_delete`."""
+
+    delete = util.defaultdict(list)
+
+    if table not in mapper._pks_by_table:
+        return delete
+
+    cols = [(col, mapper._columntoproperty[col].key)
+                for col in mapper._pks_by_table[table]]
+    if mapper.version_id_col is not None and \
+                table.c.contains_column(mapper.version_id_col):
+        version_key = mapper._columntoproperty[mapper.version_id_col].key
+    else:
+        version_key = None
+
+    for mapping in mappings:
+        params = {}
+        delete[connection].append(params)
+        for col, key in cols:
+            params[col.key] = value = mapping.get(key)
+            if value is None:
+                raise orm_exc.FlushError(
+                            "Can't delete from table "
+                            "using NULL for primary "
+                            "key value")
+        if version_key is not None:
+            params[mapper.version_id_col.key] = mapping.get(version_key)
+    return delete
+
+
 def _emit_update_statements(base_mapper, uowtransaction,
-                        cached_connections, mapper, table, update):
+                        cached_connections, mapper, table, update,
+                        bookkeeping=True):
     """Emit UPDATE statements corresponding to value lists collected
-    by _collect_update_commands()."""
+    by _collect_update_commands().
+
+    When ``bookkeeping`` is False, as is the case for bulk updates,
+    no state is present to receive newly generated values, and rows
+    which share the same set of keys are sent to ``executemany()``.
+
+    """
 
     needs_version_id = mapper.version_id_col is not None and \
                 table.c.contains_column(mapper.version_id_col)
@@ -483,30 +720,48 @@ def _emit_update_statements(base_mapper, uowtransaction,
     statement = base_mapper._memo(('update', table), update_stmt)
 
     rows = 0
-    for state, state_dict, params, mapper, \
-                connection, value_params in update:
-
-        if value_params:
-            c = connection.execute(
-                                statement.values(value_params),
-                                params)
-        else:
+    check_rowcount = True
+    for (connection, paramkeys, hasvalue), records in groupby(update,
+                        lambda rec: (rec[4],
+                                    sorted(rec[2].keys()),
+                                    bool(rec[5]))):
+        if not bookkeeping and not hasvalue and \
+                (not needs_version_id or
+                    connection.dialect.supports_sane_multi_rowcount):
+            multiparams = [rec[2] for rec in records]
             c = cached_connections[connection].\
-                                execute(statement, params)
+                                execute(statement, multiparams)
+            if len(multiparams) > 1 and \
+                    not connection.dialect.supports_sane_multi_rowcount:
+                check_rowcount = False
+            rows += c.rowcount
+            continue
 
-        _postfetch(
-                mapper,
-                uowtransaction,
-                table,
-                state,
-                state_dict,
-                c.context.prefetch_cols,
-                c.context.postfetch_cols,
-                c.context.compiled_parameters[0],
-                value_params)
-        rows += c.rowcount
+        for state, state_dict, params, mapper, \
+                    connection, value_params in records:
+
+            if value_params:
+                c = connection.execute(
+                                    statement.values(value_params),
+                                    params)
+            else:
+                c = cached_connections[connection].\
+                                    execute(statement, params)
+
+            if bookkeeping:
+                _postfetch(
+                        mapper,
+                        uowtransaction,
+                        table,
+                        state,
+                        state_dict,
+                        c.context.prefetch_cols,
+                        c.context.postfetch_cols,
+                        c.context.compiled_parameters[0],
+                        value_params)
+            rows += c.rowcount
 
-    if connection.dialect.supports_sane_rowcount:
+    if check_rowcount and connection.dialect.supports_sane_rowcount:
         if rows != len(update):
             raise orm_exc.StaleDataError(
                     "UPDATE statement on table '%s' expected to "
@@ -521,9 +776,17 @@ def _emit_update_statements(base_mapper, uowtransaction,
 
 
 def _emit_insert_statements(base_mapper, uowtransaction,
-                        cached_connections, table, insert):
+                        cached_connections, table, insert,
+                        bookkeeping=True):
     """Emit INSERT statements corresponding to value lists collected
-    by _collect_insert_commands()."""
+    by _collect_insert_commands().
+
+    When ``bookkeeping`` is False, as is the case for bulk inserts
+    which don't request defaults to be returned, newly generated
+    primary key values aren't needed, and all rows which share the
+    same set of keys are sent to ``executemany()``.
+
+    """
 
     statement = base_mapper._memo(('insert', table), table.insert)
 
@@ -534,7 +797,12 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                                     bool(rec[5]),
                                     rec[6])
     ):
-        if has_all_pks and not hasvalue:
+        if not bookkeeping and not hasvalue:
+            multiparams = [rec[2] for rec in records]
+            cached_connections[connection].\
+                                execute(statement, multiparams)
+
+        elif has_all_pks and not hasvalue:
             records = list(records)
             multiparams = [rec[2] for rec in records]
             c = cached_connections[connection].\
@@ -556,6 +824,14 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                         value_params)
 
         else:
+            records = list(records)
+            if not hasvalue and len(records) > 1 and \
+                    _use_multivalues_returning(connection.dialect,
+                                                table, pkeys):
+                _emit_multivalues_returning_insert(uowtransaction,
+                                        connection, table, records)
+                continue
+
             for state, state_dict, params, mapper, \
                         connection, value_params, \
                         has_all_pks in records:
@@ -576,12 +852,15 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                                     mapper._pks_by_table[table]):
                         prop = mapper._columntoproperty[col]
                         if state_dict.get(prop.key) is None:
-                            # TODO: would rather say:
-                            #state_dict[prop.key] = pk
-                            mapper._set_state_attr_by_column(
-                                        state,
-                                        state_dict,
-                                        col, pk)
+                            if state is None:
+                                state_dict[prop.key] = pk
+                            else:
+                                # TODO: would rather say:
+                                #state_dict[prop.key] = pk
+                                mapper._set_state_attr_by_column(
+                                            state,
+                                            state_dict,
+                                            col, pk)
 
                 _postfetch(
                         mapper,
@@ -595,6 +874,94 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                         value_params)
 
 
+def _use_multivalues_returning(dialect, table, keys):
+    """Return True if INSERT rows lacking primary key values may be
+    sent as one multiple-VALUES statement, retrieving the newly
+    generated primary keys with RETURNING.
+
+    Python-side callable defaults for columns not present in ``keys``
+    would be invoked only once for the whole statement, so such
+    tables continue to INSERT one row at a time.
+
+    """
+    if not dialect.multivalues_insert_returning or \
+            not dialect.supports_multivalues_insert_returning or \
+            not dialect.implicit_returning or \
+            not table.implicit_returning:
+        return False
+
+    for col in table.c:
+        if col.key not in keys and col.default is not None and \
+                not col.default.is_sequence and col.default.is_callable:
+            return False
+    return True
+
+
+def _emit_multivalues_returning_insert(uowtransaction, connection,
+                                                table, records):
+    """Emit a single INSERT..VALUES (...), (...)..RETURNING for the
+    given records, populating the primary key of each state from the
+    returned rows in order."""
+
+    pks = records[0][3]._pks_by_table[table]
+
+    # scalar defaults for columns not present would be rendered
+    # using a single bound value shared by all rows; supply them
+    # explicitly for each row instead.
+    keys = records[0][2]
+    scalar_defaults = [col for col in table.c
+                        if col.key not in keys and
+                        col.default is not None and
+                        col.default.is_scalar]
+    if scalar_defaults:
+        multiparams = []
+        for rec in records:
+            params = dict(rec[2])
+            for col in scalar_defaults:
+                params[col.key] = col.default.arg
+            multiparams.append(params)
+    else:
+        multiparams = [rec[2] for rec in records]
+
+    statement = table.insert().\
+                    values(multiparams).\
+                    returning(*pks)
+    result = connection.execute(statement)
+    rows = result.fetchall()
+
+    if len(rows) != len(records):
+        raise orm_exc.FlushError(
+                "Multi-row INSERT statement on table '%s' expected to "
+                "return %d row(s); %d were returned." %
+                (table.description, len(records), len(rows)))
+
+    prefetch_cols = scalar_defaults
+    postfetch_cols = result.context.postfetch_cols
+
+    for (state, state_dict, rec_params, mapper,
+            conn, value_params, has_all_pks), row, params in \
+            zip(records, rows, multiparams):
+        for col, pk in zip(pks, row):
+            prop = mapper._columntoproperty[col]
+            if state_dict.get(prop.key) is None:
+                if state is None:
+                    state_dict[prop.key] = pk
+                else:
+                    mapper._set_state_attr_by_column(
+                                state, state_dict, col, pk)
+
+        _postfetch(
+                mapper,
+                uowtransaction,
+                table,
+                state,
+                state_dict,
+                prefetch_cols,
+                postfetch_cols,
+                params,
+                value_params)
+
+
 def _emit_post_update_statements(base_mapper, uowtransaction,
                             cached_connections, mapper, table, update):
     """Emit UPDATE statements corresponding to value lists collected
@@ -720,11 +1087,24 @@ def _postfetch(mapper, uowtransaction, table,
                             params, value_params):
     """Expire attributes in need of newly persisted database state,
     after an INSERT or UPDATE statement has proceeded for that
-    state."""
+    state.
+
+    ``state`` is None for a bulk insert, in which case values are
+    populated into the plain dictionary ``dict_``.
+
+    """
 
     if mapper.version_id_col is not None:
         prefetch_cols = list(prefetch_cols) + [mapper.version_id_col]
 
+    if state is None:
+        for c in prefetch_cols:
+            if c.key in params and c in mapper._columntoproperty:
+                dict_[mapper._columntoproperty[c].key] = params[c.key]
+        for m, equated_pairs in mapper._table_to_equated[table]:
+            sync.populate_inherit_keys_dict(dict_, m, equated_pairs)
+        return
+
     for c in prefetch_cols:
         if c.key in params and c in mapper._columntoproperty:
             mapper._set_state_attr_by_column(state, dict_, c, params[c.key])
@@ -78,6 +78,9 @@ class Query(object):
     _with_labels = False
     _criterion = None
     _yield_per = None
+    _stream_rows = False
+    _expunge_yielded = False
+    _readonly = False
     _lockmode = None
     _order_by = False
     _group_by = False
@@ -710,7 +713,7 @@ class Query(object):
                                         polymorphic_on=polymorphic_on)
 
     @_generative()
-    def yield_per(self, count):
+    def yield_per(self, count, stream=False, expunge=False):
         """Yield only ``count`` rows at a time.
 
         WARNING: use this method with caution; if the same instance is present
@@ -724,18 +727,73 @@ class Query(object):
         loading, the full result for all rows is fetched which generally
         defeats the purpose of :meth:`~sqlalchemy.orm.query.Query.yield_per`.
 
-        Also note that while :meth:`~sqlalchemy.orm.query.Query.yield_per`
-        will set the ``stream_results`` execution option to True, currently
-        this is only understood by :mod:`~sqlalchemy.dialects.postgresql.psycopg2` dialect
-        which will stream results using server side cursors instead of pre-buffer
-        all rows for this query. Other DBAPIs pre-buffer all rows before
-        making them available.
+        Also note that :meth:`~sqlalchemy.orm.query.Query.yield_per`
+        will set the ``stream_results`` execution option to True, which
+        is understood by the :mod:`~sqlalchemy.dialects.postgresql.psycopg2`,
+        :mod:`~sqlalchemy.dialects.mysql.mysqldb` and
+        :mod:`~sqlalchemy.dialects.mysql.pymysql` dialects; these will
+        stream results using server side cursors instead of pre-buffering
+        all rows for this query.  Pysqlite doesn't pre-buffer rows in any
+        case.  Other DBAPIs pre-buffer all rows before making them
+        available.
+
+        :param count: number of rows to fetch from the cursor at a time.
+
+        :param stream: if True, each row is converted into its result and
+         yielded as soon as it is processed, rather than processing the full
+         batch of ``count`` rows into a list before yielding any of them.
+         Only one row's worth of results and newly loaded object state is
+         held by the query at a time.
+
+         .. versionadded:: 0.9.0
+
+        :param expunge: if True, objects whose state was loaded by a row
+         are expunged from the :class:`.Session` once that row (or batch
+         of rows, when ``stream`` is False) has been yielded and the
+         iteration resumes, so that the :class:`.Session` doesn't
+         accumulate every object loaded by the query.  Objects which were
+         already present in the :class:`.Session` and weren't refreshed by
+         the query are left in place.  Expunged objects are detached;
+         any lazy loads must occur before the iteration is resumed, and
+         an identity appearing in more than one row produces a separate
+         object for each.
+
+         .. versionadded:: 0.9.0
 
         """
         self._yield_per = count
+        self._stream_rows = stream
+        self._expunge_yielded = expunge
         self._execution_options = self._execution_options.union(
                                         {"stream_results": True})
 
+    @_generative()
+    def readonly(self):
+        """Return a :class:`.Query` that loads objects without tracking
+        them in the :class:`.Session`.
+
+        Objects loaded by the returned :class:`.Query` are created in the
+        *detached* state: they are not added to the :class:`.Session`
+        or its identity map, objects already present in the identity map
+        are not consulted or refreshed, and the
+        :meth:`.InstanceEvents.load` event is not emitted.  Each result
+        produces a new set of objects, although an identity appearing
+        more than once within a single result, such as via joined
+        eager loading, produces the same object each time.
+
+        This skips much of the bookkeeping the ORM performs for each
+        row, which is useful when a large number of objects are loaded
+        only to be read, such as when serializing them.  As the objects
+        are detached, attributes which aren't loaded by the query, such as
+        lazy-loading relationships, can't be loaded upon access; use
+        eager loading to load related objects along with the query.
+        Changes made to the objects are not persisted.
+
+        .. versionadded:: 0.9.0
+
+        """
+        self._readonly = True
+
     def get(self, ident):
         """Return an instance based on the given primary key identifier,
         or ``None`` if not found.
@@ -811,6 +869,7 @@ class Query(object):
         key = mapper.identity_key_from_primary_key(ident)
 
         if not self._populate_existing and \
+                not self._readonly and \
                 not mapper.always_refresh and \
                 self._lockmode is None:
 
@@ -825,6 +884,68 @@ class Query(object):
 
         return loading.load_on_ident(self, key)
 
+    def get_unique(self, **kwargs):
+        """Return an instance based on the given values for one of the
+        mapper's unique keys, or ``None`` if not found.
+
+        E.g.::
+
+            my_user = session.query(User).get_unique(name='ed')
+
+        The keyword arguments must name exactly the attributes mapped
+        to one of the keys given to the ``unique_keys`` argument of
+        :func:`.mapper`.  As with :meth:`~.Query.get`, the
+        :class:`.Query` must be against a single mapped entity with
+        no additional filtering criterion.
+
+        If an object with the given unique key values is present in the
+        local identity map, it is returned directly and no SQL is emitted;
+        otherwise a SELECT is performed in order to locate the object.
+
+        A lazy-loading, many-to-one attribute configured by
+        :func:`.relationship` whose criterion refers to one of the
+        mapper's unique keys will similarly check the identity map
+        before querying the database.
+
+        .. versionadded:: 0.9.0
+
+        :return: The object instance, or ``None``.
+
+        """
+        mapper = self._only_full_mapper_zero("get_unique")
+
+        for key in mapper.unique_keys:
+            props = [mapper._columntoproperty[col] for col in key]
+            if set(prop.key for prop in props) == set(kwargs):
+                break
+        else:
+            raise sa_exc.InvalidRequestError(
+                "Mapper %s has no unique key consisting of attributes %s" %
+                (mapper, ", ".join("'%s'" % k for k in sorted(kwargs))))
+
+        values = tuple(kwargs[prop.key] for prop in props)
+
+        q = self._clone()
+        q._order_by = q._distinct = False
+        q._no_criterion_condition("get_unique")
+
+        if not self._populate_existing and \
+                not self._readonly and \
+                not mapper.always_refresh and \
+                self._lockmode is None:
+
+            instance = self.session.identity_map.get_unique(
+                                            mapper, key, values)
+            if instance is not None:
+                return instance
+
+        q = q.filter(sql.and_(*[
+                            col == value for col, value in zip(key, values)]))
+        try:
+            return q.one()
+        except orm_exc.NoResultFound:
+            return None
+
     @_generative()
     def correlate(self, *args):
         """Return a :class:`.Query` construct which will correlate the given
@@ -3238,6 +3359,7 @@ class QueryContext(object):
     adapter = None
     froms = ()
     for_update = False
+    readonly_identity_map = None
 
     def __init__(self, query):
 
@@ -3259,11 +3381,17 @@ class QueryContext(object):
         self.invoke_all_eagers = query._invoke_all_eagers
         self.version_check = query._version_check
         self.refresh_state = query._refresh_state
+        self.readonly = query._readonly
+        if self.readonly:
+            # stands in for the Session's identity map, so that
+            # identities are unique within the result
+            self.readonly_identity_map = {}
         self.primary_columns = []
         self.secondary_columns = []
         self.eager_order_by = []
         self.eager_joins = {}
         self.create_eager_joins = []
+        self.post_load = []
         self.propagate_options = set(o for o in query._with_options if
                                         o.propagate_to_loaders)
         self.attributes = query._attributes.copy()
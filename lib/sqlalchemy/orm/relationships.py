@@ -390,6 +390,13 @@ class RelationshipProperty(StrategizedProperty):
             accessed, using a separate SELECT statement, or identity map
             fetch for simple many-to-one references.
 
+          * ``batch`` - items should be loaded lazily when the property is
+            first accessed, along with the same property on all other
+            objects in the :class:`.Session` loaded by the same query,
+            using IN against their join columns.  See :func:`.batchload`.
+
+            .. versionadded:: 0.9.0
+
           * ``immediate`` - items should be loaded as the parents are loaded,
             using a separate SELECT statement, or identity map fetch for
             simple many-to-one references.
@@ -405,6 +412,13 @@ class RelationshipProperty(StrategizedProperty):
             loaded, using one additional SQL statement, which issues a JOIN to a
             subquery of the original statement, for each collection requested.
 
+          * ``selectin`` - items should be loaded "eagerly" as the parents are
+            loaded, using one additional SQL statement per group of parents,
+            which limits the join columns of the parent to an IN of the
+            values present in the loaded parents.  See :func:`.selectinload`.
+
+            .. versionadded:: 0.9.0
+
           * ``noload`` - no loading should occur at any time.  This is to
             support "write-only" attributes, or attributes which are
             populated in some manner specific to the application.
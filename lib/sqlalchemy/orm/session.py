@@ -8,11 +8,12 @@
 
 
 import weakref
+import itertools
 from .. import util, sql, engine, exc as sa_exc
 from ..sql import util as sql_util, expression
 from . import (
     SessionExtension, attributes, exc, query,
-    loading, identity
+    loading, identity, persistence
     )
 from ..inspection import inspect
 from .base import (
@@ -263,8 +264,7 @@ class SessionTransaction(object):
 
         for s in set(self._new).union(self.session._new):
             self.session._expunge_state(s)
-            if s.key:
-                del s.key
+            s.key = None
 
         for s, (oldkey, newkey) in self._key_switches.items():
             self.session.identity_map.discard(s)
@@ -272,9 +272,7 @@ class SessionTransaction(object):
             self.session.identity_map.replace(s)
 
         for s in set(self._deleted).union(self.session._deleted):
-            if s.deleted:
-                #assert s in self._deleted
-                del s.deleted
+            s.deleted = False
             self.session._update_impl(s, discard_existing=True)
 
         assert not self.session._deleted
@@ -1979,6 +1977,180 @@ class Session(_SessionClassMethods):
             with util.safe_reraise():
                 transaction.rollback(_capture_exception=True)
 
+    def bulk_save_objects(self, objects, return_defaults=False,
+                                    update_changed_only=True):
+        """Perform a bulk save of the given list of objects.
+
+        The bulk save feature allows mapped objects to be used as the
+        source of simple INSERT and UPDATE operations which can be more
+        easily grouped together into higher performing "executemany"
+        operations; the extraction of data from the objects is also
+        performed using a lower-latency process that ignores whether
+        or not attributes have actually been modified in the case of
+        INSERTs, and also ignores SQL expressions.
+
+        The objects as given are not added to the session and no
+        additional state is established on them, unless the
+        ``return_defaults`` flag is also set, in which case primary key
+        attributes and server-side default values will be populated.
+
+        Objects which have no identity key are INSERTed; those which
+        have one, e.g. objects that were loaded and then detached, are
+        UPDATEd.  The unit of work is bypassed entirely: relationships
+        are not handled, no cascades take place, the objects are not
+        placed into the identity map and no mapper-level persistence
+        events are emitted.
+
+        :param objects: a list of mapped object instances.  Objects
+         are grouped by mapper and by INSERT/UPDATE, preserving their
+         order, so that runs of the same kind are batched together.
+
+        :param return_defaults: when True, rows that are missing values
+         which generate defaults, namely integer primary key defaults
+         and sequences, will be inserted **one at a time**, so that the
+         primary key value is available.  This is required in order
+         for joined-inheritance hierarchies whose primary keys are
+         generated to be inserted correctly, at the expense of
+         performance.
+
+        :param update_changed_only: when True, UPDATE statements are
+         rendered based on those attributes in each state that have
+         logged changes.   When False, all attributes present are
+         rendered into the SET clause with the exception of primary key
+         attributes.
+
+        .. seealso::
+
+            :meth:`.Session.bulk_insert_mappings`
+
+            :meth:`.Session.bulk_update_mappings`
+
+        """
+        for (mapper, isupdate), states in itertools.groupby(
+            (attributes.instance_state(obj) for obj in objects),
+            lambda state: (state.mapper, state.key is not None)
+        ):
+            self._bulk_save_mappings(
+                mapper, states, isupdate, True,
+                return_defaults, update_changed_only)
+
+    def bulk_insert_mappings(self, mapper, mappings, return_defaults=False):
+        """Perform a bulk insert of the given list of mapping dictionaries.
+
+        Each dictionary represents a single row to be inserted, keyed
+        on the mapped attribute names of the given mapper.  If the
+        mapper refers to multiple tables, as with joined inheritance,
+        each dictionary may contain keys for all of them, and an
+        INSERT is emitted for each table.
+
+        The values within the dictionaries are passed to the DBAPI
+        without change; no mapped objects are created, the unit of work
+        is bypassed and relationships are not handled.  Rows which
+        share the same set of keys are batched into a single
+        "executemany" call per table.
+
+        :param mapper: a mapped class, or the actual :class:`.Mapper`
+         object, representing the single kind of object represented
+         within the mapping list.
+
+        :param mappings: a list of dictionaries.
+
+        :param return_defaults: when True, rows that are missing values
+         which generate defaults, namely integer primary key defaults and
+         sequences, will be inserted **one at a time**, so that the
+         primary key value is available, and the newly generated values
+         are populated into the given dictionaries.  This is required
+         for joined-inheritance hierarchies whose primary keys are
+         generated.
+
+        .. seealso::
+
+            :meth:`.Session.bulk_save_objects`
+
+            :meth:`.Session.bulk_update_mappings`
+
+        """
+        self._bulk_save_mappings(
+            mapper, mappings, False, False, return_defaults, False)
+
+    def bulk_update_mappings(self, mapper, mappings):
+        """Perform a bulk update of the given list of mapping dictionaries.
+
+        Each dictionary must include the primary key attributes of
+        the row to be updated; all other keys present are rendered into
+        the SET clause of an UPDATE statement.  Rows which share the
+        same set of keys are batched into a single "executemany" call
+        per table.
+
+        The unit of work is bypassed entirely; objects already present
+        in the :class:`.Session` with the given primary keys are not
+        refreshed.
+
+        :param mapper: a mapped class, or the actual :class:`.Mapper`
+         object, representing the single kind of object represented
+         within the mapping list.
+
+        :param mappings: a list of dictionaries.
+
+        .. seealso::
+
+            :meth:`.Session.bulk_insert_mappings`
+
+            :meth:`.Session.bulk_save_objects`
+
+        """
+        self._bulk_save_mappings(mapper, mappings, True, False, False, False)
+
+    def bulk_delete_mappings(self, mapper, mappings):
+        """Perform a bulk delete of the given list of mapping dictionaries.
+
+        Each dictionary contains the primary key attributes of a row
+        to be deleted.  A DELETE is emitted for each table of the
+        mapper, in reverse dependency order, batched into a single
+        "executemany" call per table.
+
+        The unit of work is bypassed entirely; cascades aren't
+        processed and objects present in the :class:`.Session` with the
+        given primary keys are not affected.  To delete rows matching
+        criteria rather than a list of primary keys, see
+        :meth:`.Query.delete`.
+
+        :param mapper: a mapped class, or the actual :class:`.Mapper`
+         object, representing the single kind of object represented
+         within the mapping list.
+
+        :param mappings: a list of dictionaries.
+
+        """
+        self._bulk_operation(persistence._bulk_delete,
+                                _class_to_mapper(mapper), mappings)
+
+    def _bulk_save_mappings(
+            self, mapper, mappings, isupdate, isstates,
+            return_defaults, update_changed_only):
+        mapper = _class_to_mapper(mapper)
+        if isupdate:
+            self._bulk_operation(persistence._bulk_update,
+                    mapper, mappings, isstates, update_changed_only)
+        else:
+            self._bulk_operation(persistence._bulk_insert,
+                    mapper, mappings, isstates, return_defaults)
+
+    def _bulk_operation(self, fn, mapper, mappings, *args):
+        if self._flushing:
+            raise sa_exc.InvalidRequestError("Session is already flushing")
+
+        self._flushing = True
+        transaction = self.begin(subtransactions=True)
+        try:
+            fn(mapper, mappings, transaction, *args)
+            transaction.commit()
+        except:
+            with util.safe_reraise():
+                transaction.rollback(_capture_exception=True)
+        finally:
+            self._flushing = False
+
     def is_modified(self, instance, include_collections=True,
                             passive=True):
         """Return ``True`` if the given instance has locally
@@ -2341,11 +2513,9 @@ def make_transient(instance):
 
     # remove expired state and
     # deferred callables
-    state.callables.clear()
-    if state.key:
-        del state.key
-    if state.deleted:
-        del state.deleted
+    state.callables = util.EMPTY_DICT
+    state.key = None
+    state.deleted = False
 
 
 def object_session(instance):
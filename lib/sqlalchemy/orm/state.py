@@ -19,20 +19,28 @@ from .base import PASSIVE_NO_RESULT, SQL_OK, NEVER_SET, ATTR_WAS_SET, \
         NO_VALUE, PASSIVE_NO_INITIALIZE
 from . import base
 
+
+def _no_ref():
+    """Stand-in for a dead weak reference, used by :class:`.InstanceState`
+    when it has no object or identity map."""
+    return None
+
+
 class InstanceState(interfaces._InspectionAttr):
     """tracks state information at the instance level."""
 
-    session_id = None
-    key = None
-    runid = None
-    load_options = util.EMPTY_SET
-    load_path = ()
-    insert_order = None
-    _strong_obj = None
-    modified = False
-    expired = False
-    deleted = False
-    _load_pending = False
+    # one InstanceState is present for every mapped object,
+    # so use __slots__ to keep the per-object overhead small.
+    # ``callables`` and ``committed_state`` refer to a shared,
+    # immutable empty dictionary until first modified; ``parents``,
+    # ``_pending_mutations`` and ``attrs`` are created on first access.
+    __slots__ = (
+        '__weakref__', 'class_', 'manager', 'obj', '_instance_dict',
+        'callables', 'committed_state', 'session_id', 'key', 'runid',
+        'load_options', 'load_path', 'insert_order', '_strong_obj',
+        'modified', 'expired', 'deleted', '_load_pending',
+        '_parents', '_mutations', '_attrs'
+    )
 
     is_instance = True
 
@@ -40,10 +48,20 @@ class InstanceState(interfaces._InspectionAttr):
         self.class_ = obj.__class__
         self.manager = manager
         self.obj = weakref.ref(obj, self._cleanup)
-        self.callables = {}
-        self.committed_state = {}
+        self._init_defaults()
+
+    def _init_defaults(self):
+        self._instance_dict = _no_ref
+        self.callables = self.committed_state = util.EMPTY_DICT
+        self.session_id = self.key = self.runid = None
+        self.load_options = util.EMPTY_SET
+        self.load_path = ()
+        self.insert_order = self._strong_obj = None
+        self.modified = self.expired = self.deleted = \
+            self._load_pending = False
+        self._parents = self._mutations = self._attrs = None
 
-    @util.memoized_property
+    @property
     def attrs(self):
         """Return a namespace representing each attribute on
         the mapped object, including its current value
@@ -52,12 +70,14 @@ class InstanceState(interfaces._InspectionAttr):
         The returned object is an instance of :class:`.AttributeState`.
 
         """
-        return util.ImmutableProperties(
-            dict(
-                (key, AttributeState(self, key))
-                for key in self.manager
+        if self._attrs is None:
+            self._attrs = util.ImmutableProperties(
+                dict(
+                    (key, AttributeState(self, key))
+                    for key in self.manager
+                )
             )
-        )
+        return self._attrs
 
     @property
     def transient(self):
@@ -136,15 +156,19 @@ class InstanceState(interfaces._InspectionAttr):
         # the board ?  probably
         return self.key
 
-    @util.memoized_property
+    @property
     def parents(self):
-        return {}
+        if self._parents is None:
+            self._parents = {}
+        return self._parents
 
-    @util.memoized_property
+    @property
     def _pending_mutations(self):
-        return {}
+        if self._mutations is None:
+            self._mutations = {}
+        return self._mutations
 
-    @util.memoized_property
+    @property
     def mapper(self):
         """Return the :class:`.Mapper` used for this mapepd object."""
         return self.manager.mapper
@@ -164,19 +188,16 @@ class InstanceState(interfaces._InspectionAttr):
 
     def _dispose(self):
         self._detach()
-        del self.obj
+        self.obj = _no_ref
 
     def _cleanup(self, ref):
         instance_dict = self._instance_dict()
         if instance_dict:
             instance_dict.discard(self)
 
-        self.callables = {}
+        self.callables = util.EMPTY_DICT
         self.session_id = self._strong_obj = None
-        del self.obj
-
-    def obj(self):
-        return None
+        self.obj = _no_ref
 
     @property
     def dict(self):
@@ -209,15 +230,28 @@ class InstanceState(interfaces._InspectionAttr):
             self._pending_mutations[key] = PendingCollection()
         return self._pending_mutations[key]
 
+    def _set_callable(self, key, callable_):
+        if self.callables is util.EMPTY_DICT:
+            self.callables = {}
+        self.callables[key] = callable_
+
     def __getstate__(self):
-        state_dict = {'instance': self.obj()}
-        state_dict.update(
-            (k, self.__dict__[k]) for k in (
-                'committed_state', '_pending_mutations', 'modified', 'expired',
-                'callables', 'key', 'parents', 'load_options',
-                'class_',
-            ) if k in self.__dict__
-        )
+        state_dict = {
+            'instance': self.obj(),
+            'committed_state': self.committed_state,
+            'callables': self.callables,
+            'modified': self.modified,
+            'expired': self.expired,
+            'class_': self.class_,
+        }
+        if self._mutations is not None:
+            state_dict['_pending_mutations'] = self._mutations
+        if self._parents is not None:
+            state_dict['parents'] = self._parents
+        if self.key is not None:
+            state_dict['key'] = self.key
+        if self.load_options:
+            state_dict['load_options'] = self.load_options
         if self.load_path:
             state_dict['load_path'] = self.load_path.serialize()
 
@@ -226,6 +260,7 @@ class InstanceState(interfaces._InspectionAttr):
         return state_dict
 
     def __setstate__(self, state_dict):
+        self._init_defaults()
         inst = state_dict['instance']
         if inst is not None:
             self.obj = weakref.ref(inst, self._cleanup)
@@ -237,18 +272,18 @@ class InstanceState(interfaces._InspectionAttr):
             self.obj = None
             self.class_ = state_dict['class_']
 
-        self.committed_state = state_dict.get('committed_state', {})
-        self._pending_mutations = state_dict.get('_pending_mutations', {})
-        self.parents = state_dict.get('parents', {})
+        self.committed_state = state_dict.get('committed_state') or \
+                                util.EMPTY_DICT
+        self._mutations = state_dict.get('_pending_mutations')
+        self._parents = state_dict.get('parents')
         self.modified = state_dict.get('modified', False)
         self.expired = state_dict.get('expired', False)
-        self.callables = state_dict.get('callables', {})
+        self.callables = state_dict.get('callables') or util.EMPTY_DICT
 
-        self.__dict__.update([
-            (k, state_dict[k]) for k in (
-                'key', 'load_options',
-            ) if k in state_dict
-        ])
+        if 'key' in state_dict:
+            self.key = state_dict['key']
+        if 'load_options' in state_dict:
+            self.load_options = state_dict['load_options']
 
         if 'load_path' in state_dict:
             self.load_path = PathRegistry.\
@@ -269,7 +304,8 @@ class InstanceState(interfaces._InspectionAttr):
         old = dict_.pop(key, None)
         if old is not None and self.manager[key].impl.collection:
             self.manager[key].impl._invalidate_collection(old)
-        self.callables.pop(key, None)
+        if key in self.callables:
+            del self.callables[key]
 
     def _expire_attribute_pre_commit(self, dict_, key):
         """a fast expire that can be called by column loaders during a load.
@@ -283,7 +319,7 @@ class InstanceState(interfaces._InspectionAttr):
 
         """
         dict_.pop(key, None)
-        self.callables[key] = self
+        self._set_callable(key, self)
 
     @classmethod
     def _row_processor(cls, manager, fn, key):
@@ -293,10 +329,10 @@ class InstanceState(interfaces._InspectionAttr):
                 old = dict_.pop(key, None)
                 if old is not None:
                     impl._invalidate_collection(old)
-                state.callables[key] = fn
+                state._set_callable(key, fn)
         else:
             def _set_callable(state, dict_, row):
-                state.callables[key] = fn
+                state._set_callable(key, fn)
         return _set_callable
 
     def _expire(self, dict_, modified_set):
@@ -307,20 +343,20 @@ class InstanceState(interfaces._InspectionAttr):
         self.modified = False
         self._strong_obj = None
 
-        self.committed_state.clear()
+        self.committed_state = util.EMPTY_DICT
 
-        InstanceState._pending_mutations._reset(self)
+        self._mutations = None
 
         # clear out 'parents' collection.  not
         # entirely clear how we can best determine
         # which to remove, or not.
-        InstanceState.parents._reset(self)
+        self._parents = None
 
         for key in self.manager:
             impl = self.manager[key].impl
             if impl.accepts_scalar_loader and \
                     (impl.expire_missing or key in dict_):
-                self.callables[key] = self
+                self._set_callable(key, self)
             old = dict_.pop(key, None)
             if impl.collection and old is not None:
                 impl._invalidate_collection(old)
@@ -328,17 +364,18 @@ class InstanceState(interfaces._InspectionAttr):
         self.manager.dispatch.expire(self, None)
 
     def _expire_attributes(self, dict_, attribute_names):
-        pending = self.__dict__.get('_pending_mutations', None)
+        pending = self._mutations
 
         for key in attribute_names:
             impl = self.manager[key].impl
             if impl.accepts_scalar_loader:
-                self.callables[key] = self
+                self._set_callable(key, self)
             old = dict_.pop(key, None)
             if impl.collection and old is not None:
                 impl._invalidate_collection(old)
 
-            self.committed_state.pop(key, None)
+            if key in self.committed_state:
+                del self.committed_state[key]
             if pending:
                 pending.pop(key, None)
 
@@ -404,9 +441,6 @@ class InstanceState(interfaces._InspectionAttr):
         """
         return set([k for k, v in self.callables.items() if v is self])
 
-    def _instance_dict(self):
-        return None
-
     def _modified_event(self, dict_, attr, previous, collection=False):
         if attr.key not in self.committed_state:
             if collection:
@@ -417,6 +451,8 @@ class InstanceState(interfaces._InspectionAttr):
                 if previous not in (None, NO_VALUE, NEVER_SET):
                     previous = attr.copy(previous)
 
+            if self.committed_state is util.EMPTY_DICT:
+                self.committed_state = {}
             self.committed_state[attr.key] = previous
 
         # assert self._strong_obj is None or self.modified
@@ -455,8 +491,10 @@ class InstanceState(interfaces._InspectionAttr):
         this step if a value was not populated in state.dict.
 
         """
-        for key in keys:
-            self.committed_state.pop(key, None)
+        committed_state = self.committed_state
+        if committed_state:
+            for key in keys:
+                committed_state.pop(key, None)
 
         self.expired = False
 
@@ -487,8 +525,8 @@ class InstanceState(interfaces._InspectionAttr):
         """Mass version of commit_all()."""
 
         for state, dict_ in iter:
-            state.committed_state.clear()
-            InstanceState._pending_mutations._reset(state)
+            state.committed_state = util.EMPTY_DICT
+            state._mutations = None
 
             callables = state.callables
             for key in list(callables):
@@ -498,6 +536,9 @@ class InstanceState(interfaces._InspectionAttr):
             if instance_dict and state.modified:
                 instance_dict._modified.discard(state)
 
+            if instance_dict and state.manager.mapper.unique_keys:
+                instance_dict._index_unique_keys(state, dict_)
+
             state.modified = state.expired = False
             state._strong_obj = None
 
@@ -9,7 +9,7 @@
 
 from .. import exc as sa_exc, inspect
 from .. import util, log, event
-from ..sql import util as sql_util, visitors
+from ..sql import util as sql_util, visitors, expression, operators
 from . import (
         attributes, interfaces, exc as orm_exc, loading,
         unitofwork, util as orm_util
@@ -110,6 +110,9 @@ class UninstrumentedColumnLoader(LoaderStrategy):
     def create_row_processor(self, context, path, mapper, row, adapter):
         return None, None, None
 
+    def _row_processor_cache_key(self, row, adapter):
+        return (self, )
+
 
 @log.class_logger
 @properties.ColumnProperty._strategy_for(dict(instrument=True, deferred=False))
@@ -151,12 +154,23 @@ class ColumnLoader(LoaderStrategy):
             if col is not None and col in row:
                 def fetch_col(state, dict_, row):
                     dict_[key] = row[col]
+                # allows loading.instance_processor() to fetch
+                # consecutive plain columns together
+                fetch_col.fetch_column = col
                 return fetch_col, None, None
         else:
             def expire_for_non_present_col(state, dict_, row):
                 state._expire_attribute_pre_commit(dict_, key)
             return expire_for_non_present_col, None, None
 
+    def _row_processor_cache_key(self, row, adapter):
+        if adapter:
+            return None
+        for idx, col in enumerate(self.columns):
+            if col in row:
+                return (self, idx)
+        return (self, None)
+
 
 
 @log.class_logger
@@ -195,6 +209,14 @@ class DeferredColumnLoader(LoaderStrategy):
                 state._reset(dict_, key)
             return reset_col_for_deferred, None, None
 
+    def _row_processor_cache_key(self, row, adapter):
+        if adapter:
+            return None
+        if self.columns[0] in row:
+            return self.parent_property._get_strategy(ColumnLoader).\
+                        _row_processor_cache_key(row, adapter)
+        return (self, )
+
     def init_class_attribute(self, mapper):
         self.is_class_level = True
 
@@ -326,6 +348,9 @@ class NoLoader(AbstractRelationshipLoader):
             state._initialize(self.key)
         return invoke_no_load, None, None
 
+    def _row_processor_cache_key(self, row, adapter):
+        return (self, )
+
 
 
 @log.class_logger
@@ -368,6 +393,28 @@ class LazyLoader(AbstractRelationshipLoader):
             self.logger.info("%s will use query.get() to "
                                     "optimize instance loads" % self)
 
+        # similarly, determine if our "lazywhere" clause refers to one of
+        # the mapper's unique keys, in which case the identity map
+        # is consulted by unique key before a SELECT is emitted.
+        self._unique_key = None
+        if not self.uselist and not self.use_get:
+            for key, clause in zip(self.mapper.unique_keys,
+                                    self.mapper._unique_key_clauses):
+                if clause.compare(
+                            self._lazywhere,
+                            use_proxies=True,
+                            equivalents=self.mapper._equivalent_columns):
+                    self._unique_key = key
+                    for col in list(self._equated_columns):
+                        if col in self.mapper._equivalent_columns:
+                            for c in self.mapper._equivalent_columns[col]:
+                                self._equated_columns[c] = \
+                                            self._equated_columns[col]
+                    self.logger.info("%s will check the identity map "
+                                    "by unique key to optimize "
+                                    "instance loads" % self)
+                    break
+
     def init_class_attribute(self, mapper):
         self.is_class_level = True
 
@@ -484,7 +531,8 @@ class LazyLoader(AbstractRelationshipLoader):
         ident_key = None
 
         if (
-            (not passive & attributes.SQL_OK and not self.use_get)
+            (not passive & attributes.SQL_OK and not self.use_get
+                and self._unique_key is None)
             or
             (not passive & attributes.NON_PERSISTENT_OK and pending)
         ):
@@ -498,6 +546,26 @@ class LazyLoader(AbstractRelationshipLoader):
                 (orm_util.state_str(state), self.key)
             )
 
+        # if we refer to a unique key, check the identity map's
+        # unique key index, again without generating a Query
+        if self._unique_key is not None:
+            values = self._get_values_for_unique_key(state, passive)
+            if attributes.PASSIVE_NO_RESULT in values:
+                return attributes.PASSIVE_NO_RESULT
+            elif attributes.NEVER_SET in values:
+                return attributes.NEVER_SET
+
+            if _none_set.issuperset(values):
+                return None
+
+            instance = session.identity_map.get_unique(
+                                self.mapper, self._unique_key, tuple(values))
+            if instance is not None:
+                return instance
+            elif not passive & attributes.SQL_OK or \
+                not passive & attributes.RELATED_OBJECT_OK:
+                return attributes.PASSIVE_NO_RESULT
+
         # if we have a simple primary key load, check the
         # identity map without generating a Query at all
         if self.use_get:
@@ -543,6 +611,25 @@ class LazyLoader(AbstractRelationshipLoader):
             for pk in self.mapper.primary_key
         ]
 
+    def _get_values_for_unique_key(self, state, passive):
+        instance_mapper = state.manager.mapper
+
+        if passive & attributes.LOAD_AGAINST_COMMITTED:
+            get_attr = instance_mapper._get_committed_state_attr_by_column
+        else:
+            get_attr = instance_mapper._get_state_attr_by_column
+
+        dict_ = state.dict
+
+        return [
+            get_attr(
+                    state,
+                    dict_,
+                    self._equated_columns[col],
+                    passive=passive)
+            for col in self._unique_key
+        ]
+
     def _emit_lazyload(self, session, state, ident_key, passive):
         q = session.query(self.mapper)._adapt_all_clauses()
 
@@ -630,6 +717,9 @@ class LazyLoader(AbstractRelationshipLoader):
 
             return reset_for_lazy_callable, None, None
 
+    def _row_processor_cache_key(self, row, adapter):
+        return (self, )
+
 
 
 class LoadLazyAttribute(object):
@@ -647,6 +737,139 @@ class LoadLazyAttribute(object):
         return strategy._load_for_state(state, passive)
 
 
+@log.class_logger
+@properties.RelationshipProperty._strategy_for(dict(lazy="batch"))
+class BatchLazyLoader(LazyLoader):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    with lazy="batch", that is loads when first accessed, along with
+    the same attribute on all other objects loaded by the same query.
+
+    """
+
+    def create_row_processor(self, context, path,
+                                    mapper, row, adapter):
+        if not self.is_class_level:
+            # per-instance batch loader, as for LazyLoader
+            set_lazy_callable = InstanceState._row_processor(
+                                        mapper.class_manager,
+                                        LoadBatchLazyAttribute(self.key),
+                                        self.key)
+            return set_lazy_callable, None, None
+        else:
+            return super(BatchLazyLoader, self).create_row_processor(
+                                    context, path, mapper, row, adapter)
+
+    def _row_processor_cache_key(self, row, adapter):
+        return (self, )
+
+    def _load_for_state(self, state, passive):
+        if not state.key or state.runid is None or \
+                not passive & attributes.SQL_OK or \
+                passive & attributes.LOAD_AGAINST_COMMITTED:
+            return super(BatchLazyLoader, self).\
+                        _load_for_state(state, passive)
+
+        session = _state_session(state)
+        if not session:
+            return super(BatchLazyLoader, self).\
+                        _load_for_state(state, passive)
+
+        if self.use_get or self._unique_key is not None:
+            # check the identity map first, as LazyLoader would
+            value = super(BatchLazyLoader, self).\
+                        _load_for_state(state, passive ^ attributes.SQL_OK)
+            if value is not attributes.PASSIVE_NO_RESULT:
+                return value
+
+        key = self._local_values(state, passive)
+        if attributes.PASSIVE_NO_RESULT in key:
+            return attributes.PASSIVE_NO_RESULT
+
+        states = [(state, key)]
+        for sibling in self._batch_siblings(session, state):
+            key = self._local_values(sibling, attributes.PASSIVE_NO_FETCH)
+            if attributes.PASSIVE_NO_RESULT not in key:
+                states.append((sibling, key))
+
+        return self._load_batch(session, state, states)
+
+    def _local_values(self, state, passive):
+        get_attr = state.manager.mapper._get_state_attr_by_column
+        return tuple([
+            get_attr(state, state.dict, col, passive=passive)
+            for col in self.parent_property.local_columns
+        ])
+
+    def _batch_siblings(self, session, state):
+        """Return the persistent states in the session which were loaded
+        by the same query as the given state and have yet to load this
+        attribute."""
+
+        key, runid, prop = self.key, state.runid, self.parent_property
+        for sibling in session.identity_map.all_states():
+            if sibling is state or \
+                    sibling.runid != runid or \
+                    key in sibling.dict or \
+                    sibling.manager.mapper._props.get(key) is not prop:
+                continue
+            loader = sibling.callables.get(key)
+            if loader is None:
+                if self.is_class_level:
+                    yield sibling
+            elif isinstance(loader, LoadBatchLazyAttribute):
+                yield sibling
+
+    def _load_batch(self, session, state, states):
+        selectin = self.parent_property._get_strategy(SelectInLoader)
+        q, key_attr = selectin._selectin_query(session, self.mapper)
+        q = q._with_invoke_all_eagers(False)
+
+        if state.load_path:
+            q = q._with_current_path(state.load_path[self.parent_property])
+
+        if state.load_options:
+            q = q._conditional_options(*state.load_options)
+
+        for rev in self.parent_property._reverse_property:
+            # reverse props that are MANYTOONE are loading *this*
+            # object from get(), so don't need to eager out to those.
+            if rev.direction is interfaces.MANYTOONE and \
+                        rev._use_get and \
+                        not isinstance(rev.strategy, LazyLoader):
+                q = q.options(EagerLazyOption((rev.key,), lazy='select'))
+
+        collections = selectin._load_collections(q, key_attr,
+                                        states, selectin.chunksize)
+
+        # the attribute being accessed is populated by the
+        # caller using our return value
+        (state, key), siblings = states[0], states[1:]
+        if self.uselist:
+            selectin._populate_collections(siblings, collections)
+            return collections.get(key, [])
+        else:
+            selectin._populate_scalars(siblings, collections)
+            collection = collections.get(key, (None,))
+            if len(collection) > 1:
+                util.warn(
+                    "Multiple rows returned with "
+                    "uselist=False for lazily-loaded attribute '%s' "
+                    % self.parent_property)
+            return collection[0]
+
+
+class LoadBatchLazyAttribute(LoadLazyAttribute):
+    """serializable loader object used by BatchLazyLoader"""
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        key = self.key
+        instance_mapper = state.manager.mapper
+        prop = instance_mapper._props[key]
+        strategy = prop._get_strategy(BatchLazyLoader)
+
+        return strategy._load_for_state(state, passive)
+
+
 @properties.RelationshipProperty._strategy_for(dict(lazy="immediate"))
 class ImmediateLoader(AbstractRelationshipLoader):
     def init_class_attribute(self, mapper):
@@ -666,6 +889,9 @@ class ImmediateLoader(AbstractRelationshipLoader):
 
         return None, None, load_immediate
 
+    def _row_processor_cache_key(self, row, adapter):
+        return (self, )
+
 
 @log.class_logger
 @properties.RelationshipProperty._strategy_for(dict(lazy="subquery"))
@@ -897,6 +1123,8 @@ class SubqueryLoader(AbstractRelationshipLoader):
         q = q._conditional_options(*orig_query._with_options)
         if orig_query._populate_existing:
             q._populate_existing = orig_query._populate_existing
+        if orig_query._readonly:
+            q._readonly = True
 
         return q
 
@@ -987,6 +1215,238 @@ class SubqueryLoader(AbstractRelationshipLoader):
 
 
 
+@log.class_logger
+@properties.RelationshipProperty._strategy_for(dict(lazy="selectin"))
+class SelectInLoader(AbstractRelationshipLoader):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    using a SELECT against the related table, restricted by an IN of
+    the parent's join column values.  For a many-to-one the related
+    table is selected directly; otherwise it's joined to the parent
+    table.
+
+    Parent objects are collected as their rows are processed; once
+    a batch of rows is complete, the related objects are loaded for
+    all of them at once, in groups of at most ``chunksize`` parents.
+
+    """
+
+    chunksize = 500
+
+    def __init__(self, parent):
+        super(SelectInLoader, self).__init__(parent)
+        self.join_depth = self.parent_property.join_depth
+
+    def init_class_attribute(self, mapper):
+        self.parent_property.\
+                _get_strategy(LazyLoader).\
+                init_class_attribute(mapper)
+
+    def create_row_processor(self, context, path,
+                                    mapper, row, adapter):
+        if not self.parent.class_manager[self.key].impl.supports_population:
+            raise sa_exc.InvalidRequestError(
+                        "'%s' does not support object "
+                        "population - eager loading cannot be applied." %
+                        self)
+
+        if not context.query._enable_eagerloads:
+            return None, None, None
+
+        path = path[self.parent_property]
+
+        # the path from the leftmost entity, when this query is itself
+        # loading related objects on behalf of another
+        full_path = context.query._current_path + path \
+                    if context.query._current_path.path \
+                    else path
+
+        # if not via query option, check for
+        # a cycle
+        if not path.contains(context.attributes, "loaderstrategy"):
+            if self.join_depth:
+                if full_path.length / 2 > self.join_depth:
+                    return None, None, None
+            elif full_path.contains_mapper(self.mapper):
+                return None, None, None
+
+        local_cols = self.parent_property.local_columns
+        if adapter:
+            local_cols = [adapter.columns[c] for c in local_cols]
+
+        # parent states awaiting their related objects, along with
+        # the values of their join columns
+        pending = util.OrderedDict()
+
+        def load_for_pending(context):
+            if pending:
+                states = list(pending.items())
+                pending.clear()
+                self._load_for_states(context, path, full_path, states)
+        context.post_load.append(load_for_pending)
+
+        def collect_for_selectin(state, dict_, row):
+            pending[state] = tuple([row[col] for col in local_cols])
+
+        return collect_for_selectin, None, None
+
+    def _load_for_states(self, context, path, full_path, states):
+        with_poly_info = path.get(context.attributes,
+                                "path_with_polymorphic", None)
+        if with_poly_info is not None:
+            effective_entity = with_poly_info.entity
+        else:
+            effective_entity = self.mapper
+
+        orig_query = context.query
+        q, key_attr = self._selectin_query(orig_query.session,
+                                                effective_entity)
+
+        # propagate loader options etc. to the new query.
+        # these will fire relative to full_path.
+        q = q._with_current_path(full_path)
+        q = q._conditional_options(*orig_query._with_options)
+        if orig_query._populate_existing:
+            q._populate_existing = orig_query._populate_existing
+        if orig_query._readonly:
+            q._readonly = True
+
+        chunksize = path.get(context.attributes,
+                                "selectin_chunksize", self.chunksize)
+        collections = self._load_collections(q, key_attr,
+                                                states, chunksize)
+
+        if self.uselist:
+            self._populate_collections(states, collections)
+        else:
+            self._populate_scalars(states, collections)
+
+    @util.memoized_property
+    def _related_keys(self):
+        """For a many-to-one whose join condition only equates the
+        parent's columns to columns of the related table, the keys of the
+        related mapper's attributes corresponding to each of the parent's
+        join columns; otherwise None."""
+
+        prop = self.parent_property
+        if prop.direction is not interfaces.MANYTOONE or \
+                prop.secondary is not None:
+            return None
+
+        pairs = prop.local_remote_pairs
+        equated = set()
+        for elem in visitors.iterate(prop.primaryjoin, {}):
+            if isinstance(elem, expression.ColumnClause) or (
+                    isinstance(elem, expression.ClauseList) and
+                    elem.operator is operators.and_):
+                continue
+            elif not isinstance(elem, expression.BinaryExpression) or \
+                    elem.operator is not operators.eq:
+                return None
+            for idx, (local, remote) in enumerate(pairs):
+                if local.compare(elem.left) and \
+                        remote.compare(elem.right) or \
+                        local.compare(elem.right) and \
+                        remote.compare(elem.left):
+                    equated.add(idx)
+                    break
+            else:
+                return None
+        if len(equated) != len(pairs):
+            return None
+
+        remote_for_local = dict(pairs)
+        try:
+            return [
+                self.mapper._columntoproperty[remote_for_local[col]].key
+                for col in prop.local_columns
+            ]
+        except (KeyError, orm_exc.UnmappedColumnError):
+            return None
+
+    def _selectin_query(self, session, effective_entity):
+        """Return a Query for effective_entity, along with the attributes
+        whose values correspond to the parent's join columns, which are
+        also added as columns to the Query.
+
+        For a many-to-one, the related objects are selected directly,
+        so that each is fetched once no matter how many parents refer
+        to it; otherwise the related table is joined from an alias of
+        the parent."""
+
+        related_keys = self._related_keys
+        if related_keys is not None:
+            if effective_entity is self.mapper:
+                entity = self.mapper.class_
+            else:
+                entity = effective_entity
+            key_attr = [getattr(entity, key) for key in related_keys]
+            q = session.query(effective_entity, *key_attr)
+        else:
+            parent_alias = orm_util.AliasedClass(self.parent,
+                                    use_mapper_path=True)
+            key_attr = [
+                getattr(parent_alias, self.parent._columntoproperty[c].key)
+                for c in self.parent_property.local_columns
+            ]
+
+            attr = getattr(parent_alias, self.key)
+            if effective_entity is not self.mapper:
+                attr = attr.of_type(effective_entity)
+
+            q = session.query(effective_entity, *key_attr).\
+                        select_from(parent_alias).\
+                        join(attr)
+            q = q._enable_single_crit(False)
+
+        if self.parent_property.order_by:
+            q = q.order_by(*util.to_list(self.parent_property.order_by))
+        return q, key_attr
+
+    def _load_collections(self, q, key_attr, states, chunksize):
+        """Load the related objects for the given (state, join column
+        values) pairs, returning a dictionary of lists of related objects
+        keyed on join column values."""
+
+        keys = util.unique_list(
+                    key for state, key in states
+                    if not _none_set.issuperset(key))
+
+        collections = {}
+        for i in range(0, len(keys), chunksize):
+            chunk = keys[i:i + chunksize]
+            if len(key_attr) == 1:
+                crit = key_attr[0].in_([key[0] for key in chunk])
+            else:
+                crit = expression.or_(*[
+                            expression.and_(*[
+                                col_attr == value
+                                for col_attr, value in zip(key_attr, key)
+                            ])
+                            for key in chunk
+                        ])
+            for row in q.filter(crit):
+                collections.setdefault(tuple(row[1:]), []).append(row[0])
+        return collections
+
+    def _populate_collections(self, states, collections):
+        for state, key in states:
+            state.get_impl(self.key).\
+                    set_committed_value(state, state.dict,
+                            collections.get(key, ()))
+
+    def _populate_scalars(self, states, collections):
+        for state, key in states:
+            collection = collections.get(key, (None,))
+            if len(collection) > 1:
+                util.warn(
+                    "Multiple rows returned with "
+                    "uselist=False for eagerly-loaded attribute '%s' "
+                    % self)
+
+            state.get_impl(self.key).\
+                    set_committed_value(state, state.dict, collection[0])
+
+
 @log.class_logger
 @properties.RelationshipProperty._strategy_for(dict(lazy=False), dict(lazy="joined"))
 class JoinedLoader(AbstractRelationshipLoader):
@@ -1374,6 +1834,23 @@ class EagerJoinOption(PropertyOption):
             paths[-1].set(query._attributes, "eager_join_type", self.innerjoin)
 
 
+class SelectInChunksizeOption(PropertyOption):
+
+    def __init__(self, key, chunksize, chained=False):
+        super(SelectInChunksizeOption, self).__init__(key)
+        self.chunksize = chunksize
+        self.chained = chained
+
+    def process_query_property(self, query, paths):
+        if self.chained:
+            for path in paths:
+                path.set(query._attributes,
+                                "selectin_chunksize", self.chunksize)
+        else:
+            paths[-1].set(query._attributes,
+                                "selectin_chunksize", self.chunksize)
+
+
 class LoadEagerFromAliasOption(PropertyOption):
 
     def __init__(self, key, alias=None, chained=False):
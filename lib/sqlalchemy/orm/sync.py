@@ -44,6 +44,26 @@ def populate(source, source_mapper, dest, dest_mapper,
             uowcommit.attributes[("pk_cascaded", dest, r)] = True
 
 
+def populate_inherit_keys_dict(dict_, mapper, synchronize_pairs):
+    """Copy primary key values between the tables of an inheriting
+    mapper within a plain dictionary, as used by bulk inserts."""
+
+    for l, r in synchronize_pairs:
+        try:
+            prop = mapper._columntoproperty[l]
+        except exc.UnmappedColumnError:
+            _raise_col_to_prop(False, mapper, l, mapper, r)
+        if prop.key not in dict_:
+            continue
+        value = dict_[prop.key]
+
+        try:
+            prop = mapper._columntoproperty[r]
+        except exc.UnmappedColumnError:
+            _raise_col_to_prop(True, mapper, l, mapper, r)
+        dict_[prop.key] = value
+
+
 def clear(dest, dest_mapper, synchronize_pairs):
     for l, r in synchronize_pairs:
         if r.primary_key:
@@ -111,6 +111,14 @@ class Executable(Generative):
             )
         self._execution_options = self._execution_options.union(kw)
 
+    @property
+    def _execution_options_key(self):
+        """Return the statement-level execution options as a component
+        of a structural cache key; a compiled statement carries the
+        options of the statement it was compiled from."""
+
+        return tuple(sorted(self._execution_options.items()))
+
     def execute(self, *multiparams, **params):
         """Compile and execute this :class:`.Executable`."""
         e = self.bind
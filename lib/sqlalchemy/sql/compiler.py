@@ -422,6 +422,30 @@ class SQLCompiler(Compiled):
                  if value is not None
             )
 
+    @util.memoized_property
+    def _bind_param_plan(self):
+        """A list of (bindparam, name, key, required) for each bound
+        parameter, established once for use by construct_params()."""
+
+        return [(bindparam, name, bindparam.key, bindparam.required)
+                for bindparam, name in self.bind_names.items()]
+
+    @util.memoized_property
+    def _positional_processors(self):
+        """A list of (name, processor) for each element of
+        ``positiontup``, where processor is None for those parameters
+        that have no bind processor."""
+
+        processors = self._bind_processors
+        return [(name, processors.get(name)) for name in self.positiontup]
+
+    @util.memoized_property
+    def _keyed_processors(self):
+        """A list of (name, processor) for each bound parameter that has
+        a bind processor."""
+
+        return list(self._bind_processors.items())
+
     def is_subquery(self):
         return len(self.stack) > 1
 
@@ -429,45 +453,90 @@ class SQLCompiler(Compiled):
     def sql_compiler(self):
         return self
 
-    def construct_params(self, params=None, _group_number=None, _check=True):
-        """return a dictionary of bind parameter keys and values"""
+    def construct_params(self, params=None, _group_number=None, _check=True,
+                                extracted_parameters=None):
+        """return a dictionary of bind parameter keys and values
+
+        :param extracted_parameters: a list of :class:`.BindParameter`
+         objects, as produced by :meth:`.ClauseElement._generate_cache_key`
+         against a statement that is structurally equivalent to the one
+         from which this :class:`.SQLCompiler` was compiled.  The values
+         of these parameters take the place of those embedded in the
+         compiled statement.
+
+        """
+
+        if extracted_parameters:
+            resolved = self._resolve_extracted_parameters(
+                                            extracted_parameters)
+        else:
+            resolved = None
 
         if params:
             pd = {}
-            for bindparam, name in self.bind_names.items():
-                if bindparam.key in params:
-                    pd[name] = params[bindparam.key]
+            for bindparam, name, key, required in self._bind_param_plan:
+                if key in params:
+                    pd[name] = params[key]
                 elif name in params:
                     pd[name] = params[name]
-                elif _check and bindparam.required:
+                elif _check and required:
                     if _group_number:
                         raise exc.InvalidRequestError(
                             "A value is required for bind parameter %r, "
                             "in parameter group %d" %
-                            (bindparam.key, _group_number))
+                            (key, _group_number))
                     else:
                         raise exc.InvalidRequestError(
                             "A value is required for bind parameter %r"
-                            % bindparam.key)
+                            % key)
+                elif resolved and bindparam in resolved:
+                    pd[name] = resolved[bindparam].effective_value
                 else:
                     pd[name] = bindparam.effective_value
             return pd
         else:
             pd = {}
-            for bindparam in self.bind_names:
-                if _check and bindparam.required:
+            for bindparam, name, key, required in self._bind_param_plan:
+                if _check and required:
                     if _group_number:
                         raise exc.InvalidRequestError(
                             "A value is required for bind parameter %r, "
                             "in parameter group %d" %
-                            (bindparam.key, _group_number))
+                            (key, _group_number))
                     else:
                         raise exc.InvalidRequestError(
                             "A value is required for bind parameter %r"
-                            % bindparam.key)
-                pd[self.bind_names[bindparam]] = bindparam.effective_value
+                            % key)
+                if resolved and bindparam in resolved:
+                    pd[name] = resolved[bindparam].effective_value
+                else:
+                    pd[name] = bindparam.effective_value
             return pd
 
+    _cache_key_bind_positions = None
+    """Mapping of the identifying keys of the bound parameters in
+    the statement this object was compiled from to their positions
+    within that statement's structural cache key.
+
+    This is established by :class:`.Connection` when the compiled
+    object is placed into a ``compiled_cache`` under a structural key.
+
+    """
+
+    def _resolve_extracted_parameters(self, extracted_parameters):
+        """Match the :class:`.BindParameter` objects of this compiled
+        statement to those of an equivalent statement."""
+
+        positions = self._cache_key_bind_positions
+        if positions is None:
+            return None
+        resolved = {}
+        for bindparam in self.bind_names:
+            idx = positions.get(bindparam._identifying_key)
+            if idx is not None:
+                resolved[bindparam] = extracted_parameters[idx]
+        return resolved
+
     @property
     def params(self):
         """Return the bind param dictionary embedded into this
@@ -545,28 +614,44 @@ class SQLCompiler(Compiled):
                 column.type
             )
 
+        table = column.table
+        if table is None or not include_table or not table.named_with_column:
+            if is_literal:
+                return self.escape_literal_column(name)
+            else:
+                return self.preparer.quote(name, column.quote)
+
+        # the qualified name of a table-bound column is memoized on the
+        # column for the most recently used preparer, when neither the
+        # column nor the table name is subject to truncation
+        preparer = self.preparer
+        memo = column._compiled_name
+        if memo is not None and memo[0] is preparer:
+            return memo[1]
+
         if is_literal:
             name = self.escape_literal_column(name)
         else:
-            name = self.preparer.quote(name, column.quote)
+            name = preparer.quote(name, column.quote)
 
-        table = column.table
-        if table is None or not include_table or not table.named_with_column:
-            return name
+        if table.schema:
+            schema_prefix = preparer.quote_schema(
+                                table.schema,
+                                table.quote_schema) + '.'
         else:
-            if table.schema:
-                schema_prefix = self.preparer.quote_schema(
-                                    table.schema,
-                                    table.quote_schema) + '.'
-            else:
-                schema_prefix = ''
-            tablename = table.name
-            if isinstance(tablename, elements._truncated_label):
-                tablename = self._truncated_identifier("alias", tablename)
+            schema_prefix = ''
+        tablename = table.name
+        if isinstance(tablename, elements._truncated_label):
+            tablename = self._truncated_identifier("alias", tablename)
+            memoize = False
+        else:
+            memoize = not isinstance(orig_name, elements._truncated_label)
 
-            return schema_prefix + \
-                    self.preparer.quote(tablename, table.quote) + \
+        name = schema_prefix + preparer.quote(tablename, table.quote) + \
                     "." + name
+        if memoize:
+            column._compiled_name = (preparer, name)
+        return name
 
     def escape_literal_column(self, text):
         """provide escaping for the literal_column() construct."""
@@ -1573,13 +1658,19 @@ class SQLCompiler(Compiled):
     def visit_table(self, table, asfrom=False, iscrud=False, ashint=False,
                         fromhints=None, **kwargs):
         if asfrom or ashint:
-            if getattr(table, "schema", None):
-                ret = self.preparer.quote_schema(table.schema,
-                                table.quote_schema) + \
-                                "." + self.preparer.quote(table.name,
-                                                table.quote)
+            preparer = self.preparer
+            memo = table._compiled_name
+            if memo is not None and memo[0] is preparer:
+                ret = memo[1]
             else:
-                ret = self.preparer.quote(table.name, table.quote)
+                if getattr(table, "schema", None):
+                    ret = preparer.quote_schema(table.schema,
+                                    table.quote_schema) + \
+                                    "." + preparer.quote(table.name,
+                                                    table.quote)
+                else:
+                    ret = preparer.quote(table.name, table.quote)
+                table._compiled_name = (preparer, ret)
             if fromhints and table in fromhints:
                 ret = self.format_from_hint_text(ret, table,
                                     fromhints[table], iscrud)
@@ -9,7 +9,8 @@ Provide :class:`.Insert`, :class:`.Update` and :class:`.Delete`.
 """
 
 from .base import Executable, _generative, _from_objects
-from .elements import ClauseElement, _literal_as_text, Null, and_, _clone
+from .elements import ClauseElement, _literal_as_text, Null, and_, _clone, \
+        _column_as_key, _cache_key_tuple
 from .selectable import _interpret_as_from, _interpret_as_select, HasPrefixes
 from .. import util
 from .. import exc
@@ -49,6 +50,41 @@ class UpdateBase(HasPrefixes, Executable, ClauseElement):
         else:
             return process_single(parameters), False
 
+    @util.dependencies("sqlalchemy.sql.schema")
+    def _update_base_cache_key(self, schema, anon_map, bindparams):
+        """Return the cache key components common to INSERT, UPDATE
+        and DELETE constructs, or ``None`` if the statement can't be
+        cached."""
+
+        # the compiled form of a statement refers to the columns of
+        # its table when locating primary keys and defaults, so only
+        # statements against a schema-level Table may share it.
+        if self._hints or \
+                not isinstance(self.table, schema.Table):
+            return None
+
+        returning = self._returning
+        if returning:
+            returning = _cache_key_tuple(returning, anon_map, bindparams)
+            if returning is None:
+                return None
+
+        prefixes = []
+        for prefix, dialect_name in self._prefixes:
+            key = prefix._cache_key(anon_map, bindparams)
+            if key is None:
+                return None
+            prefixes.append((key, dialect_name))
+
+        try:
+            kwargs = tuple(sorted(self.kwargs.items()))
+            hash(kwargs)
+        except TypeError:
+            return None
+
+        return (self.__class__, self.table._deannotate(), returning,
+                    tuple(prefixes), kwargs, self._execution_options_key)
+
     def params(self, *arg, **kw):
         """Set the parameters for the statement.
 
@@ -164,6 +200,30 @@ class ValuesBase(UpdateBase):
         if prefixes:
             self._setup_prefixes(prefixes)
 
+    def _values_cache_key(self, anon_map, bindparams):
+        """Return a cache key for the VALUES / SET parameters of this
+        statement.
+
+        Plain Python values given to :meth:`.values` are rendered into
+        the compiled statement as bound parameters created at compile
+        time; statements which include them aren't cached.
+
+        """
+        if self._has_multi_parameters:
+            return None
+        if not self.parameters:
+            return ()
+        keys = []
+        for col, value in sorted(self.parameters.items(),
+                        key=lambda item: _column_as_key(item[0])):
+            if not isinstance(value, ClauseElement):
+                return None
+            value = value._cache_key(anon_map, bindparams)
+            if value is None:
+                return None
+            keys.append((_column_as_key(col), value))
+        return tuple(keys)
+
     @_generative
     def values(self, *args, **kwargs):
         """specify a fixed VALUES clause for an INSERT statement, or the SET
@@ -379,6 +439,75 @@ class Insert(ValuesBase):
         else:
             return ()
 
+    def _cache_key(self, anon_map, bindparams):
+        base = self._update_base_cache_key(anon_map, bindparams)
+        if base is None:
+            return None
+        values = self._values_cache_key(anon_map, bindparams)
+        if values is None:
+            return None
+        if self.select is not None:
+            select = self.select._cache_key(anon_map, bindparams)
+            if select is None:
+                return None
+        else:
+            select = None
+        return base + (self.inline, values, select)
+
+    def _multivalues_chunk_keys(self):
+        """Return the column keys of a multiple-VALUES INSERT, if every
+        row names the same columns with plain Python values, else ``None``.
+
+        Only a statement of this form may be executed as a series of
+        chunk-shaped statements, where each row's values are passed as
+        execution-time parameters.
+
+        """
+        if not self._has_multi_parameters or \
+                self.select is not None or \
+                self._returning:
+            return None
+
+        first = self.parameters[0]
+        for row in self.parameters:
+            if len(row) != len(first):
+                return None
+            for key, value in row.items():
+                if key not in first or isinstance(value, ClauseElement):
+                    return None
+        return [_column_as_key(key) for key in first]
+
+    def _multivalues_chunk(self, rows):
+        """Return a copy of this multiple-VALUES INSERT which
+        inserts the given rows."""
+
+        s = self._generate()
+        s.parameters = rows
+        return s
+
+    def _multivalues_chunk_params(self, rows):
+        """Return the execution parameters which supply the given rows to
+        the compiled form of a chunk of the same number of rows."""
+
+        params = {}
+        for idx, row in enumerate(rows):
+            for key, value in row.items():
+                params["%s_%d" % (_column_as_key(key), idx)] = value
+        return params
+
+    def _multivalues_chunk_cache_key(self):
+        """Return a key identifying the compiled form of this chunk of
+        a multiple-VALUES INSERT, which is the same for any rows of the
+        same number and column keys, or ``None`` if it can't be cached."""
+
+        bindparams = []
+        base = self._update_base_cache_key({}, bindparams)
+        if base is None or bindparams:
+            return None
+        return base + (
+            'multivalues', tuple(self._multivalues_chunk_keys()),
+            len(self.parameters))
+
     @_generative
     def from_select(self, names, select):
         """Return a new :class:`.Insert` construct which represents
@@ -566,6 +695,21 @@ class Update(ValuesBase):
         else:
             return ()
 
+    def _cache_key(self, anon_map, bindparams):
+        base = self._update_base_cache_key(anon_map, bindparams)
+        if base is None:
+            return None
+        values = self._values_cache_key(anon_map, bindparams)
+        if values is None:
+            return None
+        if self._whereclause is not None:
+            where = self._whereclause._cache_key(anon_map, bindparams)
+            if where is None:
+                return None
+        else:
+            where = None
+        return base + (self.inline, values, where)
+
     def _copy_internals(self, clone=_clone, **kw):
         # TODO: coverage
         self._whereclause = clone(self._whereclause, **kw)
@@ -652,6 +796,18 @@ class Delete(UpdateBase):
         else:
             return ()
 
+    def _cache_key(self, anon_map, bindparams):
+        base = self._update_base_cache_key(anon_map, bindparams)
+        if base is None:
+            return None
+        if self._whereclause is not None:
+            where = self._whereclause._cache_key(anon_map, bindparams)
+            if where is None:
+                return None
+        else:
+            where = None
+        return base + (where, )
+
     @_generative
     def where(self, whereclause):
         """Add the given WHERE clause to a newly returned delete construct."""
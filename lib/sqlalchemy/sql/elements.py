@@ -259,6 +259,7 @@ class ClauseElement(Visitable):
     def __getstate__(self):
         d = self.__dict__.copy()
         d.pop('_is_clone_of', None)
+        d.pop('_compiled_name', None)
         return d
 
     def _annotate(self, values):
@@ -358,6 +359,37 @@ class ClauseElement(Visitable):
         """
         pass
 
+    def _cache_key(self, anon_map, bindparams):
+        """Return a hashable structural key for this
+        :class:`.ClauseElement`, or ``None`` if this element can't be
+        cached.
+
+        Two elements which return equal keys are expected to compile to
+        the same SQL string and result structure; the values of literal
+        bound parameters don't take part in the key, and instead the
+        :class:`.BindParameter` objects encountered are appended to the
+        given ``bindparams`` list in traversal order.  ``anon_map``
+        is a dictionary used to assign statement-local ordinals to
+        anonymously named objects.
+
+        """
+        return None
+
+    def _generate_cache_key(self):
+        """Return a tuple ``(key, bindparams)`` for this
+        :class:`.ClauseElement`, or ``None`` if no structural cache key
+        can be produced.
+
+        This is used by :class:`.Connection` to locate an already compiled
+        form of an equivalent statement within the ``compiled_cache``.
+
+        """
+        bindparams = []
+        key = self._cache_key({}, bindparams)
+        if key is None:
+            return None
+        return key, bindparams
+
     def get_children(self, **kwargs):
         """Return immediate child elements of this :class:`.ClauseElement`.
 
@@ -836,6 +868,17 @@ class BindParameter(ColumnElement):
                     or 'param'))
         return c
 
+    def _cache_key(self, anon_map, bindparams):
+        bindparams.append(self)
+        return (
+            BindParameter,
+            _cache_key_name(self.key, anon_map),
+            self.type._static_cache_key,
+            self.required,
+            self.isoutparam,
+            self.quote
+        )
+
     def _convert_to_unique(self):
         if not self.unique:
             self.unique = True
@@ -878,6 +921,9 @@ class TypeClause(ClauseElement):
     def __init__(self, type):
         self.type = type
 
+    def _cache_key(self, anon_map, bindparams):
+        return (TypeClause, self.type._static_cache_key)
+
 
 class TextClause(Executable, ClauseElement):
     """Represent a literal SQL text fragment.
@@ -1053,6 +1099,21 @@ class TextClause(Executable, ClauseElement):
         self.bindparams = dict((b.key, clone(b, **kw))
                                for b in self.bindparams.values())
 
+    def _cache_key(self, anon_map, bindparams):
+        if self.typemap:
+            typemap = tuple(
+                        (k, type_api.to_instance(v)._static_cache_key)
+                        for k, v in sorted(self.typemap.items()))
+        else:
+            typemap = None
+        binds = _cache_key_tuple(
+                    [self.bindparams[k] for k in sorted(self.bindparams)],
+                    anon_map, bindparams)
+        if binds is None:
+            return None
+        return (TextClause, self.text, typemap, binds,
+                    self._execution_options_key)
+
     def get_children(self, **kwargs):
         return list(self.bindparams.values())
 
@@ -1073,6 +1134,9 @@ class Null(ColumnElement):
     def compare(self, other):
         return isinstance(other, Null)
 
+    def _cache_key(self, anon_map, bindparams):
+        return (Null, )
+
 
 class False_(ColumnElement):
     """Represent the ``false`` keyword in a SQL statement.
@@ -1090,6 +1154,9 @@ class False_(ColumnElement):
     def compare(self, other):
         return isinstance(other, False_)
 
+    def _cache_key(self, anon_map, bindparams):
+        return (False_, )
+
 class True_(ColumnElement):
     """Represent the ``true`` keyword in a SQL statement.
 
@@ -1106,6 +1173,9 @@ class True_(ColumnElement):
     def compare(self, other):
         return isinstance(other, True_)
 
+    def _cache_key(self, anon_map, bindparams):
+        return (True_, )
+
 
 class ClauseList(ClauseElement):
     """Describe a list of clauses, separated by an operator.
@@ -1155,6 +1225,16 @@ class ClauseList(ClauseElement):
     def get_children(self, **kwargs):
         return self.clauses
 
+    def _cache_key(self, anon_map, bindparams):
+        clauses = _cache_key_tuple(self.clauses, anon_map, bindparams)
+        if clauses is None:
+            return None
+        type_ = getattr(self, 'type', None)
+        if type_ is not None:
+            type_ = type_._static_cache_key
+        return (self._constructor, self.operator, self.group, type_) + \
+                    clauses
+
     @property
     def _from_objects(self):
         return list(itertools.chain(*[c._from_objects for c in self.clauses]))
@@ -1342,6 +1422,17 @@ class Case(ColumnElement):
         if self.else_ is not None:
             self.else_ = clone(self.else_, **kw)
 
+    def _cache_key(self, anon_map, bindparams):
+        elements = [elem for elem in (self.value, self.else_)
+                            if elem is not None]
+        for when in self.whens:
+            elements.extend(when)
+        key = _cache_key_tuple(elements, anon_map, bindparams)
+        if key is None:
+            return None
+        return (Case, self.value is not None, self.else_ is not None,
+                    len(self.whens), self.type._static_cache_key) + key
+
     def get_children(self, **kwargs):
         if self.value is not None:
             yield self.value
@@ -1415,6 +1506,12 @@ class Cast(ColumnElement):
     def get_children(self, **kwargs):
         return self.clause, self.typeclause
 
+    def _cache_key(self, anon_map, bindparams):
+        clause = self.clause._cache_key(anon_map, bindparams)
+        if clause is None:
+            return None
+        return (Cast, self.type._static_cache_key, clause)
+
     @property
     def _from_objects(self):
         return self.clause._from_objects
@@ -1443,6 +1540,12 @@ class Extract(ColumnElement):
     def get_children(self, **kwargs):
         return self.expr,
 
+    def _cache_key(self, anon_map, bindparams):
+        expr = self.expr._cache_key(anon_map, bindparams)
+        if expr is None:
+            return None
+        return (Extract, self.field, expr)
+
     @property
     def _from_objects(self):
         return self.expr._from_objects
@@ -1565,6 +1668,13 @@ class UnaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _cache_key(self, anon_map, bindparams):
+        element = self.element._cache_key(anon_map, bindparams)
+        if element is None:
+            return None
+        return (self._constructor, self.operator, self.modifier,
+                    self.type._static_cache_key, element)
+
     def compare(self, other, **kw):
         """Compare this :class:`UnaryExpression` against the given
         :class:`.ClauseElement`."""
@@ -1652,6 +1762,20 @@ class BinaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.left, self.right
 
+    def _cache_key(self, anon_map, bindparams):
+        left = self.left._cache_key(anon_map, bindparams)
+        if left is None:
+            return None
+        right = self.right._cache_key(anon_map, bindparams)
+        if right is None:
+            return None
+        if self.modifiers:
+            modifiers = tuple(sorted(self.modifiers.items()))
+        else:
+            modifiers = None
+        return (BinaryExpression, self.operator, modifiers,
+                    self.type._static_cache_key, left, right)
+
     def compare(self, other, **kw):
         """Compare this :class:`BinaryExpression` against the
         given :class:`BinaryExpression`."""
@@ -1710,6 +1834,12 @@ class Grouping(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _cache_key(self, anon_map, bindparams):
+        element = self.element._cache_key(anon_map, bindparams)
+        if element is None:
+            return None
+        return (self._constructor, self.type._static_cache_key, element)
+
     @property
     def _from_objects(self):
         return self.element._from_objects
@@ -1787,6 +1917,13 @@ class Over(ColumnElement):
                 (self.func, self.partition_by, self.order_by)
                 if c is not None]
 
+    def _cache_key(self, anon_map, bindparams):
+        key = _cache_key_tuple(self.get_children(), anon_map, bindparams)
+        if key is None:
+            return None
+        return (Over, self.partition_by is not None,
+                    self.order_by is not None) + key
+
     def _copy_internals(self, clone=_clone, **kw):
         self.func = clone(self.func, **kw)
         if self.partition_by is not None:
@@ -1878,6 +2015,13 @@ class Label(ColumnElement):
     def _copy_internals(self, clone=_clone, **kw):
         self.element = clone(self.element, **kw)
 
+    def _cache_key(self, anon_map, bindparams):
+        element = self.element._cache_key(anon_map, bindparams)
+        if element is None:
+            return None
+        return (Label, _cache_key_name(self.name, anon_map),
+                    self.quote, self.type._static_cache_key, element)
+
     @property
     def _from_objects(self):
         return self.element._from_objects
@@ -1939,6 +2083,10 @@ class ColumnClause(Immutable, ColumnElement):
 
     onupdate = default = server_default = server_onupdate = None
 
+    _compiled_name = None
+    """A tuple of the :class:`.IdentifierPreparer` most recently used to
+    compile this column with its table, and the resulting string."""
+
     _memoized_property = util.group_expirable_memoized_property()
 
     def __init__(self, text, type_=None, is_literal=False, _selectable=None):
@@ -1981,6 +2129,17 @@ class ColumnClause(Immutable, ColumnElement):
         else:
             return other.proxy_set.intersection(self.proxy_set)
 
+    def _cache_key(self, anon_map, bindparams):
+        if self.table is not None:
+            table = self.table._from_cache_key(anon_map, bindparams)
+            if table is None:
+                return None
+        else:
+            table = None
+        return (self._constructor, _cache_key_name(self.name, anon_map),
+                    self.quote, self.is_literal,
+                    self.type._static_cache_key, table)
+
     def _get_table(self):
         return self.__dict__['table']
 
@@ -2152,6 +2311,41 @@ def _string_or_unprintable(element):
             return "unprintable element %r" % element
 
 
+_anon_ident = re.compile(r'%\((\d+) ')
+
+
+def _cache_key_name(name, anon_map):
+    """Return a cache key component for the given name.
+
+    The object identifiers embedded within anonymous names are
+    replaced with ordinals local to the statement being keyed, so
+    that equivalent statements produce the same key.
+
+    """
+    if isinstance(name, _anonymous_label):
+        return (_anonymous_label, _anon_ident.sub(
+                    lambda m: '%%(%d ' % anon_map.setdefault(
+                                            m.group(1), len(anon_map)),
+                    name))
+    elif isinstance(name, _truncated_label):
+        return (_truncated_label, name)
+    else:
+        return name
+
+
+def _cache_key_tuple(elements, anon_map, bindparams):
+    """Return a tuple of the cache keys of the given elements, or
+    ``None`` if any of them can't be cached."""
+
+    keys = []
+    for elem in elements:
+        key = elem._cache_key(anon_map, bindparams)
+        if key is None:
+            return None
+        keys.append(key)
+    return tuple(keys)
+
+
 def _expand_cloned(elements):
     """expand the given set of ClauseElements to be the set of all 'cloned'
     predecessors.
@@ -111,6 +111,15 @@ class FunctionElement(Executable, ColumnElement, FromClause):
         self._reset_exported()
         FunctionElement.clauses._reset(self)
 
+    def _cache_key(self, anon_map, bindparams):
+        clause_expr = self.clause_expr._cache_key(anon_map, bindparams)
+        if clause_expr is None:
+            return None
+        return (self._constructor, getattr(self, 'name', None),
+                    tuple(getattr(self, 'packagenames', ())),
+                    self.type._static_cache_key,
+                    self._execution_options_key, clause_expr)
+
     def select(self):
         """Produce a :func:`~.expression.select` construct
         against this :class:`.FunctionElement`.
@@ -428,6 +437,9 @@ class next_value(GenericFunction):
         self._bind = kw.get('bind', None)
         self.sequence = seq
 
+    def _cache_key(self, anon_map, bindparams):
+        return (next_value, self.sequence, self._execution_options_key)
+
     @property
     def _from_objects(self):
         return []
@@ -583,6 +583,9 @@ class Table(SchemaItem, TableClause):
             else:
                 return []
 
+    def _cache_key(self, anon_map, bindparams):
+        return (self._deannotate(), )
+
     def exists(self, bind=None):
         """Return True if this table exists."""
 
@@ -1176,6 +1179,12 @@ class Column(SchemaItem, ColumnClause):
         else:
             return ColumnClause.get_children(self, **kwargs)
 
+    def _cache_key(self, anon_map, bindparams):
+        if isinstance(self.table, Table):
+            return (self._deannotate(), )
+        else:
+            return ColumnClause._cache_key(self, anon_map, bindparams)
+
 
 class ForeignKey(SchemaItem):
     """Defines a dependency between two columns.
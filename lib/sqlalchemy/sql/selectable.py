@@ -14,7 +14,8 @@ from .elements import ClauseElement, TextClause, ClauseList, \
 from .elements import _clone, \
         _literal_as_text, _interpret_as_column_or_from, _expand_cloned,\
         _select_iterables, _anonymous_label, _clause_element_as_expr,\
-        _cloned_intersection, _cloned_difference
+        _cloned_intersection, _cloned_difference, _cache_key_name, \
+        _cache_key_tuple
 from .base import Immutable, Executable, _generative, \
             ColumnCollection, ColumnSet, _from_objects, Generative
 from . import type_api
@@ -140,6 +141,24 @@ class FromClause(Selectable):
     schema = None
     _memoized_property = util.group_expirable_memoized_property(["_columns"])
 
+    def _from_cache_key(self, anon_map, bindparams):
+        """Return the cache key of this :class:`.FromClause` when
+        referenced from within a statement.
+
+        The full key is produced the first time a given FROM object is
+        encountered; subsequent references to the same object, typically
+        from the columns which it provides, refer to it by ordinal.
+
+        """
+        idx = anon_map.get(id(self))
+        if idx is not None:
+            return ('from', idx)
+        key = self._cache_key(anon_map, bindparams)
+        if key is None:
+            return None
+        anon_map[id(self)] = len(anon_map)
+        return key
+
     @util.dependencies("sqlalchemy.sql.functions")
     def count(self, functions, whereclause=None, **params):
         """return a SELECT COUNT generated against this
@@ -550,6 +569,18 @@ class Join(FromClause):
     def get_children(self, **kwargs):
         return self.left, self.right, self.onclause
 
+    def _cache_key(self, anon_map, bindparams):
+        left = self.left._from_cache_key(anon_map, bindparams)
+        if left is None:
+            return None
+        right = self.right._from_cache_key(anon_map, bindparams)
+        if right is None:
+            return None
+        onclause = self.onclause._cache_key(anon_map, bindparams)
+        if onclause is None:
+            return None
+        return (Join, self.isouter, left, right, onclause)
+
     def _match_primaries(self, left, right):
         if isinstance(left, Join):
             left_right = left.right
@@ -889,6 +920,13 @@ class Alias(FromClause):
                 yield c
         yield self.element
 
+    def _cache_key(self, anon_map, bindparams):
+        element = self.element._from_cache_key(anon_map, bindparams)
+        if element is None:
+            return None
+        return (self._constructor, _cache_key_name(self.name, anon_map),
+                    self.quote, element)
+
     @property
     def _from_objects(self):
         return [self]
@@ -920,6 +958,11 @@ class CTE(Alias):
         self._restates = _restates
         super(CTE, self).__init__(selectable, name=name)
 
+    def _cache_key(self, anon_map, bindparams):
+        # CTEs are rendered by name at the top of the enclosing
+        # statement, which isn't represented here.
+        return None
+
     def alias(self, name=None, flat=False):
         return CTE(
             self.original,
@@ -985,6 +1028,12 @@ class FromGrouping(FromClause):
     def _copy_internals(self, clone=_clone, **kw):
         self.element = clone(self.element, **kw)
 
+    def _cache_key(self, anon_map, bindparams):
+        element = self.element._from_cache_key(anon_map, bindparams)
+        if element is None:
+            return None
+        return (FromGrouping, element)
+
     @property
     def _from_objects(self):
         return self.element._from_objects
@@ -1038,6 +1087,10 @@ class TableClause(Immutable, FromClause):
     _autoincrement_column = None
     """No PK or default support so no autoincrement column."""
 
+    _compiled_name = None
+    """A tuple of the :class:`.IdentifierPreparer` most recently used to
+    compile this table in a FROM clause, and the resulting string."""
+
     def __init__(self, name, *columns):
         """Produce a new :class:`.TableClause`.
 
@@ -1086,6 +1139,11 @@ class TableClause(Immutable, FromClause):
         else:
             return []
 
+    def _cache_key(self, anon_map, bindparams):
+        return (self._constructor, self.name, self.quote) + tuple(
+                    (c.key, c.name, c.type._static_cache_key)
+                    for c in self.c)
+
     @util.dependencies("sqlalchemy.sql.functions")
     def count(self, functions, whereclause=None, **params):
         """return a SELECT COUNT generated against this
@@ -1189,6 +1247,20 @@ class SelectBase(Executable, FromClause):
         if group_by is not None:
             self._group_by_clause = ClauseList(*util.to_list(group_by))
 
+    def _select_base_cache_key(self, anon_map, bindparams):
+        """Return the cache key components common to :class:`.Select`
+        and :class:`.CompoundSelect`."""
+
+        clauses = _cache_key_tuple(
+                        [clause for clause in
+                            (self._order_by_clause, self._group_by_clause)
+                            if clause is not None],
+                        anon_map, bindparams)
+        if clauses is None:
+            return None
+        return (self.use_labels, self.for_update, self._limit,
+                    self._offset, self._execution_options_key) + clauses
+
     def as_scalar(self):
         """return a 'scalar' representation of this selectable, which can be
         used as a column expression.
@@ -1673,6 +1745,16 @@ class CompoundSelect(SelectBase):
             + [self._order_by_clause, self._group_by_clause] \
             + list(self.selects)
 
+    def _cache_key(self, anon_map, bindparams):
+        selects = _cache_key_tuple(self.selects, anon_map, bindparams)
+        if selects is None:
+            return None
+        base = self._select_base_cache_key(anon_map, bindparams)
+        if base is None:
+            return None
+        return (CompoundSelect, self.keyword, self._auto_correlate,
+                    selects) + base
+
     def bind(self):
         if self._bind:
             return self._bind
@@ -2151,6 +2233,61 @@ class Select(HasPrefixes, SelectBase):
                     self._order_by_clause, self._group_by_clause)
             if x is not None]
 
+    def _cache_key(self, anon_map, bindparams):
+        # explicit correlation and hints refer to FROM objects
+        # by identity in unordered collections; don't cache these.
+        if self._hints or self._correlate or self._correlate_except:
+            return None
+
+        columns = []
+        for c in self._raw_columns:
+            if isinstance(c, FromClause):
+                key = c._from_cache_key(anon_map, bindparams)
+            else:
+                key = c._cache_key(anon_map, bindparams)
+            if key is None:
+                return None
+            columns.append(key)
+
+        froms = []
+        for f in self._from_obj:
+            if isinstance(f, FromClause):
+                key = f._from_cache_key(anon_map, bindparams)
+            else:
+                key = f._cache_key(anon_map, bindparams)
+            if key is None:
+                return None
+            froms.append(key)
+
+        criteria = []
+        for clause in (self._whereclause, self._having):
+            if clause is not None:
+                clause = clause._cache_key(anon_map, bindparams)
+                if clause is None:
+                    return None
+            criteria.append(clause)
+
+        if isinstance(self._distinct, (list, tuple)):
+            distinct = _cache_key_tuple(self._distinct, anon_map, bindparams)
+            if distinct is None:
+                return None
+        else:
+            distinct = self._distinct
+
+        prefixes = []
+        for prefix, dialect_name in self._prefixes:
+            key = prefix._cache_key(anon_map, bindparams)
+            if key is None:
+                return None
+            prefixes.append((key, dialect_name))
+
+        base = self._select_base_cache_key(anon_map, bindparams)
+        if base is None:
+            return None
+
+        return (Select, self._auto_correlate, distinct, tuple(prefixes),
+                    tuple(columns), tuple(froms)) + tuple(criteria) + base
+
     @_generative
     def column(self, column):
         """return a new select() construct with the given column expression
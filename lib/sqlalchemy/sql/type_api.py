@@ -177,6 +177,26 @@ class TypeEngine(Visitable):
         return self.__class__.bind_expression.__code__ \
             is not TypeEngine.bind_expression.__code__
 
+    @util.memoized_property
+    def _static_cache_key(self):
+        """memoized hashable value identifying the configuration of
+        this type, for use in the cache key of a SQL construct.
+
+        Two type objects of the same class with the same public
+        attribute values produce the same key; types whose state can't be
+        hashed are identified by the type object itself.
+
+        """
+        key = (self.__class__, ) + tuple(
+                    (k, v) for k, v in sorted(self.__dict__.items())
+                    if not k.startswith('_'))
+        try:
+            hash(key)
+        except TypeError:
+            return self
+        else:
+            return key
+
     def compare_values(self, x, y):
         """Compare two values for equality."""
 
@@ -441,6 +461,13 @@ class UserDefinedType(TypeEngine):
 
     comparator_factory = Comparator
 
+    @property
+    def _static_cache_key(self):
+        # state which affects SQL rendering or value processing
+        # may be held anywhere on a user-defined type; identify
+        # it by the type object itself.
+        return self
+
     def coerce_compared_value(self, op, value):
         """Suggest a type for a 'coerced' Python value in an expression.
 
@@ -724,6 +751,13 @@ class TypeDecorator(TypeEngine):
 
         raise NotImplementedError()
 
+    @property
+    def _static_cache_key(self):
+        # state which affects SQL rendering or value processing
+        # may be held anywhere on a user-defined type; identify
+        # it by the type object itself.
+        return self
+
     @util.memoized_property
     def _has_bind_processor(self):
         """memoized boolean, check if process_bind_param is implemented.
@@ -178,6 +178,20 @@ class SuiteRequirements(Requirements):
                     "Backend does not support multirow inserts."
                 )
 
+    @property
+    def multivalues_insert_returning(self):
+        """target database returns RETURNING rows for a multiple VALUES
+        INSERT in the order of the VALUES clauses.
+
+        Tests must enable the ``multivalues_insert_returning``
+        option on their own engine."""
+
+        return exclusions.only_if(
+                lambda: self.config.db.dialect.implicit_returning and
+                    self.config.db.dialect.supports_multivalues_insert_returning,
+                "Backend does not support RETURNING for multirow inserts."
+            )
+
 
     @property
     def implements_get_lastrowid(self):
@@ -16,7 +16,7 @@ from ._collections import KeyedTuple, ImmutableContainer, immutabledict, \
     Properties, OrderedProperties, ImmutableProperties, OrderedDict, \
     OrderedSet, IdentitySet, OrderedIdentitySet, column_set, \
     column_dict, ordered_column_set, populate_column_dict, unique_list, \
-    UniqueAppender, PopulateDict, EMPTY_SET, to_list, to_set, \
+    UniqueAppender, PopulateDict, EMPTY_SET, EMPTY_DICT, to_list, to_set, \
     to_column_set, update_copy, flatten_iterator, \
     LRUCache, ScopedRegistry, ThreadLocalRegistry, WeakSequence
 
@@ -7,7 +7,6 @@
 """Collection classes and helpers."""
 
 import weakref
-import operator
 from .compat import threading, itertools_filterfalse
 from . import py2k
 
@@ -131,6 +130,8 @@ class immutabledict(ImmutableContainer, dict):
     def __repr__(self):
         return "immutabledict(%s)" % dict.__repr__(self)
 
+EMPTY_DICT = immutabledict()
+
 
 class Properties(object):
     """Provide a __getattr__/__setattr__ interface over a dict."""
@@ -809,53 +810,154 @@ class LRUCache(dict):
     """Dictionary with 'squishy' removal of least
     recently used items.
 
+    Entries are linked in order of use, most recent first, so that
+    lookups, insertions and removals are constant time.  Once the
+    size exceeds ``capacity`` by more than ``threshold``, the least
+    recently used entries are removed until ``capacity`` is reached.
+
+    The cache may be shared among threads; the ordering of entries
+    is maintained under a mutex, and a lookup which finds the mutex
+    held by another thread doesn't update the ordering, rather than
+    waiting on it.
+
+    The number of successful and failed lookups are counted
+    as ``hits`` and ``misses``, and the number of items removed
+    as ``evictions``.
+
     """
+    hits = misses = evictions = 0
+
     def __init__(self, capacity=100, threshold=.5):
         self.capacity = capacity
         self.threshold = threshold
-        self._counter = 0
+        self._mutex = threading.Lock()
 
-    def _inc_counter(self):
-        self._counter += 1
-        return self._counter
+        # entries are [prev, next, key, value] lists, linked in a
+        # circle through a root sentinel; root[1] is the most recently
+        # used entry and root[0] the least recently used.
+        self._root = root = []
+        root[:] = [root, root, None, None]
 
     def __getitem__(self, key):
-        item = dict.__getitem__(self, key)
-        item[2] = self._inc_counter()
-        return item[1]
+        try:
+            link = dict.__getitem__(self, key)
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        if self._mutex.acquire(False):
+            try:
+                # the entry may have been evicted since it was
+                # retrieved, in which case it's no longer linked.
+                prev = link[0]
+                if prev is not None:
+                    root = self._root
+                    next_ = link[1]
+                    prev[1] = next_
+                    next_[0] = prev
+                    first = root[1]
+                    link[0] = root
+                    link[1] = first
+                    first[0] = root[1] = link
+            finally:
+                self._mutex.release()
+        return link[3]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
     def values(self):
-        return [i[1] for i in dict.values(self)]
+        return [i[3] for i in dict.values(self)]
+
+    def items(self):
+        return [(i[2], i[3]) for i in dict.values(self)]
 
     def setdefault(self, key, value):
-        if key in self:
+        try:
             return self[key]
-        else:
+        except KeyError:
             self[key] = value
             return value
 
     def __setitem__(self, key, value):
-        item = dict.get(self, key)
-        if item is None:
-            item = [key, value, self._inc_counter()]
-            dict.__setitem__(self, key, item)
-        else:
-            item[1] = value
-        self._manage_size()
+        with self._mutex:
+            link = dict.get(self, key)
+            if link is None:
+                root = self._root
+                first = root[1]
+                link = [root, first, key, value]
+                first[0] = root[1] = link
+                dict.__setitem__(self, key, link)
+                self._manage_size()
+            else:
+                link[3] = value
+
+    def __delitem__(self, key):
+        with self._mutex:
+            self._unlink(dict.pop(self, key))
+
+    def pop(self, key, *default):
+        with self._mutex:
+            try:
+                link = dict.pop(self, key)
+            except KeyError:
+                if default:
+                    return default[0]
+                raise
+            self._unlink(link)
+            return link[3]
+
+    def popitem(self):
+        """Remove and return the least recently used item."""
+
+        with self._mutex:
+            link = self._root[0]
+            if link is self._root:
+                raise KeyError("popitem(): LRUCache is empty")
+            self._unlink(link)
+            dict.__delitem__(self, link[2])
+            return link[2], link[3]
+
+    def update(self, *arg, **kw):
+        for key, value in dict(*arg, **kw).items():
+            self[key] = value
+
+    def copy(self):
+        """Return a new :class:`.LRUCache` with the same entries,
+        capacity and order of use; counters start at zero."""
+
+        cache = self.__class__(self.capacity, self.threshold)
+        with self._mutex:
+            root = self._root
+            link = root[0]
+            while link is not root:
+                cache[link[2]] = link[3]
+                link = link[0]
+        return cache
+
+    def clear(self):
+        with self._mutex:
+            dict.clear(self)
+            root = self._root
+            root[:] = [root, root, None, None]
+
+    def _unlink(self, link):
+        prev, next_ = link[0], link[1]
+        prev[1] = next_
+        next_[0] = prev
+        link[0] = link[1] = None
 
     def _manage_size(self):
-        while len(self) > self.capacity + self.capacity * self.threshold:
-            by_counter = sorted(dict.values(self),
-                            key=operator.itemgetter(2),
-                            reverse=True)
-            for item in by_counter[self.capacity:]:
-                try:
-                    del self[item[0]]
-                except KeyError:
-                    # if we couldnt find a key, most
-                    # likely some other thread broke in
-                    # on us. loop around and try again
-                    break
+        if len(self) > self.capacity + self.capacity * self.threshold:
+            root = self._root
+            while len(self) > self.capacity:
+                link = root[0]
+                self._unlink(link)
+                dict.__delitem__(self, link[2])
+                self.evictions += 1
 
 
 class ScopedRegistry(object):
@@ -34,7 +34,7 @@ else:
     def notify_all(condition):
         condition.notify_all()
 
-__all__ = ['Empty', 'Full', 'Queue', 'SAAbort']
+__all__ = ['Empty', 'Full', 'Queue', 'LifoQueue', 'SAAbort']
 
 
 class Empty(Exception):
@@ -208,6 +208,23 @@ class Queue:
 
         return self.get(False)
 
+    def remove(self, item):
+        """Remove the given item from the queue.
+
+        Returns True if the item was present, else False.
+        """
+
+        self.mutex.acquire()
+        try:
+            try:
+                self.queue.remove(item)
+            except ValueError:
+                return False
+            self.not_full.notify()
+            return True
+        finally:
+            self.mutex.release()
+
     # Override these methods to implement other queue organizations
     # (e.g. stack or priority queue).
     # These will only be called with appropriate locks held
@@ -235,3 +252,90 @@ class Queue:
     # Get an item from the queue
     def _get(self):
         return self.queue.popleft()
+
+
+class LifoQueue(Queue):
+    """A :class:`.Queue` which returns the most recently added item
+    first, and which adds and removes items without acquiring its mutex
+    whenever it can.
+
+    ``append()`` and ``pop()`` on a ``deque`` are atomic, so ``get()``
+    takes an available item and ``put()`` adds an item without locking.
+    The mutex is used only by threads waiting within ``get()`` for an
+    item, and by ``put()`` when such threads need to be notified.
+
+    As ``maxsize`` is checked without locking, concurrent ``put()``
+    calls may exceed it by a small amount.  ``put()`` never blocks;
+    ``Full`` is raised whenever the queue is full.
+
+    """
+
+    def _init(self, maxsize):
+        Queue._init(self, maxsize)
+        self._waiters = 0
+
+    def qsize(self):
+        return len(self.queue)
+
+    def empty(self):
+        return not self.queue
+
+    def full(self):
+        return self._full()
+
+    def put(self, item, block=True, timeout=None):
+        if self._full():
+            raise Full
+        self.queue.append(item)
+        if self._waiters:
+            self.not_empty.acquire()
+            try:
+                self.not_empty.notify()
+            finally:
+                self.not_empty.release()
+
+    def get(self, block=True, timeout=None):
+        try:
+            return self.queue.pop()
+        except IndexError:
+            if not block:
+                raise Empty
+
+        if timeout is not None:
+            if timeout < 0:
+                raise ValueError("'timeout' must be a positive number")
+            endtime = _time() + timeout
+
+        self.not_empty.acquire()
+        # register as a waiter before checking for an item, so that
+        # a put() which doesn't see us has added its item already
+        self._waiters += 1
+        try:
+            while True:
+                try:
+                    return self.queue.pop()
+                except IndexError:
+                    pass
+                if timeout is None:
+                    self.not_empty.wait()
+                else:
+                    remaining = endtime - _time()
+                    if remaining <= 0.0:
+                        raise Empty
+                    self.not_empty.wait(remaining)
+                if self._sqla_abort_context:
+                    raise SAAbort(self._sqla_abort_context)
+        finally:
+            self._waiters -= 1
+            self.not_empty.release()
+
+    def remove(self, item):
+        try:
+            self.queue.remove(item)
+        except (ValueError, RuntimeError):
+            return False
+        else:
+            return True
+
+    def _full(self):
+        return self.maxsize > 0 and len(self.queue) >= self.maxsize
@@ -34,6 +34,19 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
 
         cls.dialect = default.DefaultDialect()
 
+        # compile each statement once with the dialect, so that
+        # the rendered names memoized on the tables and columns for
+        # its preparer are in place regardless of the tests which
+        # ran beforehand
+        for stmt in (
+            t1.insert(),
+            t1.update(),
+            t1.update().where(t1.c.c2 == 12),
+            select([t1], t1.c.c2 == t2.c.c1),
+            select([t1], t1.c.c2 == t2.c.c1).apply_labels()
+        ):
+            stmt.compile(dialect=cls.dialect)
+
     @profiling.function_call_count()
     def test_insert(self):
         t1.insert().compile(dialect=self.dialect)
@@ -4,6 +4,7 @@ from sqlalchemy.orm import mapper, relationship, create_session, \
     Session, subqueryload
 from sqlalchemy.orm.mapper import _mapper_registry
 from sqlalchemy.orm.session import _sessions
+from sqlalchemy.orm import attributes
 from sqlalchemy import testing
 from sqlalchemy.testing import engines
 from sqlalchemy import MetaData, Integer, String, ForeignKey, \
@@ -16,6 +17,7 @@ from sqlalchemy.processors import to_decimal_processor_factory, \
 from sqlalchemy.testing.util import gc_collect
 import decimal
 import gc
+import sys
 from sqlalchemy.testing import fixtures
 import weakref
 
@@ -26,7 +28,7 @@ class B(fixtures.ComparableEntity):
 class ASub(A):
     pass
 
-def profile_memory(times=50):
+def profile_memory(times=50, assert_no_sessions=True):
     def decorate(func):
         # run the test 50 times.  if length of gc.get_objects()
         # keeps growing, assert false
@@ -50,7 +52,8 @@ def profile_memory(times=50):
 
             print("sample gc sizes:", samples)
 
-            assert len(_sessions) == 0
+            if assert_no_sessions:
+                assert len(_sessions) == 0
 
             for x in samples[-4:]:
                 if x != samples[-5]:
@@ -153,6 +156,62 @@ class MemUsageTest(EnsureZeroed):
         del m1, m2, m3
         assert_no_mappers()
 
+    def _stream_fixture(self, check, **kw):
+        metadata = MetaData(testing.db)
+
+        table1 = Table("mytable", metadata,
+            Column('col1', Integer, primary_key=True,
+                                    test_needs_autoincrement=True),
+            Column('col2', String(30)))
+
+        metadata.create_all()
+        testing.db.execute(table1.insert(),
+                        [{"col2": "a%d" % i} for i in range(1200)])
+
+        mapper(A, table1, order_by=table1.c.col1)
+
+        sess = Session()
+        result = iter(sess.query(A).yield_per(10, stream=True, **kw))
+
+        try:
+            check(sess, result)
+        finally:
+            # exhaust the result so that its cursor is closed
+            for a in result:
+                pass
+            sess.close()
+            del sess
+            metadata.drop_all()
+            assert_no_mappers()
+
+    def _consume(self, result, count):
+        # modify each object so that the Session would otherwise
+        # hold onto it
+        for i in range(count):
+            a = next(result)
+            a.col2 = "b"
+
+    def test_stream_results_expunge(self):
+        def check(sess, result):
+            # each run consumes 20 more rows from the same result;
+            # the number of objects present shouldn't grow.
+            @profile_memory(assert_no_sessions=False)
+            def go():
+                self._consume(result, 20)
+            go()
+            # of the 1000 objects modified, only that of the most
+            # recently yielded row remains in the Session; with
+            # stream=True it's expunged once the next row is requested.
+            eq_(len(sess.dirty), 1)
+        self._stream_fixture(check, expunge=True)
+
+    def test_stream_results_no_expunge(self):
+        def check(sess, result):
+            self._consume(result, 200)
+            gc_collect()
+            eq_(len(sess.dirty), 200)
+        self._stream_fixture(check)
+
     def test_sessionmaker(self):
         @profile_memory()
         def go():
@@ -672,3 +731,75 @@ class MemUsageTest(EnsureZeroed):
         go()
 
 
+class InstanceStateSizeTest(fixtures.MappedTest):
+    """Measure the memory retained per loaded object by its
+    :class:`.InstanceState`."""
+
+    __requires__ = 'cpython',
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('data', metadata,
+            Column('id', Integer, primary_key=True,
+                                    test_needs_autoincrement=True),
+            Column('x', String(30)),
+            Column('y', Integer))
+
+    @classmethod
+    def setup_classes(cls):
+        class Data(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.Data, cls.tables.data)
+
+    @classmethod
+    def insert_data(cls):
+        testing.db.execute(
+            cls.tables.data.insert(),
+            [dict(id=i, x='x%d' % i, y=i) for i in range(1, 1001)]
+        )
+
+    def _state_size(self, state):
+        size = sys.getsizeof(state)
+        for collection in (state.callables, state.committed_state,
+                            state._parents, state._mutations):
+            if collection is not None and \
+                    collection is not sa.util.EMPTY_DICT:
+                size += sys.getsizeof(collection)
+        return size
+
+    def test_no_instance_dict(self):
+        Data = self.classes.Data
+        sess = create_session()
+        d1 = sess.query(Data).first()
+        state = attributes.instance_state(d1)
+        assert not hasattr(state, '__dict__')
+        assert state.callables is sa.util.EMPTY_DICT
+        assert state.committed_state is sa.util.EMPTY_DICT
+
+    def test_committed_state_released_on_flush(self):
+        Data = self.classes.Data
+        sess = create_session()
+        d1 = sess.query(Data).first()
+        state = attributes.instance_state(d1)
+        d1.x = 'changed'
+        assert 'x' in state.committed_state
+        sess.flush()
+        assert state.committed_state is sa.util.EMPTY_DICT
+
+    def test_state_size(self):
+        Data = self.classes.Data
+        sess = create_session()
+        objects = sess.query(Data).all()
+        eq_(len(objects), 1000)
+
+        total = sum(self._state_size(attributes.instance_state(o))
+                        for o in objects)
+        per_object = total // len(objects)
+
+        # a state with a __dict__ along with eagerly created
+        # "callables" and "committed_state" dictionaries was
+        # well over 1000 bytes.
+        assert per_object < 400, per_object
@@ -300,6 +300,15 @@ class DeferOptionsTest(fixtures.MappedTest):
         s = Session()
         s.query(A).all()
 
+    @profiling.function_call_count(variance=.10)
+    def test_readonly(self):
+        # the same load as test_baseline, without the Session's
+        # identity map, events or commit of loaded state; 16771
+        # calls vs. 22397 for test_baseline when added.
+        A = self.classes.A
+        s = Session()
+        s.query(A).readonly().all()
+
     @profiling.function_call_count(variance=.10)
     def test_defer_many_cols(self):
         # with [ticket:2778], this goes from 50805 to 32817,
@@ -1,6 +1,7 @@
+import threading
 from sqlalchemy import *
 from sqlalchemy.testing import *
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import QueuePool, LifoQueuePool
 from sqlalchemy import pool as pool_module
 
 class QueuePoolTest(fixtures.TestBase, AssertsExecutionResults):
@@ -59,3 +60,111 @@ class QueuePoolTest(fixtures.TestBase, AssertsExecutionResults):
         c2 = go()
 
 
+
+
+class QueuePoolContentionTest(fixtures.TestBase):
+    """Check out and return connections from QueuePool and
+    LifoQueuePool across numbers of threads, asserting that every
+    checkout succeeds and that the pool is left at its configured
+    size.
+
+    The function call counts of uncontended checkouts and checkins
+    are profiled for each pool class; under contention the calls made
+    by a thread depend on scheduling, so aren't profiled.
+
+    """
+
+    __requires__ = 'cpython',
+
+    thread_counts = 1, 10, 50, 200
+    checkouts = 4000
+    pool_size = 5
+
+    def teardown(self):
+        pool_module._refs.clear()
+
+    def _run(self, cls, num_threads):
+        opened = []
+        closed = []
+
+        class Connection(object):
+            def __init__(self):
+                opened.append(self)
+
+            def rollback(self):
+                pass
+
+            def close(self):
+                closed.append(self)
+
+        p = cls(creator=Connection, pool_size=self.pool_size,
+                            max_overflow=5, timeout=30)
+        per_thread = self.checkouts // num_threads
+        checked_out = []
+        errors = []
+
+        def worker():
+            try:
+                for i in range(per_thread):
+                    c = p.connect()
+                    checked_out.append(c.connection)
+                    c.close()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker)
+                        for i in range(num_threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        eq_(errors, [])
+        eq_(len(checked_out), per_thread * num_threads)
+        assert None not in checked_out
+
+        eq_(p.checkedout(), 0)
+        eq_(p.size(), self.pool_size)
+        assert p.overflow() <= 0
+        assert p.checkedin() <= self.pool_size
+
+        # overflow connections were closed on return; the remainder
+        # are those held by the pool.
+        eq_(len(opened) - len(closed), p.checkedin())
+        p.dispose()
+
+    def _test_contention(self, cls):
+        for num_threads in self.thread_counts:
+            self._run(cls, num_threads)
+
+    def test_queuepool_contention(self):
+        self._test_contention(QueuePool)
+
+    def test_lifoqueuepool_contention(self):
+        self._test_contention(LifoQueuePool)
+
+    def _checkout_checkin(self, cls):
+        class Connection(object):
+            def rollback(self):
+                pass
+
+            def close(self):
+                pass
+
+        p = cls(creator=Connection, pool_size=self.pool_size,
+                            max_overflow=5)
+        # open the pooled connection ahead of time
+        p.connect().close()
+
+        @profiling.function_call_count()
+        def go():
+            for i in range(10):
+                p.connect().close()
+        go()
+        eq_(p.checkedout(), 0)
+
+    def test_queuepool_checkout_checkin(self):
+        self._checkout_checkin(QueuePool)
+
+    def test_lifoqueuepool_checkout_checkin(self):
+        self._checkout_checkin(LifoQueuePool)
@@ -4,10 +4,14 @@ from sqlalchemy import testing
 from sqlalchemy.testing import eq_
 from sqlalchemy.util import u
 from sqlalchemy.engine.result import RowProxy
+from sqlalchemy.types import TypeDecorator
+import datetime
 import sys
 
 NUM_FIELDS = 10
 NUM_RECORDS = 1000
+NUM_WIDE_FIELDS = 40
+NUM_WIDE_RECORDS = 100
 
 
 class ResultSetTest(fixtures.TestBase, AssertsExecutionResults):
@@ -53,6 +57,55 @@ class ResultSetTest(fixtures.TestBase, AssertsExecutionResults):
             c1 in row
         go()
 
+
+class ProcessedDateTime(TypeDecorator):
+    impl = DateTime
+
+    def process_result_value(self, value, dialect):
+        return value
+
+
+class WideRowTest(fixtures.TestBase):
+    """test repeated access to a few columns of wide rows whose columns
+    require result processing."""
+
+    @classmethod
+    def setup_class(cls):
+        global wide, wide_metadata
+        wide_metadata = MetaData(testing.db)
+        wide = Table('wide', wide_metadata, *[
+                        Column('field%d' % fnum, ProcessedDateTime)
+                        for fnum in range(NUM_WIDE_FIELDS)])
+        wide_metadata.create_all()
+        wide.insert().execute([
+            dict(('field%d' % fnum, datetime.datetime(2013, 1, fnum % 28 + 1))
+                for fnum in range(NUM_WIDE_FIELDS))
+            for r_num in range(NUM_WIDE_RECORDS)
+        ])
+
+    @classmethod
+    def teardown_class(cls):
+        wide_metadata.drop_all()
+
+    def _test_repeated_access(self, memoize):
+        stmt = wide.select().execution_options(memoize_row_values=memoize)
+        rows = stmt.execute().fetchall()
+
+        @profiling.function_call_count()
+        def go():
+            for row in rows:
+                for i in range(5):
+                    row['field1']
+                    row['field2']
+        go()
+
+    def test_repeated_access(self):
+        self._test_repeated_access(False)
+
+    def test_repeated_access_memoized(self):
+        self._test_repeated_access(True)
+
+
 class ExecutionTest(fixtures.TestBase):
 
     def test_minimal_connection_execute(self):
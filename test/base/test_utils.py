@@ -342,6 +342,139 @@ class LRUTest(fixtures.TestBase):
         assert 25 in l
         assert l[25] is i2
 
+    def test_get_counters(self):
+        l = util.LRUCache(2, threshold=0)
+        l[1] = 'one'
+        eq_(l.get(1), 'one')
+        eq_(l.get(2), None)
+        eq_(l.get(2, 'default'), 'default')
+        eq_(l[1], 'one')
+        assert_raises(KeyError, l.__getitem__, 3)
+        eq_((l.hits, l.misses), (2, 3))
+
+        l[2] = 'two'
+        l[3] = 'three'
+        eq_(l.evictions, 1)
+        assert 1 not in l
+
+    def test_lookup_refreshes(self):
+        l = util.LRUCache(3, threshold=0)
+        for id_ in (1, 2, 3):
+            l[id_] = id_
+        l[1]
+        l[4] = 4
+        assert 2 not in l
+        eq_(sorted(l.keys()), [1, 3, 4])
+
+        # replacing a value doesn't count as use
+        l[3] = 'three'
+        l[5] = 5
+        assert 3 not in l
+        eq_(sorted(l.items()), [(1, 1), (4, 4), (5, 5)])
+
+    def test_delete_clear(self):
+        l = util.LRUCache(3, threshold=0)
+        for id_ in (1, 2, 3):
+            l[id_] = id_
+        del l[1]
+        l[4] = 4
+        l[5] = 5
+        eq_(sorted(l.values()), [3, 4, 5])
+        eq_(l.evictions, 1)
+
+        l.clear()
+        eq_(len(l), 0)
+        l[6] = 6
+        eq_(l.get(6), 6)
+
+    def test_pop(self):
+        l = util.LRUCache(3, threshold=0)
+        for id_ in (1, 2, 3):
+            l[id_] = id_
+        eq_(l.pop(2), 2)
+        eq_(l.pop(2, 'default'), 'default')
+        assert_raises(KeyError, l.pop, 2)
+        l[4] = 4
+        l[5] = 5
+        eq_(sorted(l.keys()), [3, 4, 5])
+        eq_(l.evictions, 1)
+
+    def test_popitem(self):
+        l = util.LRUCache(3, threshold=0)
+        for id_ in (1, 2, 3):
+            l[id_] = id_
+        l[1]
+        eq_(l.popitem(), (2, 2))
+        eq_(l.popitem(), (3, 3))
+        eq_(l.popitem(), (1, 1))
+        assert_raises(KeyError, l.popitem)
+        l[4] = 4
+        eq_(l.get(4), 4)
+
+    def test_update(self):
+        l = util.LRUCache(3, threshold=0)
+        l[1] = 1
+        l.update({2: 2, 3: 3}, four=4)
+        eq_(len(l), 3)
+        eq_(l.evictions, 1)
+        assert 1 not in l
+        eq_(l['four'], 4)
+        eq_(l.pop(2), 2)
+        eq_(l.pop(3), 3)
+        eq_(l.popitem(), ('four', 4))
+
+    def test_copy(self):
+        l = util.LRUCache(3, threshold=0)
+        for id_ in (1, 2, 3):
+            l[id_] = id_
+        l[1]
+        l2 = l.copy()
+        assert isinstance(l2, util.LRUCache)
+        eq_(l2.capacity, 3)
+        eq_(sorted(l2.items()), [(1, 1), (2, 2), (3, 3)])
+
+        # the copy has its own links, in the same order of use
+        l2[4] = 4
+        eq_(sorted(l2.keys()), [1, 3, 4])
+        eq_(sorted(l.keys()), [1, 2, 3])
+        eq_(l2.popitem(), (3, 3))
+
+    def test_threaded(self):
+        import threading
+        l = util.LRUCache(50, threshold=.2)
+        errors = []
+
+        def run(offset):
+            try:
+                for i in range(2000):
+                    key = (i * 7 + offset) % 100
+                    l.setdefault(key, key)
+                    eq_(l.get(key, key), key)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(i, ))
+                    for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        eq_(errors, [])
+        assert len(l) <= 60
+
+        # the links are intact, in both directions
+        root = l._root
+        forward, link = [], root[1]
+        while link is not root:
+            forward.append(link[2])
+            link = link[1]
+        backward, link = [], root[0]
+        while link is not root:
+            backward.append(link[2])
+            link = link[0]
+        eq_(sorted(forward), sorted(l.keys()))
+        eq_(forward, list(reversed(backward)))
+
 
 class ImmutableSubclass(str):
     pass
@@ -4,6 +4,8 @@ from sqlalchemy.testing import eq_
 from sqlalchemy import *
 from sqlalchemy.testing import fixtures, AssertsCompiledSQL
 from sqlalchemy import testing
+from sqlalchemy.testing import engines
+from sqlalchemy.engine import result as _result
 
 
 class MatchTest(fixtures.TestBase, AssertsCompiledSQL):
@@ -127,3 +129,85 @@ class MatchTest(fixtures.TestBase, AssertsCompiledSQL):
         eq_([1, 3, 5], [r.id for r in results])
 
 
+class ServerSideCursorsTest(fixtures.TablesTest):
+    __only_on__ = ('mysql+mysqldb', 'mysql+pymysql')
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('data', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('x', String(50))
+        )
+
+    @classmethod
+    def insert_data(cls):
+        cls.tables.data.insert().execute(
+            [{'id': i, 'x': 'x%d' % i} for i in range(1, 21)]
+        )
+
+    def _fixture(self, server_side_cursors):
+        self.engine = engines.testing_engine(
+                        options={'server_side_cursors': server_side_cursors}
+                    )
+        return self.engine
+
+    def tearDown(self):
+        engines.testing_reaper.close_all()
+        self.engine.dispose()
+
+    def _is_sscursor(self, result):
+        return isinstance(result.cursor, result.dialect._sscursor)
+
+    def test_global(self):
+        engine = self._fixture(True)
+        result = engine.execute(select([1]))
+        assert self._is_sscursor(result)
+        assert isinstance(result, _result.ExclusiveBufferedRowResultProxy)
+        result.close()
+
+    def test_global_off(self):
+        engine = self._fixture(False)
+        result = engine.execute(select([1]))
+        assert not self._is_sscursor(result)
+        result.close()
+
+    def test_stmt_option(self):
+        engine = self._fixture(False)
+        result = engine.execute(
+                    select([1]).execution_options(stream_results=True))
+        assert self._is_sscursor(result)
+        result.close()
+
+    def test_conn_option(self):
+        engine = self._fixture(False)
+        result = engine.connect().execution_options(stream_results=True).\
+                    execute('select 1')
+        assert self._is_sscursor(result)
+        result.close()
+
+    def test_second_statement_while_streaming(self):
+        data = self.tables.data
+        engine = self._fixture(False)
+        conn = engine.connect().execution_options(stream_results=True)
+        result = conn.execute(data.select().order_by(data.c.id))
+        eq_(result.fetchone(), (1, 'x1'))
+
+        # the remaining rows of the first result are buffered
+        # so that the second statement may proceed
+        eq_(conn.scalar(select([func.count(data.c.id)])), 20)
+        eq_(
+            result.fetchall(),
+            [(i, 'x%d' % i) for i in range(2, 21)]
+        )
+        conn.close()
+
+    def test_commit_while_streaming(self):
+        data = self.tables.data
+        engine = self._fixture(False)
+        conn = engine.connect().execution_options(stream_results=True)
+        trans = conn.begin()
+        result = conn.execute(data.select().order_by(data.c.id))
+        eq_(result.fetchmany(5), [(i, 'x%d' % i) for i in range(1, 6)])
+        trans.commit()
+        eq_(len(result.fetchall()), 15)
+        conn.close()
@@ -6,7 +6,7 @@ import re
 from sqlalchemy.testing.util import picklers
 from sqlalchemy.interfaces import ConnectionProxy
 from sqlalchemy import MetaData, Integer, String, INT, VARCHAR, func, \
-    bindparam, select, event, TypeDecorator, create_engine, Sequence
+    bindparam, select, event, TypeDecorator, create_engine, Sequence, text
 from sqlalchemy.sql import column, literal
 from sqlalchemy.testing.schema import Table, Column
 import sqlalchemy as tsa
@@ -601,6 +601,117 @@ class CompiledCacheTest(fixtures.TestBase):
         assert len(cache) == 1
         eq_(conn.execute("select count(*) from users").scalar(), 3)
 
+    def test_cache_structural_key(self):
+        conn = testing.db.connect()
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        cached_conn.execute(users.insert(), [
+                {'user_id': 1, 'user_name': 'u1'},
+                {'user_id': 2, 'user_name': 'u2'},
+                {'user_id': 3, 'user_name': 'u3'}])
+        eq_(len(cache), 1)
+
+        for id_, name in [(1, 'u1'), (2, 'u2'), (3, 'u3')]:
+            stmt = select([users.c.user_name,
+                        func.lower(users.c.user_name).label('lower')]).\
+                        where(users.c.user_id == id_)
+            row = cached_conn.execute(stmt).first()
+            eq_(row[users.c.user_name], name)
+            eq_(row['lower'], name)
+            eq_(row[stmt.c.lower], name)
+
+        eq_(len(cache), 2)
+
+    def test_cache_structural_key_distinct_structure(self):
+        conn = testing.db.connect()
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        cached_conn.execute(users.insert(), {'user_id': 1, 'user_name': 'u1'})
+        cached_conn.execute(users.insert(), {'user_id': 2, 'user_name': 'u2'})
+        eq_(len(cache), 1)
+
+        eq_(cached_conn.execute(
+                select([users.c.user_id]).where(users.c.user_id == 1)
+            ).scalar(), 1)
+        eq_(cached_conn.execute(
+                select([users.c.user_id]).where(users.c.user_id > 1)
+            ).scalar(), 2)
+        eq_(len(cache), 3)
+
+    @testing.requires.ad_hoc_engines
+    def test_engine_cache(self):
+        eng = engines.testing_engine(options={'compiled_cache_size': 10})
+        metadata.create_all(eng)
+        cache = eng.compiled_cache
+        eq_(cache.capacity, 10)
+        misses = cache.misses
+
+        for id_, name in [(1, 'u1'), (2, 'u2'), (3, 'u3')]:
+            eng.execute(users.insert(), {'user_id': id_, 'user_name': name})
+        for id_ in (1, 2, 3):
+            eq_(eng.execute(
+                select([users.c.user_id]).where(users.c.user_id == id_)
+            ).scalar(), id_)
+        eq_(cache.misses - misses, 2)
+        eq_(cache.hits, 4)
+        metadata.drop_all(eng)
+
+    @testing.requires.ad_hoc_engines
+    def test_engine_cache_shared_by_option_engine(self):
+        eng = engines.testing_engine()
+        is_(eng.execution_options(foo='bar').compiled_cache,
+                eng.compiled_cache)
+
+    @testing.requires.ad_hoc_engines
+    def test_engine_cache_evicts(self):
+        eng = engines.testing_engine(options={'compiled_cache_size': 2})
+        cache = eng.compiled_cache
+        for i in range(10):
+            eng.execute(select([literal(1).label('x' + str(i))])).fetchall()
+        assert len(cache) <= 3
+        assert cache.evictions > 0
+
+    @testing.requires.ad_hoc_engines
+    def test_engine_cache_skips_identity_key(self):
+        eng = engines.testing_engine(options={'compiled_cache_size': 10})
+        metadata.create_all(eng)
+        cache = eng.compiled_cache
+
+        for id_, name in [(1, 'u1'), (2, 'u2')]:
+            eng.execute(users.insert().values(user_id=id_, user_name=name))
+        eq_(len(cache), 0)
+        eq_(eng.execute("select count(*) from users").scalar(), 2)
+        metadata.drop_all(eng)
+
+    def test_explicit_cache_identity_key(self):
+        conn = testing.db.connect()
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        ins = users.insert().values(user_name='u1')
+        cached_conn.execute(ins)
+        cached_conn.execute(ins)
+        eq_(len(cache), 1)
+        assert list(cache)[0][1] is ins
+        eq_(conn.execute("select count(*) from users").scalar(), 2)
+
+    @testing.requires.ad_hoc_engines
+    def test_engine_cache_disabled(self):
+        eng = engines.testing_engine(options={'compiled_cache_size': 0})
+        is_(eng.compiled_cache, None)
+        eq_(eng.execute(select([literal(1)])).scalar(), 1)
+
+    def test_connection_cache_none(self):
+        conn = testing.db.connect()
+        cache = testing.db.compiled_cache
+        uncached_conn = conn.execution_options(compiled_cache=None)
+        stmt = select([users.c.user_id]).where(users.c.user_name == 'nope')
+        misses = cache.misses
+        uncached_conn.execute(stmt).fetchall()
+        eq_(cache.misses, misses)
+
 class LogParamsTest(fixtures.TestBase):
     __only_on__ = 'sqlite'
     __requires__ = 'ad_hoc_engines',
@@ -1123,6 +1234,100 @@ class AlternateResultProxyTest(fixtures.TestBase):
     def test_buffered_column_result_proxy(self):
         self._test_proxy(_result.BufferedColumnResultProxy)
 
+    def test_exclusive_buffered_row_result_proxy(self):
+        self._test_proxy(_result.ExclusiveBufferedRowResultProxy)
+
+    def test_exclusive_stream_release(self):
+        cls = _result.ExclusiveBufferedRowResultProxy
+
+        class ExcCtx(default.DefaultExecutionContext):
+            def get_result_proxy(self):
+                return cls(self)
+        self.engine.dialect.execution_ctx_cls = ExcCtx
+
+        conn = self.engine.connect()
+        r = conn.execute(select([self.table]))
+        eq_(r.fetchone(), (1, "t_1"))
+        assert conn.connection.info[cls._stream_key]() is r
+
+        cls.release_stream(conn.connection)
+        assert cls._stream_key not in conn.connection.info
+        eq_(r.fetchall(), [(i, "t_%d" % i) for i in range(2, 12)])
+
+        r = conn.execute(select([self.table]))
+        r.close()
+        assert cls._stream_key not in conn.connection.info
+        conn.close()
+
+
+class ServerSideCursorTest(fixtures.TestBase):
+    __requires__ = ('sqlite', )
+
+    def _fixture(self, server_side_cursors=False):
+        engine = testing_engine('sqlite://')
+        engine.dialect.supports_server_side_cursors = True
+        engine.dialect.server_side_cursors = server_side_cursors
+
+        class SSCtx(default.DefaultExecutionContext):
+            def create_server_side_cursor(self):
+                return self._dbapi_connection.cursor()
+        engine.dialect.execution_ctx_cls = SSCtx
+        return engine
+
+    def _is_server_side(self, engine, stmt):
+        result = engine.execute(stmt)
+        ret = result.context._is_server_side
+        result.close()
+        return ret
+
+    def test_default_off(self):
+        engine = self._fixture()
+        assert not self._is_server_side(engine, select([1]))
+        assert not self._is_server_side(engine, "select 1")
+
+    def test_stmt_option(self):
+        engine = self._fixture()
+        assert self._is_server_side(engine,
+                    select([1]).execution_options(stream_results=True))
+        assert self._is_server_side(engine,
+                    text("select 1").execution_options(stream_results=True))
+
+    def test_conn_option(self):
+        engine = self._fixture()
+        conn = engine.connect().execution_options(stream_results=True)
+        assert self._is_server_side(conn, select([1]))
+        assert self._is_server_side(conn, "select 1")
+        assert not self._is_server_side(conn, "pragma table_info('x')")
+
+    def test_global(self):
+        engine = self._fixture(True)
+        assert self._is_server_side(engine, select([1]))
+        assert self._is_server_side(engine, "select 1")
+        assert not self._is_server_side(engine,
+                    select([1]).execution_options(stream_results=False))
+
+    def test_dml_not_server_side(self):
+        engine = self._fixture(True)
+        t = Table('t', MetaData(), Column('x', Integer))
+        t.create(engine)
+        assert not self._is_server_side(engine, t.insert().values(x=5))
+        assert not self._is_server_side(engine,
+                    t.update().values(x=6).execution_options(
+                                                stream_results=True))
+        assert self._is_server_side(engine, t.select())
+
+    def test_unsupported(self):
+        engine = self._fixture(True)
+        engine.dialect.supports_server_side_cursors = False
+        assert not self._is_server_side(engine,
+                    select([1]).execution_options(stream_results=True))
+
+    def test_result_proxy(self):
+        engine = self._fixture()
+        r = engine.execute(select([1]).execution_options(stream_results=True))
+        assert isinstance(r, _result.BufferedRowResultProxy)
+        eq_(r.fetchall(), [(1, )])
+
 class EngineEventsTest(fixtures.TestBase):
     __requires__ = 'ad_hoc_engines',
 
@@ -4,9 +4,10 @@ from sqlalchemy import pool, select, event
 import sqlalchemy as tsa
 from sqlalchemy import testing
 from sqlalchemy.testing.util import gc_collect, lazy_gc
-from sqlalchemy.testing import eq_, assert_raises, is_not_
+from sqlalchemy.testing import eq_, assert_raises, is_not_, is_
 from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing import fixtures
+from sqlalchemy.util import queue as sqla_queue
 
 from sqlalchemy.testing.mock import Mock, call
 
@@ -41,10 +42,12 @@ class PoolTestBase(fixtures.TestBase):
         dbapi, pool = self._queuepool_dbapi_fixture(**kw)
         return pool
 
+    _queuepool_cls = pool.QueuePool
+
     def _queuepool_dbapi_fixture(self, **kw):
         dbapi = MockDBAPI()
-        return dbapi, pool.QueuePool(creator=lambda: dbapi.connect('foo.db'),
-                        **kw)
+        return dbapi, self._queuepool_cls(
+                        creator=lambda: dbapi.connect('foo.db'), **kw)
 
 class PoolTest(PoolTestBase):
     def test_manager(self):
@@ -486,11 +489,141 @@ class PoolEventsTest(PoolTestBase):
         p2.connect()
         eq_(canary, ["listen_one", "listen_two", "listen_one", "listen_three"])
 
+    def test_checkout_wait_event(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0)
+        canary = []
+        event.listen(p, 'checkout_wait',
+                        lambda pool, wait_time: canary.append(pool))
+
+        c1 = p.connect()
+        eq_(canary, [])
+        c1.close()
+        c1 = p.connect()
+        eq_(canary, [p])
+
+    def test_checkout_wait_event_not_below_overflow(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=1)
+        canary = []
+        event.listen(p, 'checkout_wait',
+                        lambda pool, wait_time: canary.append(pool))
+
+        c1 = p.connect()
+        c2 = p.connect()
+        eq_(canary, [])
+
+    def test_checkout_timeout_event(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0,
+                                    timeout=.1)
+        canary = []
+        event.listen(p, 'checkout_timeout', lambda pool: canary.append(pool))
+
+        c1 = p.connect()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        eq_(canary, [p])
+
+    def test_recycle_event(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0,
+                                    recycle=30)
+        canary = []
+        event.listen(p, 'recycle',
+                        lambda conn, rec: canary.append((conn, rec)))
+
+        c1 = p.connect()
+        conn, rec = c1.connection, c1._connection_record
+        c1.close()
+        eq_(canary, [])
+        rec.starttime -= 60
+        c1 = p.connect()
+        eq_(canary, [(conn, rec)])
+        is_not_(c1.connection, conn)
+
+    def test_invalidate_event(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0)
+        canary = []
+        event.listen(p, 'invalidate',
+                    lambda conn, rec, err: canary.append((conn, rec, err)))
+
+        c1 = p.connect()
+        conn, rec = c1.connection, c1._connection_record
+        err = Exception("oops")
+        c1.invalidate(err)
+        eq_(canary, [(conn, rec, err)])
+
     def teardown(self):
         # TODO: need to get remove() functionality
         # going
         pool.Pool.dispatch._clear()
 
+
+class PoolStatisticsTest(PoolTestBase):
+    def test_counts(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=1,
+                                    recycle=30, timeout=.1)
+        stats = pool.PoolStatistics(p)
+
+        c1 = p.connect()
+        c2 = p.connect()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        rec = c2._connection_record
+        c2.close()
+        c1.invalidate()
+        rec.starttime -= 60
+        c1 = p.connect()
+
+        snap = stats.snapshot()
+        eq_(
+            dict((k, snap[k]) for k in ('checkouts', 'connects',
+                    'recycles', 'invalidations', 'timeouts', 'waits',
+                    'size', 'checkedin', 'checkedout', 'overflow')),
+            {'checkouts': 3, 'connects': 3, 'recycles': 1,
+            'invalidations': 1, 'timeouts': 1, 'waits': 0,
+            'size': 1, 'checkedin': 0, 'checkedout': 1, 'overflow': 0}
+        )
+        assert snap['connect_time'] >= 0
+
+    def test_wait_histogram(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0)
+        stats = pool.PoolStatistics(p)
+        c1 = p.connect()
+        c1.close()
+        c1 = p.connect()
+
+        snap = stats.snapshot()
+        eq_(snap['waits'], 1)
+        eq_(snap['wait_histogram'],
+            [(.001, 1), (.01, 0), (.1, 0), (1, 0), (10, 0), (None, 0)])
+
+        stats._on_checkout_wait(p, 5)
+        snap = stats.snapshot()
+        eq_(snap['waits'], 2)
+        eq_(snap['max_wait_time'], 5)
+        eq_(snap['wait_histogram'][4], (10, 1))
+
+    def test_reset_remove(self):
+        p = self._queuepool_fixture()
+        stats = pool.PoolStatistics(p)
+        c1 = p.connect()
+        eq_(stats.snapshot()['checkouts'], 1)
+        stats.reset()
+        eq_(stats.snapshot()['checkouts'], 0)
+        stats.remove()
+        c2 = p.connect()
+        eq_(stats.snapshot()['checkouts'], 0)
+        assert not p.dispatch.checkout
+
+    def test_engine_across_dispose(self):
+        dbapi = MockDBAPI()
+        e = tsa.create_engine('postgresql://', module=dbapi,
+                        _initialize=False)
+        stats = pool.PoolStatistics(e)
+        c1 = e.connect()
+        c1.close()
+        e.dispose()
+        c1 = e.connect()
+        snap = stats.snapshot()
+        eq_(snap['checkouts'], 2)
+        eq_(snap['checkedout'], 1)
+
 class DeprecatedPoolListenerTest(PoolTestBase):
     @testing.requires.predictable_gc
     @testing.uses_deprecated(r".*Use event.listen")
@@ -1199,6 +1332,291 @@ class QueuePoolTest(PoolTestBase):
         c2 = p.connect()
         assert c2.connection is not None
 
+    def test_min_idle_prewarm(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=5,
+                                    min_idle=3, prewarm=True)
+        eq_(dbapi.connect.call_count, 0)
+        p._start()
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedin(), 3)
+        eq_(p.checkedout(), 0)
+        p.dispose()
+
+    def test_min_idle_starts_on_checkout(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=5,
+                                    min_idle=2, prewarm=True)
+        c1 = p.connect()
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.checkedin(), 1)
+        p._refill()
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedin(), 2)
+        eq_(p.checkedout(), 1)
+        p.dispose()
+
+    def test_min_idle_limited_to_pool_size(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=2,
+                                    max_overflow=5, min_idle=10)
+        eq_(p._min_idle, 2)
+        p._refill()
+        c1, c2 = p.connect(), p.connect()
+        p._refill()
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.overflow(), 0)
+        p.dispose()
+
+    def test_refill_connect_error(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, min_idle=2)
+        dbapi.shutdown(True)
+        p._refill()
+        eq_(p.checkedin(), 0)
+        eq_(p.overflow(), -3)
+
+        dbapi.shutdown(False)
+        p._refill()
+        eq_(p.checkedin(), 2)
+        eq_(p.overflow(), -1)
+
+    def test_refill_recycles_idle(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, min_idle=2,
+                                    recycle=30)
+        p._refill()
+        recs = list(p._pool.queue)
+        conns = [rec.connection for rec in recs]
+
+        recs[0].starttime -= 30 - p._refill_interval
+        p._refill()
+        eq_(dbapi.connect.call_count, 3)
+        assert recs[0].connection is not conns[0]
+        eq_(conns[0].close.call_count, 1)
+        assert recs[1].connection is conns[1]
+        eq_(p.checkedin(), 2)
+
+    def test_refill_thread(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, min_idle=2)
+        p._refill_interval = .05
+        c1 = p.connect()
+        for i in range(40):
+            if p.checkedin() == 2:
+                break
+            time.sleep(.05)
+        eq_(p.checkedin(), 2)
+
+        thread = p._refill_thread
+        p.dispose()
+        thread.join(2)
+        assert not thread.is_alive()
+
+    def test_recreate_min_idle(self):
+        p = self._queuepool_fixture(pool_size=3, min_idle=2, prewarm=True)
+        p2 = p.recreate()
+        eq_(p2._min_idle, 2)
+        assert p2._prewarm
+        assert p2._refill_thread is None
+
+    def test_engine_prewarm(self):
+        e = tsa.create_engine('sqlite://', poolclass=pool.QueuePool,
+                        pool_size=3, pool_min_idle=2, pool_prewarm=True)
+        eq_(e.pool.checkedin(), 2)
+        eq_(e.scalar(select([1])), 1)
+        e.dispose()
+
+    def test_engine_dispose_refills(self):
+        e = tsa.create_engine('sqlite://', poolclass=self._queuepool_cls,
+                        pool_size=3, pool_min_idle=2, pool_prewarm=True)
+        old_pool = e.pool
+        assert old_pool._refill_thread is not None
+
+        e.dispose()
+        assert e.pool is not old_pool
+        assert old_pool._refill_thread is None
+        assert e.pool._refill_thread is not None
+
+        # the new pool is refilled in the background, without
+        # a checkout having taken place
+        for i in range(50):
+            if e.pool.checkedin() == 2:
+                break
+            time.sleep(.02)
+        eq_(e.pool.checkedin(), 2)
+        e.pool.dispose()
+
+class LifoQueuePoolTest(QueuePoolTest):
+    _queuepool_cls = pool.LifoQueuePool
+
+    def test_lifo(self):
+        p = self._queuepool_fixture(pool_size=3, max_overflow=0)
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        r1, r2, r3 = c1._connection_record, c2._connection_record, \
+                        c3._connection_record
+        c1.close()
+        c3.close()
+        c2.close()
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        eq_(
+            [c._connection_record for c in (c1, c2, c3)],
+            [r2, r3, r1]
+        )
+
+    def test_waiter_receives_returned(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0,
+                                    timeout=5)
+        c1 = p.connect()
+        rec = c1._connection_record
+        received = []
+
+        def waiter():
+            c2 = p.connect()
+            received.append(c2._connection_record)
+            c2.close()
+
+        t = threading.Thread(target=waiter)
+        t.start()
+        time.sleep(.2)
+        c1.close()
+        t.join(5)
+        eq_(received, [rec])
+        eq_(p.checkedin(), 1)
+
+    def test_concurrent_checkouts(self):
+        p = self._queuepool_fixture(pool_size=5, max_overflow=0,
+                                    timeout=10)
+        errors = []
+
+        def worker():
+            try:
+                for i in range(200):
+                    c = p.connect()
+                    c.close()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+        eq_(errors, [])
+        eq_(p.checkedout(), 0)
+        assert p.checkedin() <= 5
+
+
+class LifoQueueTest(fixtures.TestBase):
+    def test_get_put(self):
+        q = sqla_queue.LifoQueue(2)
+        q.put(1)
+        q.put(2)
+        assert q.full()
+        assert_raises(sqla_queue.Full, q.put, 3, False)
+        eq_(q.qsize(), 2)
+        eq_(q.get(), 2)
+        eq_(q.get(), 1)
+        assert q.empty()
+        assert_raises(sqla_queue.Empty, q.get, False)
+
+    def test_get_timeout(self):
+        q = sqla_queue.LifoQueue(2)
+        now = time.time()
+        assert_raises(sqla_queue.Empty, q.get, True, .2)
+        assert time.time() - now >= .2
+
+    def test_remove(self):
+        for cls in sqla_queue.Queue, sqla_queue.LifoQueue:
+            q = cls(3)
+            q.put(1)
+            q.put(2)
+            assert q.remove(1)
+            assert not q.remove(1)
+            eq_(q.qsize(), 1)
+
+    def test_abort(self):
+        q = sqla_queue.LifoQueue(1)
+        aborted = []
+
+        def waiter():
+            try:
+                q.get(True, 5)
+            except sqla_queue.SAAbort as e:
+                aborted.append(e.context)
+
+        t = threading.Thread(target=waiter)
+        t.start()
+        time.sleep(.2)
+        q.abort("context")
+        t.join(5)
+        eq_(aborted, ["context"])
+
+
+class PrePingTest(PoolTestBase):
+    def test_ping_on_checkout(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=1,
+                                    max_overflow=0, pre_ping=True)
+        c1 = p.connect()
+        conn = c1.connection
+        # not pinged when newly connected
+        eq_(conn.cursor.mock_calls, [])
+        c1.close()
+
+        c1 = p.connect()
+        is_(c1.connection, conn)
+        eq_(conn.cursor.mock_calls, [call()])
+        c1.close()
+
+    def test_reconnect_on_failed_ping(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=1,
+                                    max_overflow=0, pre_ping=True)
+        canary = []
+        event.listen(p, 'invalidate',
+                    lambda conn, rec, err: canary.append(conn))
+        c1 = p.connect()
+        conn = c1.connection
+        c1.close()
+
+        conn.cursor.side_effect = Exception("disconnected")
+        c1 = p.connect()
+        is_not_(c1.connection, conn)
+        eq_(canary, [conn])
+        eq_(conn.close.mock_calls, [call()])
+
+    def test_ping_idle(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=1,
+                            max_overflow=0, pre_ping=True, pre_ping_idle=30)
+        c1 = p.connect()
+        conn = c1.connection
+        rec = c1._connection_record
+        c1.close()
+        c1 = p.connect()
+        eq_(conn.cursor.mock_calls, [])
+        c1.close()
+
+        rec.checkin_time -= 60
+        c1 = p.connect()
+        eq_(conn.cursor.mock_calls, [call()])
+
+    def test_invalidate_time(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3,
+                                    max_overflow=0, pre_ping=True)
+        c1, c2 = p.connect(), p.connect()
+        conn1, conn2 = c1.connection, c2.connection
+        c2.close()
+
+        p._invalidate(c1._connection_record)
+        c1.invalidate()
+        c3 = p.connect()
+        c4 = p.connect()
+        conns = set([c3.connection, c4.connection])
+        assert conn1 not in conns
+        assert conn2 not in conns
+        eq_(conn2.cursor.mock_calls, [])
+        eq_(conn2.close.mock_calls, [call()])
+
+    def test_recreate(self):
+        p = self._queuepool_fixture(pre_ping=True, pre_ping_idle=5)
+        p2 = p.recreate()
+        eq_(p2._pre_ping, True)
+        eq_(p2._pre_ping_idle, 5)
+
+
 class SingletonThreadPoolTest(PoolTestBase):
 
     @testing.requires.threading_with_mock
@@ -1,5 +1,5 @@
 from sqlalchemy.testing import fixtures
-from sqlalchemy.testing import assert_raises_message, eq_
+from sqlalchemy.testing import assert_raises, assert_raises_message, eq_
 
 
 class _DateProcessorTest(fixtures.TestBase):
@@ -166,3 +166,121 @@ class CDistillArgsTest(_DistillArgsTest):
     def setup_class(cls):
         from sqlalchemy import cutils as util
         cls.module = util
+
+
+class _BindParamsTest(fixtures.TestBase):
+    def test_positional(self):
+        plan = [('b', None), ('a', lambda v: v * 10)]
+        eq_(
+            self.module._positional_bind_params(
+                plan, [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}], tuple),
+            [(2, 10), (4, 30)]
+        )
+
+    def test_positional_sequence_format(self):
+        plan = [('a', str), ('b', None)]
+        eq_(
+            self.module._positional_bind_params(
+                plan, [{'a': 1, 'b': 2}], list),
+            [['1', 2]]
+        )
+
+    def test_positional_empty(self):
+        eq_(
+            self.module._positional_bind_params([], [{}], tuple),
+            [()]
+        )
+        eq_(
+            self.module._positional_bind_params([('a', None)], [], tuple),
+            []
+        )
+
+    def test_positional_missing_key(self):
+        assert_raises(
+            KeyError,
+            self.module._positional_bind_params,
+            [('a', None), ('b', None)], [{'a': 1}], tuple
+        )
+
+    def test_positional_processor_raises(self):
+        def go(value):
+            raise ValueError("bad value")
+        assert_raises_message(
+            ValueError,
+            "bad value",
+            self.module._positional_bind_params,
+            [('a', go)], [{'a': 1}], tuple
+        )
+
+    def test_keyed(self):
+        params = [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]
+        result = self.module._keyed_bind_params(
+                        [('a', lambda v: v * 10), ('c', str)], params)
+        eq_(result, [{'a': 10, 'b': 2}, {'a': 30, 'b': 4}])
+
+        # the compiled parameters are left unchanged
+        eq_(params, [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}])
+        assert result[0] is not params[0]
+
+    def test_keyed_no_processors(self):
+        params = [{'a': 1}]
+        result = self.module._keyed_bind_params([], params)
+        eq_(result, [{'a': 1}])
+        assert result[0] is not params[0]
+
+
+class PyBindParamsTest(_BindParamsTest):
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy.engine import util
+        cls.module = type("util", (object,),
+                dict(
+                    (k, staticmethod(v))
+                        for k, v in list(util.py_fallback().items())
+                )
+        )
+
+
+class CBindParamsTest(_BindParamsTest):
+    __requires__ = ('cextensions', )
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import cutils as util
+        cls.module = util
+
+
+class _PopulateColumnsTest(fixtures.TestBase):
+    def test_populate_columns(self):
+        dict_ = {'c': 5}
+        eq_(
+            self.module._populate_columns(
+                dict_, {'x': 1, 'y': 2}, (('a', 'x'), ('b', 'y'))),
+            None
+        )
+        eq_(dict_, {'a': 1, 'b': 2, 'c': 5})
+
+    def test_populate_columns_missing(self):
+        assert_raises(
+            KeyError,
+            self.module._populate_columns, {}, {'x': 1}, (('a', 'y'), )
+        )
+
+
+class PyPopulateColumnsTest(_PopulateColumnsTest):
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy.orm import loading
+        cls.module = type("loading", (object,),
+                dict(
+                    (k, staticmethod(v))
+                        for k, v in list(loading.py_fallback().items())
+                )
+        )
+
+
+class CPopulateColumnsTest(_PopulateColumnsTest):
+    __requires__ = ('cextensions', )
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import cutils as util
+        cls.module = util
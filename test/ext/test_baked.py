@@ -0,0 +1,283 @@
+from sqlalchemy.orm import Session, subqueryload, joinedload, \
+    relationship, mapper
+from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.ext import baked
+from sqlalchemy import bindparam, func
+from sqlalchemy.testing import eq_, is_, is_not_, assert_raises
+from sqlalchemy.testing import mock
+from test.orm import _fixtures
+
+
+class BakedTest(_fixtures.FixtureTest):
+    run_setup_mappers = 'once'
+    run_inserts = 'once'
+    run_deletes = None
+
+    def setup(self):
+        self.bakery = baked.bakery()
+
+
+class StateChangeTest(BakedTest):
+    @classmethod
+    def setup_mappers(cls):
+        User = cls.classes.User
+
+        mapper(User, cls.tables.users)
+
+    def _assert_cache_key(self, key, elements):
+        eq_(
+            key,
+            tuple(elem.__code__ for elem in elements)
+        )
+
+    def test_initial_key(self):
+        User = self.classes.User
+        session = Session()
+        l1 = lambda: session.query(User)
+        q1 = self.bakery(l1)
+        self._assert_cache_key(q1._cache_key, [l1])
+        eq_(q1.steps, [l1])
+
+    def test_inplace_add(self):
+        User = self.classes.User
+        session = Session()
+        l1 = lambda: session.query(User)
+        l2 = lambda q: q.filter(User.name == bindparam('name'))
+        q1 = self.bakery(l1)
+        self._assert_cache_key(q1._cache_key, [l1])
+        eq_(q1.steps, [l1])
+
+        q2 = q1.add_criteria(l2)
+        is_(q2, q1)
+
+        self._assert_cache_key(q1._cache_key, [l1, l2])
+        eq_(q1.steps, [l1, l2])
+
+    def test_inplace_add_operator(self):
+        User = self.classes.User
+        session = Session()
+        l1 = lambda: session.query(User)
+        l2 = lambda q: q.filter(User.name == bindparam('name'))
+        q1 = self.bakery(l1)
+        self._assert_cache_key(q1._cache_key, [l1])
+
+        q1 += l2
+
+        self._assert_cache_key(q1._cache_key, [l1, l2])
+
+    def test_chained_add(self):
+        User = self.classes.User
+        session = Session()
+        l1 = lambda: session.query(User)
+        l2 = lambda q: q.filter(User.name == bindparam('name'))
+        q1 = self.bakery(l1)
+
+        q2 = q1.with_criteria(l2)
+        is_not_(q2, q1)
+
+        self._assert_cache_key(q1._cache_key, [l1])
+        self._assert_cache_key(q2._cache_key, [l1, l2])
+
+    def test_chained_add_operator(self):
+        User = self.classes.User
+        session = Session()
+        l1 = lambda: session.query(User)
+        l2 = lambda q: q.filter(User.name == bindparam('name'))
+        q1 = self.bakery(l1)
+
+        q2 = q1 + l2
+        is_not_(q2, q1)
+
+        self._assert_cache_key(q1._cache_key, [l1])
+        self._assert_cache_key(q2._cache_key, [l1, l2])
+
+
+class ResultTest(BakedTest):
+    @classmethod
+    def setup_mappers(cls):
+        User = cls.classes.User
+        Address = cls.classes.Address
+
+        mapper(User, cls.tables.users, properties={
+            "addresses": relationship(
+                Address, order_by=cls.tables.addresses.c.id)
+        })
+        mapper(Address, cls.tables.addresses)
+
+    def test_no_steps_after_bake(self):
+        User = self.classes.User
+
+        canary = mock.Mock()
+
+        def step(q):
+            canary(q)
+            return q.filter(User.id == bindparam('id'))
+
+        for i in range(3):
+            bq = self.bakery(lambda s: s.query(User))
+            bq += step
+            eq_(
+                bq(Session()).params(id=7).all(),
+                [User(id=7)]
+            )
+        eq_(canary.call_count, 1)
+
+    def test_params(self):
+        User = self.classes.User
+
+        bq = self.bakery(lambda s: s.query(User.id, User.name))
+        bq += lambda q: q.filter(User.id == bindparam('id'))
+
+        for id_, name in [(7, 'jack'), (8, 'ed'), (9, 'fred')]:
+            eq_(
+                bq(Session()).params(id=id_).all(),
+                [(id_, name)]
+            )
+
+    def test_compiled_once(self):
+        User = self.classes.User
+
+        bq = self.bakery(lambda s: s.query(User))
+        bq += lambda q: q.filter(User.id == bindparam('id'))
+
+        bq(Session()).params(id=7).all()
+        context = bq._bakery[bq._cache_key]
+
+        context.statement.compile = mock.Mock(
+                side_effect=AssertionError("statement recompiled"))
+        try:
+            eq_(
+                bq(Session()).params(id=8).all(),
+                [User(id=8)]
+            )
+        finally:
+            del context.statement.compile
+
+    def test_first_no_result(self):
+        User = self.classes.User
+
+        bq = self.bakery(lambda s: s.query(User))
+        bq += lambda q: q.filter(User.name == 'asdf')
+
+        eq_(
+            bq(Session()).first(),
+            None
+        )
+
+    def test_first_multiple_result(self):
+        User = self.classes.User
+
+        bq = self.bakery(lambda s: s.query(User.id))
+        bq += lambda q: q.order_by(User.id)
+
+        eq_(
+            bq(Session()).first(),
+            (7, )
+        )
+
+    def test_one_no_result(self):
+        User = self.classes.User
+
+        bq = self.bakery(lambda s: s.query(User))
+        bq += lambda q: q.filter(User.name == 'asdf')
+
+        assert_raises(
+            orm_exc.NoResultFound,
+            bq(Session()).one
+        )
+
+    def test_one_multiple_result(self):
+        User = self.classes.User
+
+        bq = self.bakery(lambda s: s.query(User))
+
+        assert_raises(
+            orm_exc.MultipleResultsFound,
+            bq(Session()).one
+        )
+
+    def test_spoiled_full(self):
+        User = self.classes.User
+
+        canary = mock.Mock()
+
+        def step(q):
+            canary(q)
+            return q.filter(User.id == bindparam('id'))
+
+        for i in range(3):
+            bq = self.bakery(lambda s: s.query(User))
+            bq.spoil(full=True)
+            bq += step
+            eq_(
+                bq(Session()).params(id=7).all(),
+                [User(id=7)]
+            )
+        eq_(canary.call_count, 3)
+
+    def test_spoiled_partial(self):
+        User = self.classes.User
+
+        canary1 = mock.Mock()
+        canary2 = mock.Mock()
+
+        def step1(q):
+            canary1(q)
+            return q.order_by(User.id)
+
+        def step2(q):
+            canary2(q)
+            return q.filter(User.id == bindparam('id'))
+
+        for i in range(3):
+            bq = self.bakery(lambda s: s.query(User))
+            bq += step1
+            bq.spoil()
+            bq += step2
+            eq_(
+                bq(Session()).params(id=7).all(),
+                [User(id=7)]
+            )
+        eq_(canary1.call_count, 1)
+        eq_(canary2.call_count, 3)
+
+    def test_aggregate(self):
+        User = self.classes.User
+
+        bq = self.bakery(lambda s: s.query(func.count(User.id)))
+        bq += lambda q: q.filter(User.name != bindparam('name'))
+
+        eq_(bq(Session()).params(name='jack').all(), [(3, )])
+        eq_(bq(Session()).params(name='ed').all(), [(3, )])
+
+    def _test_eager_loader(self, opt):
+        User = self.classes.User
+        Address = self.classes.Address
+
+        for i in range(3):
+            bq = self.bakery(lambda s: s.query(User))
+            bq += lambda q: q.options(opt(User.addresses))
+            bq += lambda q: q.filter(User.id == bindparam('id'))
+
+            sess = Session()
+
+            def go():
+                u1 = bq(sess).params(id=8).one()
+                eq_(
+                    u1.addresses,
+                    [
+                        Address(id=2, email_address='ed@wood.com'),
+                        Address(id=3, email_address='ed@bettyboop.com'),
+                        Address(id=4, email_address='ed@lala.com')
+                    ]
+                )
+            self.assert_sql_count(
+                self.bind, go,
+                2 if opt is subqueryload else 1)
+            sess.close()
+
+    def test_subqueryload(self):
+        self._test_eager_loader(subqueryload)
+
+    def test_joinedload(self):
+        self._test_eager_loader(joinedload)
@@ -0,0 +1,217 @@
+from sqlalchemy.testing import eq_, is_
+from sqlalchemy import testing
+from sqlalchemy.orm import batchload, mapper, relationship, \
+    create_session, lazyload
+from sqlalchemy.testing import assert_raises
+from test.orm import _fixtures
+from sqlalchemy.engine import ResultProxy
+import sqlalchemy as sa
+
+
+class BatchLoadTest(_fixtures.FixtureTest):
+    run_inserts = 'once'
+    run_deletes = None
+
+    def _user_address_fixture(self, lazy='batch'):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                            mapper(Address, addresses),
+                            lazy=lazy,
+                            order_by=Address.id)
+        })
+        return User, Address
+
+    def test_basic(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_(self.static.user_address_result, users)
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_option(self):
+        User, Address = self._user_address_fixture(lazy='select')
+        sess = create_session()
+
+        users = sess.query(User).options(batchload(User.addresses)).\
+                    order_by(User.id).all()
+
+        def go():
+            eq_(self.static.user_address_result, users)
+        self.assert_sql_count(testing.db, go, 1)
+
+        sess.expunge_all()
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_(self.static.user_address_result, users)
+        self.assert_sql_count(testing.db, go, 4)
+
+    def test_override_with_lazyload(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+
+        users = sess.query(User).options(lazyload(User.addresses)).\
+                    order_by(User.id).all()
+
+        def go():
+            eq_(self.static.user_address_result, users)
+        self.assert_sql_count(testing.db, go, 4)
+
+    def test_same_query_only(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+
+        u7 = sess.query(User).filter_by(id=7).one()
+        u8 = sess.query(User).filter_by(id=8).one()
+
+        def go():
+            eq_(len(u7.addresses), 1)
+        self.assert_sql_count(testing.db, go, 1)
+        assert 'addresses' not in u8.__dict__
+
+        def go():
+            eq_(len(u8.addresses), 3)
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_expired_sibling_not_loaded(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+
+        u7, u8, u9, u10 = sess.query(User).order_by(User.id).all()
+        sess.expire(u8)
+
+        def go():
+            eq_(len(u7.addresses), 1)
+        self.assert_sql_count(testing.db, go, 1)
+        assert 'addresses' in u9.__dict__
+        assert 'addresses' not in u8.__dict__
+        eq_(len(u8.addresses), 3)
+
+    def test_one_to_many_scalar(self):
+        Address, addresses, users, User = (self.classes.Address,
+                                self.tables.addresses,
+                                self.tables.users,
+                                self.classes.User)
+
+        mapper(User, users, properties=dict(
+            address=relationship(mapper(Address, addresses),
+                                    lazy='batch', uselist=False)
+        ))
+        sess = create_session()
+        u7, u10 = sess.query(User).filter(User.id.in_([7, 10])).\
+                            order_by(User.id).all()
+
+        def go():
+            eq_(u7.address, Address(id=1))
+            is_(u10.address, None)
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_uselist_false_warning(self):
+        User, users, orders, Order = (self.classes.User,
+                                self.tables.users,
+                                self.tables.orders,
+                                self.classes.Order)
+
+        mapper(User, users, properties={
+            'order': relationship(Order, uselist=False, lazy='batch')
+        })
+        mapper(Order, orders)
+        sess = create_session()
+        u7 = sess.query(User).filter_by(id=7).one()
+        assert_raises(sa.exc.SAWarning, getattr, u7, 'order')
+
+    def test_many_to_one(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(Address, addresses, properties=dict(
+            user=relationship(mapper(User, users), lazy='batch')
+        ))
+        sess = create_session()
+        a1, a2, a3, a4, a5 = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            eq_(a1.user, User(id=7))
+            eq_(a5.user, User(id=9))
+            eq_(a2.user, User(id=8))
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_many_to_one_fetches_related_once(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(Address, addresses, properties=dict(
+            user=relationship(mapper(User, users), lazy='batch')
+        ))
+        sess = create_session()
+        a2, a3 = sess.query(Address).filter(Address.id.in_([2, 3])).\
+                        order_by(Address.id).all()
+
+        # addresses 2, 3 and 4 all refer to user 8, which is
+        # fetched alone, not once per address referring to it
+        fetched = []
+        fetchall = ResultProxy.fetchall
+
+        def counting_fetchall(result):
+            rows = fetchall(result)
+            fetched.append(len(rows))
+            return rows
+        ResultProxy.fetchall = counting_fetchall
+        try:
+            u8 = a2.user
+        finally:
+            ResultProxy.fetchall = fetchall
+        eq_(fetched, [1])
+        eq_(u8, User(id=8))
+        is_(a3.user, u8)
+
+    def test_many_to_one_identity_map(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(Address, addresses, properties=dict(
+            user=relationship(mapper(User, users), lazy='batch')
+        ))
+        sess = create_session()
+        u8 = sess.query(User).get(8)
+        a2, a3 = sess.query(Address).filter(Address.id.in_([2, 3])).\
+                        order_by(Address.id).all()
+
+        def go():
+            is_(a2.user, u8)
+            is_(a3.user, u8)
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_many_to_many(self):
+        keywords, items, item_keywords, Keyword, Item = (
+                                self.tables.keywords,
+                                self.tables.items,
+                                self.tables.item_keywords,
+                                self.classes.Keyword,
+                                self.classes.Item)
+
+        mapper(Keyword, keywords)
+        mapper(Item, items, properties=dict(
+                keywords=relationship(Keyword, secondary=item_keywords,
+                                    lazy='batch', order_by=keywords.c.id)))
+
+        sess = create_session()
+        result = sess.query(Item).order_by(Item.id).all()
+
+        def go():
+            eq_(self.static.item_keyword_result, result)
+        self.assert_sql_count(testing.db, go, 1)
@@ -0,0 +1,334 @@
+from sqlalchemy import testing
+from sqlalchemy.testing import eq_, is_, assert_raises
+from sqlalchemy.testing.schema import Table, Column
+from sqlalchemy.testing import fixtures
+from sqlalchemy import Integer, String, ForeignKey, exc
+from sqlalchemy.orm import mapper, Session
+from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.testing.assertsql import CompiledSQL
+from test.orm import _fixtures
+
+
+class BulkInsertUpdateTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    @classmethod
+    def setup_mappers(cls):
+        User, Address = cls.classes.User, cls.classes.Address
+        u, a = cls.tables.users, cls.tables.addresses
+
+        mapper(User, u)
+        mapper(Address, a)
+
+    def test_bulk_save_return_defaults(self):
+        User = self.classes.User
+
+        s = Session()
+        objects = [
+            User(name="u1"),
+            User(name="u2"),
+            User(name="u3")
+        ]
+        assert 'id' not in objects[0].__dict__
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: s.bulk_save_objects(objects, return_defaults=True),
+            CompiledSQL(
+                "INSERT INTO users (name) VALUES (:name)",
+                [{'name': 'u1'}]
+            ),
+            CompiledSQL(
+                "INSERT INTO users (name) VALUES (:name)",
+                [{'name': 'u2'}]
+            ),
+            CompiledSQL(
+                "INSERT INTO users (name) VALUES (:name)",
+                [{'name': 'u3'}]
+            ),
+        )
+        eq_(objects[0].__dict__['id'], 1)
+        eq_(objects[2].__dict__['id'], 3)
+        eq_(
+            [o for o in objects if o in s],
+            []
+        )
+
+    def test_bulk_save_no_defaults(self):
+        User = self.classes.User
+
+        s = Session()
+        objects = [
+            User(name="u1"),
+            User(name="u2"),
+            User(name="u3")
+        ]
+        assert 'id' not in objects[0].__dict__
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: s.bulk_save_objects(objects),
+            CompiledSQL(
+                "INSERT INTO users (name) VALUES (:name)",
+                [{'name': 'u1'}, {'name': 'u2'}, {'name': 'u3'}]
+            ),
+        )
+        assert 'id' not in objects[0].__dict__
+        eq_(
+            s.query(User.name).order_by(User.name).all(),
+            [('u1', ), ('u2', ), ('u3', )]
+        )
+
+    def test_bulk_save_updated_include_unchanged(self):
+        User = self.classes.User
+
+        s = Session(expire_on_commit=False)
+        objects = [
+            User(name="u1"),
+            User(name="u2"),
+            User(name="u3")
+        ]
+        s.add_all(objects)
+        s.commit()
+
+        objects[0].name = 'u1new'
+        objects[2].name = 'u3new'
+
+        s = Session()
+        self.assert_sql_execution(
+            testing.db,
+            lambda: s.bulk_save_objects(objects, update_changed_only=False),
+            CompiledSQL(
+                "UPDATE users SET name=:name WHERE "
+                "users.id = :users_id",
+                [{'users_id': 1, 'name': 'u1new'},
+                    {'users_id': 2, 'name': 'u2'},
+                    {'users_id': 3, 'name': 'u3new'}]
+            )
+        )
+
+    def test_bulk_update(self):
+        User = self.classes.User
+
+        s = Session(expire_on_commit=False)
+        objects = [
+            User(name="u1"),
+            User(name="u2"),
+            User(name="u3")
+        ]
+        s.add_all(objects)
+        s.commit()
+
+        s = Session()
+        self.assert_sql_execution(
+            testing.db,
+            lambda: s.bulk_update_mappings(
+                User,
+                [{'id': 1, 'name': 'u1new'},
+                    {'id': 2, 'name': 'u2'},
+                    {'id': 3, 'name': 'u3new'}]
+            ),
+            CompiledSQL(
+                "UPDATE users SET name=:name WHERE users.id = :users_id",
+                [{'users_id': 1, 'name': 'u1new'},
+                    {'users_id': 2, 'name': 'u2'},
+                    {'users_id': 3, 'name': 'u3new'}]
+            )
+        )
+        eq_(
+            s.query(User.id, User.name).order_by(User.id).all(),
+            [(1, 'u1new'), (2, 'u2'), (3, 'u3new')]
+        )
+
+    def test_bulk_update_changed_only(self):
+        User = self.classes.User
+
+        s = Session(expire_on_commit=False)
+        objects = [
+            User(name="u1"),
+            User(name="u2"),
+            User(name="u3")
+        ]
+        s.add_all(objects)
+        s.commit()
+
+        objects[0].name = 'u1new'
+        objects[2].name = 'u3new'
+
+        s = Session()
+        self.assert_sql_execution(
+            testing.db,
+            lambda: s.bulk_save_objects(objects),
+            CompiledSQL(
+                "UPDATE users SET name=:name WHERE "
+                "users.id = :users_id",
+                [{'users_id': 1, 'name': 'u1new'},
+                    {'users_id': 3, 'name': 'u3new'}]
+            )
+        )
+
+    def test_bulk_update_null_pk(self):
+        User = self.classes.User
+
+        s = Session()
+        assert_raises(
+            orm_exc.FlushError,
+            s.bulk_update_mappings,
+            User, [{'name': 'u1new'}]
+        )
+
+    def test_bulk_insert(self):
+        User = self.classes.User
+
+        s = Session()
+        self.assert_sql_execution(
+            testing.db,
+            lambda: s.bulk_insert_mappings(
+                User,
+                [{'id': 1, 'name': 'u1new'},
+                    {'id': 2, 'name': 'u2'},
+                    {'id': 3, 'name': 'u3new'}]
+            ),
+            CompiledSQL(
+                "INSERT INTO users (id, name) VALUES (:id, :name)",
+                [{'id': 1, 'name': 'u1new'},
+                    {'id': 2, 'name': 'u2'},
+                    {'id': 3, 'name': 'u3new'}]
+            )
+        )
+
+    def test_bulk_insert_return_defaults(self):
+        User = self.classes.User
+
+        s = Session()
+        mappings = [{'name': 'u1'}, {'name': 'u2'}]
+        s.bulk_insert_mappings(User, mappings, return_defaults=True)
+        eq_(mappings, [{'id': 1, 'name': 'u1'}, {'id': 2, 'name': 'u2'}])
+
+    def test_bulk_delete(self):
+        User = self.classes.User
+
+        s = Session()
+        s.bulk_insert_mappings(
+            User,
+            [{'id': 1, 'name': 'u1'},
+                {'id': 2, 'name': 'u2'},
+                {'id': 3, 'name': 'u3'}]
+        )
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: s.bulk_delete_mappings(User, [{'id': 1}, {'id': 3}]),
+            CompiledSQL(
+                "DELETE FROM users WHERE users.id = :id",
+                [{'id': 1}, {'id': 3}]
+            )
+        )
+        eq_(s.query(User.id).all(), [(2, )])
+
+    def test_bulk_rollback(self):
+        User = self.classes.User
+
+        s = Session()
+        s.bulk_insert_mappings(User, [{'id': 1, 'name': 'u1'}])
+        assert_raises(
+            exc.IntegrityError,
+            s.bulk_insert_mappings, User, [{'id': 1, 'name': 'u1'}]
+        )
+        is_(s._flushing, False)
+
+
+class BulkInheritanceTest(fixtures.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            'people', metadata,
+            Column(
+                'person_id', Integer,
+                primary_key=True,
+                test_needs_autoincrement=True),
+            Column('name', String(50)),
+            Column('type', String(30)))
+
+        Table(
+            'engineers', metadata,
+            Column(
+                'person_id', Integer,
+                ForeignKey('people.person_id'),
+                primary_key=True),
+            Column('status', String(30)),
+            Column('primary_language', String(50)))
+
+    @classmethod
+    def setup_classes(cls):
+        class Person(cls.Comparable):
+            pass
+
+        class Engineer(Person):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Person, Engineer = cls.classes.Person, cls.classes.Engineer
+        p, e = cls.tables.people, cls.tables.engineers
+
+        mapper(
+            Person, p, polymorphic_on=p.c.type,
+            polymorphic_identity='person')
+        mapper(Engineer, e, inherits=Person, polymorphic_identity='engineer')
+
+    def test_bulk_save_joined_inh_return_defaults(self):
+        Person, Engineer = self.classes.Person, self.classes.Engineer
+
+        s = Session()
+        objects = [
+            Engineer(name='e1', status='s1', primary_language='l1'),
+            Engineer(name='e2', status='s2', primary_language='l2'),
+            Person(name='p1'),
+        ]
+        s.bulk_save_objects(objects, return_defaults=True)
+
+        eq_(objects[1].person_id, 2)
+        eq_(
+            s.query(Person).order_by(Person.person_id).all(),
+            [
+                Engineer(name='e1', status='s1', primary_language='l1'),
+                Engineer(name='e2', status='s2', primary_language='l2'),
+                Person(name='p1'),
+            ]
+        )
+
+    def test_bulk_insert_mappings_joined_inh(self):
+        Person, Engineer = self.classes.Person, self.classes.Engineer
+
+        s = Session()
+        self.assert_sql_execution(
+            testing.db,
+            lambda: s.bulk_insert_mappings(
+                Engineer,
+                [{'person_id': 1, 'name': 'e1', 'status': 's1',
+                    'primary_language': 'l1'},
+                    {'person_id': 2, 'name': 'e2', 'status': 's2',
+                        'primary_language': 'l2'}]
+            ),
+            CompiledSQL(
+                "INSERT INTO people (person_id, name, type) VALUES "
+                "(:person_id, :name, :type)",
+                [{'person_id': 1, 'type': 'engineer', 'name': 'e1'},
+                    {'person_id': 2, 'type': 'engineer', 'name': 'e2'}]
+            ),
+            CompiledSQL(
+                "INSERT INTO engineers (person_id, status, primary_language) "
+                "VALUES (:person_id, :status, :primary_language)",
+                [{'person_id': 1, 'status': 's1', 'primary_language': 'l1'},
+                    {'person_id': 2, 'status': 's2',
+                        'primary_language': 'l2'}]
+            ),
+        )
+        eq_(
+            s.query(Person).order_by(Person.person_id).all(),
+            [
+                Engineer(name='e1', status='s1', primary_language='l1'),
+                Engineer(name='e2', status='s2', primary_language='l2'),
+            ]
+        )
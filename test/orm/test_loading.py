@@ -1,5 +1,6 @@
 from . import _fixtures
-from sqlalchemy.orm import loading, Session, aliased
+from sqlalchemy.orm import loading, Session, aliased, mapper, \
+    relationship, defer, lazyload
 from sqlalchemy.testing.assertions import eq_
 from sqlalchemy.util import KeyedTuple
 
@@ -8,6 +9,118 @@ from sqlalchemy.util import KeyedTuple
 # class LoadOnIdentTest(_fixtures.FixtureTest):
 # class InstanceProcessorTest(_fixture.FixtureTest):
 
+
+class BatchColumnPopulatorsTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    def _column_populator(self, key, col):
+        def fetch_col(state, dict_, row):
+            dict_[key] = row[col]
+        fetch_col.fetch_column = col
+        return (key, fetch_col)
+
+    def test_consecutive_columns_batched(self):
+        other = lambda state, dict_, row: dict_.update(other=True)
+        populators = [
+            self._column_populator('a', 'x'),
+            self._column_populator('b', 'y'),
+            ('other', other),
+            self._column_populator('c', 'z'),
+        ]
+        batched = loading._batch_column_populators(populators)
+        eq_([key for key, pop in batched], [None, 'other', 'c'])
+        eq_(batched[1:], populators[2:])
+
+        dict_ = {}
+        row = {'x': 1, 'y': 2, 'z': 3}
+        for key, pop in batched:
+            pop(None, dict_, row)
+        eq_(dict_, {'a': 1, 'b': 2, 'c': 3, 'other': True})
+
+    def test_load(self):
+        users, User = self.tables.users, self.classes.User
+        mapper(User, users)
+        s = Session()
+        s.add(User(id=1, name='u1'))
+        s.commit()
+        s.close()
+
+        plans = []
+        populate_columns = loading._populate_columns
+
+        def go(dict_, row, plan):
+            plans.append(tuple(key for key, col in plan))
+            return populate_columns(dict_, row, plan)
+
+        loading._populate_columns = go
+        try:
+            u1 = s.query(User).first()
+        finally:
+            loading._populate_columns = populate_columns
+
+        # both columns were populated by a single batched populator
+        eq_(plans, [('id', 'name')])
+        eq_(u1.__dict__['id'], 1)
+        eq_(u1.__dict__['name'], 'u1')
+
+
+class PopulatorsCacheTest(_fixtures.FixtureTest):
+    run_inserts = 'once'
+    run_deletes = None
+
+    def test_reused(self):
+        users, User = self.tables.users, self.classes.User
+        m = mapper(User, users)
+
+        s = Session()
+        eq_(s.query(User).get(7).name, 'jack')
+        eq_(len(m._populators_cache), 1)
+        s.close()
+
+        eq_(s.query(User).get(7).name, 'jack')
+        eq_(len(m._populators_cache), 1)
+        eq_(m._populators_cache.hits, 1)
+
+    def test_keyed_on_columns_present(self):
+        users, User = self.tables.users, self.classes.User
+        m = mapper(User, users)
+
+        s = Session()
+        u = s.query(User).options(defer('name')).get(7)
+        assert 'name' not in u.__dict__
+        s.close()
+
+        u = s.query(User).get(7)
+        eq_(u.__dict__['name'], 'jack')
+        eq_(len(m._populators_cache), 2)
+
+    def test_not_cached_for_eager_loaders(self):
+        users, User = self.tables.users, self.classes.User
+        addresses, Address = self.tables.addresses, self.classes.Address
+        m = mapper(User, users, properties={
+            'addresses': relationship(Address, lazy='joined')
+        })
+        mapper(Address, addresses)
+
+        s = Session()
+        eq_(len(s.query(User).get(7).addresses), 1)
+        eq_(len(m._populators_cache), 0)
+        s.close()
+
+        u = s.query(User).options(lazyload('addresses')).get(7)
+        assert 'addresses' not in u.__dict__
+        eq_(len(m._populators_cache), 1)
+
+    def test_not_cached_with_adapter(self):
+        users, User = self.tables.users, self.classes.User
+        m = mapper(User, users)
+
+        s = Session()
+        ua = aliased(User)
+        eq_(s.query(ua).filter(ua.id == 7).one().name, 'jack')
+        eq_(len(m._populators_cache), 0)
+
+
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = 'once'
     run_inserts = 'once'
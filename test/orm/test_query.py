@@ -2,7 +2,7 @@ from sqlalchemy.sql import operators
 from sqlalchemy import MetaData, null, exists, text, union, literal, \
     literal_column, func, between, Unicode, desc, and_, bindparam, \
     select, distinct, or_, collate, insert
-from sqlalchemy import inspect
+from sqlalchemy import inspect, event
 from sqlalchemy import exc as sa_exc, util
 from sqlalchemy.sql import compiler, table, column
 from sqlalchemy.sql import expression
@@ -10,7 +10,7 @@ from sqlalchemy.engine import default
 from sqlalchemy.orm import attributes, mapper, relationship, backref, \
     configure_mappers, create_session, synonym, Session, class_mapper, \
     aliased, column_property, joinedload_all, joinedload, Query,\
-    util as orm_util
+    util as orm_util, subqueryload, exc as orm_exc
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Table, Column
 import sqlalchemy as sa
@@ -21,6 +21,8 @@ from test.orm import _fixtures
 from sqlalchemy.testing import fixtures, engines
 
 from sqlalchemy.orm.util import join, outerjoin, with_parent
+from sqlalchemy.testing.util import gc_collect
+import weakref
 
 class QueryTest(_fixtures.FixtureTest):
     run_setup_mappers = 'once'
@@ -1923,6 +1925,194 @@ class YieldTest(QueryTest):
         assert q._yield_per
         eq_(q._execution_options, {"stream_results": True, "foo": "bar"})
 
+    def test_batch_processed_before_yield(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = iter(sess.query(User).order_by(User.id).yield_per(2))
+
+        u7 = next(q)
+        eq_(len(sess.identity_map), 2)
+
+    def test_stream(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = iter(sess.query(User).order_by(User.id).
+                    yield_per(2, stream=True))
+
+        ret = []
+        eq_(len(sess.identity_map), 0)
+        ret.append(next(q))
+        eq_(len(sess.identity_map), 1)
+        ret.append(next(q))
+        ret.append(next(q))
+        eq_(len(sess.identity_map), 3)
+        ret.extend(q)
+        eq_([u.id for u in ret], [7, 8, 9, 10])
+        eq_(ret[0].name, 'jack')
+
+    def test_stream_tuples(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = sess.query(User, User.name).order_by(User.id).\
+                    yield_per(3, stream=True)
+        eq_(
+            [(u.id, name) for u, name in q],
+            [(7, 'jack'), (8, 'ed'), (9, 'fred'), (10, 'chuck')]
+        )
+
+    def test_stream_expunge(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = iter(sess.query(User).order_by(User.id).
+                    yield_per(2, stream=True, expunge=True))
+
+        u7 = next(q)
+        assert u7 in sess
+        eq_(u7.name, 'jack')
+        u8 = next(q)
+        assert u7 not in sess
+        assert u8 in sess
+        eq_(len(sess.identity_map), 1)
+        eq_([u.id for u in q], [9, 10])
+        eq_(len(sess.identity_map), 0)
+
+    def test_batch_expunge(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = iter(sess.query(User).order_by(User.id).
+                    yield_per(2, expunge=True))
+
+        u7 = next(q)
+        u8 = next(q)
+        assert u7 in sess and u8 in sess
+        u9 = next(q)
+        assert u7 not in sess and u8 not in sess
+        assert u9 in sess
+        eq_(len(sess.identity_map), 2)
+
+    def test_expunge_leaves_existing(self):
+        User = self.classes.User
+
+        sess = create_session()
+        u8 = sess.query(User).get(8)
+        eq_(
+            [u.id for u in sess.query(User).order_by(User.id).
+                    yield_per(2, stream=True, expunge=True)],
+            [7, 8, 9, 10]
+        )
+        assert u8 in sess
+        eq_(len(sess.identity_map), 1)
+
+
+class ReadonlyTest(QueryTest):
+    def test_not_in_session(self):
+        User = self.classes.User
+
+        sess = create_session()
+        users = sess.query(User).readonly().order_by(User.id).all()
+        eq_([u.name for u in users], ['jack', 'ed', 'fred', 'chuck'])
+        eq_(len(sess.identity_map), 0)
+        for u in users:
+            assert u not in sess
+            assert inspect(u).detached
+
+    def test_identity_map_not_used(self):
+        User = self.classes.User
+
+        sess = create_session()
+        u8 = sess.query(User).get(8)
+        u8.name = 'modified'
+
+        ro_u8 = sess.query(User).readonly().filter(User.id == 8).one()
+        assert ro_u8 is not u8
+        eq_(ro_u8.name, 'ed')
+        eq_(u8.name, 'modified')
+
+        ro_u8 = sess.query(User).readonly().get(8)
+        assert ro_u8 is not u8
+        eq_(ro_u8.name, 'ed')
+
+    def test_no_load_event(self):
+        User = self.classes.User
+
+        canary = []
+        def load(target, context):
+            canary.append(target)
+
+        sess = create_session()
+        q = sess.query(User).order_by(User.id)
+
+        event.listen(User, 'load', load)
+        try:
+            q.readonly().all()
+            eq_(canary, [])
+            q.all()
+            eq_(len(canary), 4)
+        finally:
+            event.remove(User, 'load', load)
+
+    def test_no_history(self):
+        User = self.classes.User
+
+        sess = create_session()
+        u7 = sess.query(User).readonly().get(7)
+        state = inspect(u7)
+        assert not state.modified
+        eq_(state.attrs.name.history, ((), ['jack'], ()))
+
+    def test_joinedload_unique_within_result(self):
+        Address = self.classes.Address
+
+        sess = create_session()
+        addresses = sess.query(Address).readonly().\
+                        options(joinedload(Address.user)).\
+                        filter(Address.id.in_([2, 3, 4])).all()
+
+        def go():
+            eq_(set(a.user.id for a in addresses), set([8]))
+        self.assert_sql_count(testing.db, go, 0)
+        assert addresses[0].user is addresses[1].user is addresses[2].user
+        assert addresses[0].user not in sess
+        eq_(len(sess.identity_map), 0)
+
+    def test_subqueryload(self):
+        User = self.classes.User
+
+        sess = create_session()
+        users = sess.query(User).readonly().\
+                        options(subqueryload(User.addresses)).\
+                        order_by(User.id).all()
+        eq_([len(u.addresses) for u in users], [1, 3, 1, 0])
+        eq_(len(sess.identity_map), 0)
+
+    def test_yield_per_releases_prior_batches(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = iter(sess.query(User).readonly().order_by(User.id).yield_per(1))
+
+        u7 = next(q)
+        u7_ref = weakref.ref(u7)
+        del u7
+        next(q)
+        next(q)
+        gc_collect()
+        assert u7_ref() is None
+
+    def test_lazyload_detached(self):
+        User = self.classes.User
+
+        sess = create_session()
+        u7 = sess.query(User).readonly().get(7)
+        assert_raises(
+            orm_exc.DetachedInstanceError,
+            getattr, u7, 'addresses'
+        )
 
 
 class HintsTest(QueryTest, AssertsCompiledSQL):
@@ -0,0 +1,641 @@
+from sqlalchemy.testing import eq_, is_, is_not_
+from sqlalchemy import testing
+from sqlalchemy.testing.schema import Table, Column
+from sqlalchemy import Integer, String, ForeignKey, ForeignKeyConstraint
+from sqlalchemy.orm import selectinload, selectinload_all, \
+    mapper, relationship, create_session, lazyload, aliased, \
+    subqueryload, joinedload, Session
+from sqlalchemy.testing import assert_raises, assert_raises_message
+from sqlalchemy.testing import fixtures
+from test.orm import _fixtures
+from sqlalchemy.engine import ResultProxy
+import sqlalchemy as sa
+
+
+class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
+    run_inserts = 'once'
+    run_deletes = None
+
+    def test_basic(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                            mapper(Address, addresses),
+                            order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(selectinload(User.addresses))
+
+        def go():
+            eq_(
+                    [User(id=7, addresses=[
+                            Address(id=1, email_address='jack@bean.com')])],
+                    q.filter(User.id == 7).all()
+            )
+
+        self.assert_sql_count(testing.db, go, 2)
+
+        def go():
+            eq_(
+                self.static.user_address_result,
+                q.order_by(User.id).all()
+            )
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_from_aliased(self):
+        users, Dingaling, User, dingalings, Address, addresses = (
+                                self.tables.users,
+                                self.classes.Dingaling,
+                                self.classes.User,
+                                self.tables.dingalings,
+                                self.classes.Address,
+                                self.tables.addresses)
+
+        mapper(Dingaling, dingalings)
+        mapper(Address, addresses, properties={
+            'dingalings': relationship(Dingaling, order_by=Dingaling.id)
+        })
+        mapper(User, users, properties={
+            'addresses': relationship(
+                            Address,
+                            order_by=Address.id)
+        })
+        sess = create_session()
+
+        u = aliased(User)
+
+        q = sess.query(u).\
+                options(selectinload_all(u.addresses, Address.dingalings))
+
+        def go():
+            eq_(
+                [
+                    User(id=8, addresses=[
+                        Address(id=2, email_address='ed@wood.com',
+                                    dingalings=[Dingaling()]),
+                        Address(id=3, email_address='ed@bettyboop.com'),
+                        Address(id=4, email_address='ed@lala.com'),
+                    ]),
+                    User(id=9, addresses=[
+                        Address(id=5, dingalings=[Dingaling()])
+                    ]),
+                ],
+                q.filter(u.id.in_([8, 9])).order_by(u.id).all()
+            )
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_from_get(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                            mapper(Address, addresses),
+                            order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(selectinload(User.addresses))
+
+        def go():
+            eq_(
+                    User(id=7, addresses=[
+                            Address(id=1, email_address='jack@bean.com')]),
+                    q.get(7)
+            )
+
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_disable_dynamic(self):
+        """test no selectin option on a dynamic."""
+
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address, lazy="dynamic")
+        })
+        mapper(Address, addresses)
+        sess = create_session()
+
+        assert_raises_message(
+            sa.exc.InvalidRequestError,
+            "User.addresses' does not support object population - "
+            "eager loading cannot be applied.",
+            sess.query(User).options(selectinload(User.addresses)).first,
+        )
+
+    def test_many_to_many_plain(self):
+        keywords, items, item_keywords, Keyword, Item = (
+                                self.tables.keywords,
+                                self.tables.items,
+                                self.tables.item_keywords,
+                                self.classes.Keyword,
+                                self.classes.Item)
+
+        mapper(Keyword, keywords)
+        mapper(Item, items, properties=dict(
+                keywords=relationship(Keyword, secondary=item_keywords,
+                                    lazy='selectin', order_by=keywords.c.id)))
+
+        q = create_session().query(Item).order_by(Item.id)
+
+        def go():
+            eq_(self.static.item_keyword_result, q.all())
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_options_pathing(self):
+        users, Keyword, orders, items, order_items, Order, Item, User, \
+            keywords, item_keywords = (self.tables.users,
+                                self.classes.Keyword,
+                                self.tables.orders,
+                                self.tables.items,
+                                self.tables.order_items,
+                                self.classes.Order,
+                                self.classes.Item,
+                                self.classes.User,
+                                self.tables.keywords,
+                                self.tables.item_keywords)
+
+        mapper(User, users, properties={
+            'orders': relationship(Order, order_by=orders.c.id),
+        })
+        mapper(Order, orders, properties={
+            'items': relationship(Item,
+                        secondary=order_items, order_by=items.c.id),
+        })
+        mapper(Item, items, properties={
+            'keywords': relationship(Keyword,
+                                        secondary=item_keywords,
+                                        order_by=keywords.c.id)
+        })
+        mapper(Keyword, keywords)
+
+        for options, count in [
+            ([selectinload(User.orders)], 2),
+            ([selectinload_all(User.orders, Order.items)], 3),
+            ([selectinload_all(User.orders, Order.items, Item.keywords)], 4),
+            ([selectinload(User.orders),
+                joinedload(User.orders, Order.items),
+                selectinload(User.orders, Order.items, Item.keywords)], 3),
+            ([subqueryload(User.orders),
+                selectinload(User.orders, Order.items)], 3),
+        ]:
+            sess = create_session()
+            result = []
+
+            def go():
+                result[:] = sess.query(User).options(*options).\
+                                order_by(User.id).all()
+            self.assert_sql_count(testing.db, go, count)
+            eq_(result, self.static.user_item_keyword_result)
+
+    def test_chunksize(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                            mapper(Address, addresses),
+                            order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(
+                    selectinload(User.addresses, chunksize=2))
+
+        def go():
+            eq_(
+                self.static.user_address_result,
+                q.order_by(User.id).all()
+            )
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_yield_per(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                            mapper(Address, addresses),
+                            lazy='selectin',
+                            order_by=Address.id)
+        })
+        sess = create_session()
+
+        def go():
+            eq_(
+                self.static.user_address_result,
+                list(sess.query(User).order_by(User.id).yield_per(2))
+            )
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_limit(self):
+        """Limit operations combined with lazy-load relationships."""
+
+        users, items, order_items, orders, Item, User, Address, Order, \
+            addresses = (self.tables.users,
+                                self.tables.items,
+                                self.tables.order_items,
+                                self.tables.orders,
+                                self.classes.Item,
+                                self.classes.User,
+                                self.classes.Address,
+                                self.classes.Order,
+                                self.tables.addresses)
+
+        mapper(Item, items)
+        mapper(Order, orders, properties={
+            'items': relationship(Item, secondary=order_items,
+                lazy='selectin', order_by=items.c.id)
+        })
+        mapper(User, users, properties={
+            'addresses': relationship(mapper(Address, addresses),
+                            lazy='selectin',
+                            order_by=addresses.c.id),
+            'orders': relationship(Order, lazy='select', order_by=orders.c.id)
+        })
+
+        sess = create_session()
+        q = sess.query(User)
+
+        l = q.order_by(User.id).limit(2).offset(1).all()
+        eq_(self.static.user_all_result[1:3], l)
+
+        sess = create_session()
+        l = q.order_by(sa.desc(User.id)).limit(2).offset(2).all()
+        eq_(list(reversed(self.static.user_all_result[0:2])), l)
+
+    def test_one_to_many_scalar(self):
+        Address, addresses, users, User = (self.classes.Address,
+                                self.tables.addresses,
+                                self.tables.users,
+                                self.classes.User)
+
+        mapper(User, users, properties=dict(
+            address=relationship(mapper(Address, addresses),
+                                    lazy='selectin', uselist=False)
+        ))
+        q = create_session().query(User)
+
+        def go():
+            l = q.filter(users.c.id == 7).all()
+            eq_([User(id=7, address=Address(id=1))], l)
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_many_to_one(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(Address, addresses, properties=dict(
+            user=relationship(mapper(User, users), lazy='selectin')
+        ))
+        sess = create_session()
+        q = sess.query(Address)
+
+        def go():
+            a = q.filter(addresses.c.id == 1).one()
+            is_not_(a.user, None)
+            u1 = sess.query(User).get(7)
+            is_(a.user, u1)
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_many_to_one_fetches_related_once(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(Address, addresses, properties=dict(
+            user=relationship(mapper(User, users), lazy='selectin')
+        ))
+        sess = create_session()
+
+        # addresses 2, 3 and 4 all refer to user 8; loading address 2
+        # fetches user 8 alone, not once per address referring to it
+        fetched = []
+        fetchall = ResultProxy.fetchall
+
+        def counting_fetchall(result):
+            rows = fetchall(result)
+            fetched.append(len(rows))
+            return rows
+        ResultProxy.fetchall = counting_fetchall
+        try:
+            a2 = sess.query(Address).filter(Address.id == 2).one()
+        finally:
+            ResultProxy.fetchall = fetchall
+        eq_(fetched, [1, 1])
+        eq_(a2.user, User(id=8))
+
+    def test_double_with_aggregate(self):
+        User, users, orders, Order = (self.classes.User,
+                                self.tables.users,
+                                self.tables.orders,
+                                self.classes.Order)
+
+        max_orders_by_user = sa.select(
+                            [sa.func.max(orders.c.id).label('order_id')],
+                            group_by=[orders.c.user_id]
+                        ).alias('max_orders_by_user')
+
+        max_orders = orders.select(
+                            orders.c.id == max_orders_by_user.c.order_id).\
+                                alias('max_orders')
+
+        mapper(Order, orders)
+        mapper(User, users, properties={
+               'orders': relationship(Order, backref='user',
+                                lazy='selectin', order_by=orders.c.id),
+               'max_order': relationship(
+                                mapper(Order, max_orders, non_primary=True),
+                                lazy='selectin', uselist=False)
+               })
+
+        q = create_session().query(User)
+
+        def go():
+            eq_([
+                User(id=7, orders=[
+                        Order(id=1),
+                        Order(id=3),
+                        Order(id=5),
+                    ],
+                    max_order=Order(id=5)
+                ),
+                User(id=8, orders=[]),
+                User(id=9, orders=[Order(id=2), Order(id=4)],
+                    max_order=Order(id=4)
+                ),
+                User(id=10),
+            ], q.order_by(User.id).all())
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_uselist_false_warning(self):
+        """test that multiple rows received by a
+        uselist=False raises a warning."""
+
+        User, users, orders, Order = (self.classes.User,
+                                self.tables.users,
+                                self.tables.orders,
+                                self.classes.Order)
+
+        mapper(User, users, properties={
+            'order': relationship(Order, uselist=False)
+        })
+        mapper(Order, orders)
+        s = create_session()
+        assert_raises(sa.exc.SAWarning,
+                s.query(User).options(selectinload(User.order)).all)
+
+
+class LoadOnExistingTest(_fixtures.FixtureTest):
+    """test that loaders from a base Query fully populate."""
+
+    run_inserts = 'once'
+    run_deletes = None
+
+    def _collection_to_scalar_fixture(self):
+        User, Address, Dingaling = self.classes.User, \
+            self.classes.Address, self.classes.Dingaling
+        mapper(User, self.tables.users, properties={
+            'addresses': relationship(Address),
+        })
+        mapper(Address, self.tables.addresses, properties={
+            'dingaling': relationship(Dingaling)
+        })
+        mapper(Dingaling, self.tables.dingalings)
+
+        sess = Session(autoflush=False)
+        return User, Address, Dingaling, sess
+
+    def _eager_config_fixture(self):
+        User, Address = self.classes.User, self.classes.Address
+        mapper(User, self.tables.users, properties={
+            'addresses': relationship(Address, lazy="selectin"),
+        })
+        mapper(Address, self.tables.addresses)
+        sess = Session(autoflush=False)
+        return User, Address, sess
+
+    def test_no_query_on_refresh(self):
+        User, Address, sess = self._eager_config_fixture()
+
+        u1 = sess.query(User).get(8)
+        assert 'addresses' in u1.__dict__
+        sess.expire(u1)
+
+        def go():
+            eq_(u1.id, 8)
+        self.assert_sql_count(testing.db, go, 1)
+        assert 'addresses' not in u1.__dict__
+
+    def test_populate_existing_propagate(self):
+        User, Address, Dingaling, sess = self._collection_to_scalar_fixture()
+
+        u1 = sess.query(User).get(8)
+        u1.addresses[2].email_address = "foofoo"
+        sess.query(User).options(selectinload_all("addresses")).\
+                        populate_existing().filter_by(id=8).all()
+        assert u1.addresses[2].email_address == 'ed@lala.com'
+
+
+class SelfReferentialTest(fixtures.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('nodes', metadata,
+            Column('id', Integer, primary_key=True,
+                            test_needs_autoincrement=True),
+            Column('parent_id', Integer, ForeignKey('nodes.id')),
+            Column('data', String(30)))
+
+    def test_basic(self):
+        nodes = self.tables.nodes
+
+        class Node(fixtures.ComparableEntity):
+            def append(self, node):
+                self.children.append(node)
+
+        mapper(Node, nodes, properties={
+            'children': relationship(Node,
+                                lazy='selectin',
+                                join_depth=3, order_by=nodes.c.id)
+        })
+        sess = create_session()
+        n1 = Node(data='n1')
+        n1.append(Node(data='n11'))
+        n1.append(Node(data='n12'))
+        n1.append(Node(data='n13'))
+        n1.children[1].append(Node(data='n121'))
+        n1.children[1].append(Node(data='n122'))
+        n1.children[1].append(Node(data='n123'))
+        n2 = Node(data='n2')
+        n2.append(Node(data='n21'))
+        n2.children[0].append(Node(data='n211'))
+        n2.children[0].append(Node(data='n212'))
+
+        sess.add(n1)
+        sess.add(n2)
+        sess.flush()
+        sess.expunge_all()
+
+        def go():
+            d = sess.query(Node).filter(Node.data.in_(['n1', 'n2'])).\
+                            order_by(Node.data).all()
+            eq_([Node(data='n1', children=[
+                    Node(data='n11'),
+                    Node(data='n12', children=[
+                        Node(data='n121'),
+                        Node(data='n122'),
+                        Node(data='n123')
+                    ]),
+                    Node(data='n13')
+                ]),
+                Node(data='n2', children=[
+                    Node(data='n21', children=[
+                        Node(data='n211'),
+                        Node(data='n212'),
+                    ])
+                ])
+            ], d)
+        self.assert_sql_count(testing.db, go, 4)
+
+    def test_no_depth(self):
+        """no join depth is set, so no eager loading occurs."""
+
+        nodes = self.tables.nodes
+
+        class Node(fixtures.ComparableEntity):
+            def append(self, node):
+                self.children.append(node)
+
+        mapper(Node, nodes, properties={
+            'children': relationship(Node, lazy='selectin')
+        })
+        sess = create_session()
+        n1 = Node(data='n1')
+        n1.append(Node(data='n11'))
+        n1.append(Node(data='n12'))
+        n1.children[1].append(Node(data='n121'))
+        sess.add(n1)
+        sess.flush()
+        sess.expunge_all()
+
+        def go():
+            d = sess.query(Node).filter_by(data='n1').first()
+            eq_(Node(data='n1', children=[
+                    Node(data='n11'),
+                    Node(data='n12', children=[
+                        Node(data='n121'),
+                    ]),
+                ]), d)
+        self.assert_sql_count(testing.db, go, 3)
+
+
+class CompositeKeyTest(fixtures.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('parent', metadata,
+            Column('id_a', Integer, primary_key=True),
+            Column('id_b', Integer, primary_key=True),
+            Column('data', String(30)))
+        Table('child', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('parent_id_a', Integer),
+            Column('parent_id_b', Integer),
+            ForeignKeyConstraint(['parent_id_a', 'parent_id_b'],
+                            ['parent.id_a', 'parent.id_b']))
+
+    @classmethod
+    def setup_classes(cls):
+        class Parent(cls.Comparable):
+            pass
+
+        class Child(cls.Comparable):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Parent, Child = cls.classes.Parent, cls.classes.Child
+        mapper(Parent, cls.tables.parent, properties={
+            'children': relationship(Child, lazy='selectin',
+                                order_by=cls.tables.child.c.id,
+                                backref='parent')
+        })
+        mapper(Child, cls.tables.child)
+
+    @classmethod
+    def insert_data(cls):
+        Parent, Child = cls.classes.Parent, cls.classes.Child
+        sess = create_session()
+        sess.add_all([
+            Parent(id_a=1, id_b=1, children=[Child(id=1), Child(id=2)]),
+            Parent(id_a=1, id_b=2, children=[Child(id=3)]),
+            Parent(id_a=2, id_b=1),
+        ])
+        sess.flush()
+
+    def test_load(self):
+        Parent, Child = self.classes.Parent, self.classes.Child
+        sess = create_session()
+
+        def go():
+            eq_(
+                sess.query(Parent).order_by(Parent.id_a, Parent.id_b).all(),
+                [
+                    Parent(id_a=1, id_b=1,
+                            children=[Child(id=1), Child(id=2)]),
+                    Parent(id_a=1, id_b=2, children=[Child(id=3)]),
+                    Parent(id_a=2, id_b=1, children=[]),
+                ]
+            )
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_chunksize(self):
+        Parent, Child = self.classes.Parent, self.classes.Child
+        sess = create_session()
+
+        def go():
+            eq_(
+                sess.query(Parent).
+                    options(selectinload(Parent.children, chunksize=1)).
+                    order_by(Parent.id_a, Parent.id_b).all(),
+                [
+                    Parent(id_a=1, id_b=1,
+                            children=[Child(id=1), Child(id=2)]),
+                    Parent(id_a=1, id_b=2, children=[Child(id=3)]),
+                    Parent(id_a=2, id_b=1, children=[]),
+                ]
+            )
+        self.assert_sql_count(testing.db, go, 4)
+
+    def test_many_to_one(self):
+        Parent, Child = self.classes.Parent, self.classes.Child
+        sess = create_session()
+
+        def go():
+            children = sess.query(Child).\
+                options(selectinload(Child.parent),
+                        lazyload(Child.parent, Parent.children)).\
+                order_by(Child.id).all()
+            eq_(
+                [(c.id, c.parent.id_a, c.parent.id_b) for c in children],
+                [(1, 1, 1), (2, 1, 1), (3, 1, 2)]
+            )
+            is_(children[0].parent, children[1].parent)
+        self.assert_sql_count(testing.db, go, 2)
@@ -0,0 +1,263 @@
+from sqlalchemy.testing import eq_, is_, assert_raises_message
+from sqlalchemy import testing
+from sqlalchemy import Integer, String, ForeignKey, \
+    ForeignKeyConstraint, exc as sa_exc
+from sqlalchemy.testing.schema import Table, Column
+from sqlalchemy.orm import mapper, relationship, create_session, \
+    class_mapper
+from sqlalchemy.testing import fixtures
+
+
+class UniqueKeyTest(fixtures.MappedTest):
+    run_setup_mappers = 'each'
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('users', metadata,
+            Column('id', Integer, primary_key=True,
+                            test_needs_autoincrement=True),
+            Column('name', String(30), unique=True, nullable=False),
+        )
+        Table('addresses', metadata,
+            Column('id', Integer, primary_key=True,
+                            test_needs_autoincrement=True),
+            Column('user_name', String(30), ForeignKey('users.name')),
+            Column('email', String(50)),
+        )
+        Table('regions', metadata,
+            Column('id', Integer, primary_key=True,
+                            test_needs_autoincrement=True),
+            Column('country', String(2), nullable=False),
+            Column('code', String(10), nullable=False),
+        )
+        Table('offices', metadata,
+            Column('id', Integer, primary_key=True,
+                            test_needs_autoincrement=True),
+            Column('country', String(2)),
+            Column('region_code', String(10)),
+            ForeignKeyConstraint(['country', 'region_code'],
+                                ['regions.country', 'regions.code']),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class User(cls.Comparable):
+            pass
+
+        class Address(cls.Comparable):
+            pass
+
+        class Region(cls.Comparable):
+            pass
+
+        class Office(cls.Comparable):
+            pass
+
+    @classmethod
+    def insert_data(cls):
+        users, addresses, regions, offices = (cls.tables.users,
+                                cls.tables.addresses,
+                                cls.tables.regions,
+                                cls.tables.offices)
+        users.insert().execute(
+            dict(id=1, name='jack'),
+            dict(id=2, name='ed'),
+        )
+        addresses.insert().execute(
+            dict(id=1, user_name='jack', email='jack@jack'),
+            dict(id=2, user_name='ed', email='ed@ed'),
+            dict(id=3, user_name=None, email='nobody@nobody'),
+        )
+        regions.insert().execute(
+            dict(id=1, country='us', code='ny'),
+            dict(id=2, country='uk', code='ny'),
+        )
+        offices.insert().execute(
+            dict(id=1, country='us', region_code='ny'),
+            dict(id=2, country='uk', region_code='ny'),
+        )
+
+    def _user_address_fixture(self, unique_keys=True):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users,
+                unique_keys=[users.c.name] if unique_keys else None)
+        mapper(Address, addresses, properties={
+            'user': relationship(User)
+        })
+        return User, Address
+
+    def _region_office_fixture(self):
+        regions, offices, Region, Office = (self.tables.regions,
+                                self.tables.offices,
+                                self.classes.Region,
+                                self.classes.Office)
+
+        mapper(Region, regions,
+                unique_keys=[(regions.c.country, regions.c.code)])
+        mapper(Office, offices, properties={
+            'region': relationship(Region)
+        })
+        return Region, Office
+
+    def test_unique_keys_collection(self):
+        User, Address = self._user_address_fixture()
+        users = self.tables.users
+        m = class_mapper(User)
+        eq_(m.unique_keys, ((users.c.name, ), ))
+
+    def test_missing_column(self):
+        users, addresses, User = (self.tables.users,
+                                self.tables.addresses,
+                                self.classes.User)
+        assert_raises_message(
+            sa_exc.ArgumentError,
+            "could not locate unique key columns 'addresses.email'",
+            mapper, User, users, unique_keys=[addresses.c.email]
+        )
+
+    def test_lazyload_uses_identity_map(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        jack = sess.query(User).filter_by(name='jack').one()
+        a1 = sess.query(Address).get(1)
+
+        def go():
+            is_(a1.user, jack)
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_lazyload_no_unique_key(self):
+        User, Address = self._user_address_fixture(unique_keys=False)
+        sess = create_session()
+        jack = sess.query(User).filter_by(name='jack').one()
+        a1 = sess.query(Address).get(1)
+
+        def go():
+            is_(a1.user, jack)
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_lazyload_not_present(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        a2 = sess.query(Address).get(2)
+
+        def go():
+            eq_(a2.user, User(id=2, name='ed'))
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_lazyload_none(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        a3 = sess.query(Address).get(3)
+
+        def go():
+            is_(a3.user, None)
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_stale_value_not_used(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        jack = sess.query(User).filter_by(name='jack').one()
+        jack.name = 'jackson'
+        a1 = sess.query(Address).get(1)
+
+        def go():
+            is_(a1.user, jack)
+        # jack is not found under 'jack' in the identity map; the SELECT
+        # locates the unchanged row and returns the identity-mapped object
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_indexed_on_flush(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = User(id=3, name='wendy')
+        sess.add(u)
+        sess.flush()
+
+        def go():
+            is_(sess.query(User).get_unique(name='wendy'), u)
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_get_unique(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+
+        ed = sess.query(User).get_unique(name='ed')
+        eq_(ed, User(id=2, name='ed'))
+
+        def go():
+            is_(sess.query(User).get_unique(name='ed'), ed)
+        self.assert_sql_count(testing.db, go, 0)
+
+        is_(sess.query(User).get_unique(name='nobody'), None)
+
+    def test_get_unique_expired(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        ed = sess.query(User).get_unique(name='ed')
+        sess.expire(ed)
+
+        def go():
+            is_(sess.query(User).get_unique(name='ed'), ed)
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_get_unique_wrong_attributes(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "has no unique key consisting of attributes 'id'",
+            sess.query(User).get_unique, id=1
+        )
+
+    def test_get_unique_existing_criterion(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            r"Query.get_unique\(\) being called on a Query with "
+            "existing criterion",
+            sess.query(User).filter(User.id == 1).get_unique, name='ed'
+        )
+
+    def test_get_unique_existing_criterion_identity_map(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        ed = sess.query(User).get_unique(name='ed')
+        assert ed in sess
+
+        for q in (
+            sess.query(User).filter(User.id == 1),
+            sess.query(User).limit(1),
+            sess.query(User).from_statement("select * from users"),
+        ):
+            assert_raises_message(
+                sa_exc.InvalidRequestError,
+                r"Query.get_unique\(\) being called on a Query with "
+                "existing criterion",
+                q.get_unique, name='ed'
+            )
+
+    def test_composite_lazyload(self):
+        Region, Office = self._region_office_fixture()
+        sess = create_session()
+        regions = sess.query(Region).order_by(Region.id).all()
+        o1, o2 = sess.query(Office).order_by(Office.id).all()
+
+        def go():
+            is_(o1.region, regions[0])
+            is_(o2.region, regions[1])
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_composite_get_unique(self):
+        Region, Office = self._region_office_fixture()
+        sess = create_session()
+        r = sess.query(Region).get_unique(code='ny', country='uk')
+        eq_(r, Region(id=2))
+
+        def go():
+            is_(sess.query(Region).get_unique(country='uk', code='ny'), r)
+        self.assert_sql_count(testing.db, go, 0)
@@ -4,10 +4,13 @@ from sqlalchemy.testing import engines
 from sqlalchemy.testing.schema import Table, Column
 from test.orm import _fixtures
 from sqlalchemy.testing import fixtures
-from sqlalchemy import Integer, String, ForeignKey, func
+from sqlalchemy import Integer, String, ForeignKey, func, MetaData
 from sqlalchemy.orm import mapper, relationship, backref, \
                             create_session, unitofwork, attributes,\
-                            Session, class_mapper, sync, exc as orm_exc
+                            Session, class_mapper, sync, exc as orm_exc, \
+                            persistence, clear_mappers
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.testing.mock import Mock
 
 from sqlalchemy.testing.assertsql import AllOf, CompiledSQL
 
@@ -1323,6 +1326,114 @@ class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
             ),
         )
 
+    @testing.requires.multivalues_insert_returning
+    def test_batch_multivalues_returning(self):
+        """test rows lacking primary keys are INSERTed in one
+        statement, with primary keys retrieved via RETURNING.
+
+        """
+
+        t = self.tables.t
+
+        class T(fixtures.ComparableEntity):
+            pass
+        mapper(T, t)
+        eng = engines.testing_engine(
+                        options={'multivalues_insert_returning': True})
+        sess = Session(eng)
+        objects = [T(data='t%d' % i) for i in range(1, 6)]
+        sess.add_all(objects)
+
+        self.assert_sql_count(eng, sess.flush, 1)
+
+        ids = [obj.id for obj in objects]
+        eq_(sorted(set(ids)), ids)
+        eq_(
+            sess.query(T.id, T.data).order_by(T.id).all(),
+            [(obj.id, obj.data) for obj in objects]
+        )
+        eq_([obj.def_ for obj in objects], ['def1'] * 5)
+
+class MultivaluesReturningInsertTest(fixtures.TestBase,
+                                        testing.AssertsCompiledSQL):
+    """test the multiple-VALUES INSERT..RETURNING emitted for rows
+    lacking primary keys, against a stub connection."""
+
+    __dialect__ = postgresql.dialect()
+
+    def teardown(self):
+        clear_mappers()
+
+    def _fixture(self, returned_rows):
+        m = MetaData()
+        t = Table('t', m,
+            Column('id', Integer, primary_key=True),
+            Column('data', String(50)),
+            Column('def_', String(50), server_default='def1'),
+            Column('sdef', String(50), default='s1')
+        )
+
+        class T(fixtures.ComparableEntity):
+            pass
+        mapper(T, t)
+
+        executed = []
+        dialect = self.__dialect__
+
+        def execute(stmt):
+            executed.append(stmt)
+            compiled = stmt.compile(dialect=dialect)
+            return Mock(
+                        fetchall=Mock(return_value=returned_rows),
+                        context=Mock(postfetch_cols=compiled.postfetch))
+        conn = Mock(execute=execute, dialect=dialect)
+        return t, T, conn, executed
+
+    def _records(self, conn, objects):
+        m = class_mapper(objects[0].__class__)
+        records = []
+        for obj in objects:
+            state = attributes.instance_state(obj)
+            records.append((state, state.dict, {'data': obj.data},
+                                m, conn, None, False))
+        return records
+
+    def test_statement_and_primary_keys(self):
+        t, T, conn, executed = self._fixture([(10, ), (11, ), (12, )])
+        objects = [T(data='t1'), T(data='t2'), T(data='t3')]
+
+        persistence._emit_multivalues_returning_insert(
+                            Mock(), conn, t, self._records(conn, objects))
+
+        eq_(len(executed), 1)
+        self.assert_compile(
+            executed[0],
+            "INSERT INTO t (data, sdef) VALUES "
+            "(%(data_0)s, %(sdef_0)s), (%(data_1)s, %(sdef_1)s), "
+            "(%(data_2)s, %(sdef_2)s) RETURNING t.id",
+            checkparams={
+                'data_0': 't1', 'data_1': 't2', 'data_2': 't3',
+                'sdef_0': 's1', 'sdef_1': 's1', 'sdef_2': 's1'}
+        )
+        eq_([obj.id for obj in objects], [10, 11, 12])
+
+        # scalar defaults are populated, server defaults are expired
+        for obj in objects:
+            eq_(obj.__dict__['sdef'], 's1')
+            assert 'def_' in attributes.instance_state(obj).expired_attributes
+
+    def test_row_count_mismatch(self):
+        t, T, conn, executed = self._fixture([(10, )])
+        objects = [T(data='t1'), T(data='t2')]
+
+        assert_raises_message(
+            orm_exc.FlushError,
+            "Multi-row INSERT statement on table 't' expected to return "
+            "2 row\\(s\\); 1 were returned.",
+            persistence._emit_multivalues_returning_insert,
+            Mock(), conn, t, self._records(conn, objects)
+        )
+
 class LoadersUsingCommittedTest(UOWTest):
         """Test that events which occur within a flush()
         get the same attribute loading behavior as on the outside
@@ -0,0 +1,163 @@
+from sqlalchemy.testing import eq_, is_, is_not_, ne_
+from sqlalchemy.testing import fixtures
+from sqlalchemy import MetaData, Table, Column, Integer, String, \
+    select, func, bindparam, text, literal_column, union, and_
+from sqlalchemy.sql import table, column
+from sqlalchemy.types import TypeDecorator
+
+
+class CacheKeyTest(fixtures.TestBase):
+    @classmethod
+    def setup_class(cls):
+        global t1, t2
+        m = MetaData()
+        t1 = Table('t1', m,
+                Column('a', Integer, primary_key=True),
+                Column('b', String(20)))
+        t2 = Table('t2', m,
+                Column('c', Integer, primary_key=True),
+                Column('d', String(20)))
+
+    def _key(self, stmt):
+        return stmt._generate_cache_key()
+
+    def _assert_same(self, s1, s2):
+        k1, k2 = self._key(s1), self._key(s2)
+        is_not_(k1, None)
+        is_not_(k2, None)
+        eq_(k1[0], k2[0])
+        eq_(hash(k1[0]), hash(k2[0]))
+
+    def _assert_different(self, s1, s2):
+        ne_(self._key(s1)[0], self._key(s2)[0])
+
+    def test_literal_values_excluded(self):
+        self._assert_same(
+            select([t1.c.a]).where(t1.c.b == 'x'),
+            select([t1.c.a]).where(t1.c.b == 'y'),
+        )
+
+    def test_bind_values_extracted(self):
+        key, bindparams = self._key(
+                select([t1.c.a]).where(and_(t1.c.b == 'x', t1.c.a > 5)))
+        eq_([b.value for b in bindparams], ['x', 5])
+
+    def test_operator_distinguished(self):
+        self._assert_different(
+            select([t1.c.a]).where(t1.c.a == 5),
+            select([t1.c.a]).where(t1.c.a > 5),
+        )
+
+    def test_columns_distinguished(self):
+        self._assert_different(
+            select([t1.c.a]),
+            select([t1.c.b]),
+        )
+        self._assert_different(
+            select([t1.c.a]),
+            select([t1.c.a, t1.c.b]),
+        )
+
+    def test_named_binds_distinguished(self):
+        self._assert_same(
+            select([t1.c.a]).where(t1.c.a == bindparam('x')),
+            select([t1.c.a]).where(t1.c.a == bindparam('x')),
+        )
+        self._assert_different(
+            select([t1.c.a]).where(t1.c.a == bindparam('x')),
+            select([t1.c.a]).where(t1.c.a == bindparam('y')),
+        )
+
+    def test_anonymous_aliases(self):
+        a1, a2 = t1.alias(), t1.alias()
+        self._assert_same(
+            select([a1.c.a]).where(a1.c.b == 'x'),
+            select([a2.c.a]).where(a2.c.b == 'y'),
+        )
+        self._assert_different(
+            select([t1.alias('x').c.a]),
+            select([t1.alias('y').c.a]),
+        )
+
+    def test_self_join_aliases(self):
+        a1, a2 = t1.alias(), t1.alias()
+        a3, a4 = t1.alias(), t1.alias()
+        self._assert_same(
+            select([a1.c.a, a2.c.a]).where(a1.c.a == a2.c.b),
+            select([a3.c.a, a4.c.a]).where(a3.c.a == a4.c.b),
+        )
+        self._assert_different(
+            select([a1.c.a, a2.c.a]).where(a1.c.a == a2.c.b),
+            select([a3.c.a, a4.c.a]).where(a4.c.a == a3.c.b),
+        )
+
+    def test_limit_offset(self):
+        self._assert_different(
+            select([t1.c.a]).limit(5),
+            select([t1.c.a]).limit(6),
+        )
+
+    def test_in_list_length(self):
+        self._assert_same(
+            select([t1.c.a]).where(t1.c.b.in_(['a', 'b'])),
+            select([t1.c.a]).where(t1.c.b.in_(['c', 'd'])),
+        )
+        self._assert_different(
+            select([t1.c.a]).where(t1.c.b.in_(['a', 'b'])),
+            select([t1.c.a]).where(t1.c.b.in_(['a', 'b', 'c'])),
+        )
+
+    def test_functions_joins_compound(self):
+        self._assert_same(
+            select([t1.c.a, func.count(t2.c.c)]).
+                select_from(t1.join(t2, t1.c.a == t2.c.c)).
+                group_by(t1.c.a),
+            select([t1.c.a, func.count(t2.c.c)]).
+                select_from(t1.join(t2, t1.c.a == t2.c.c)).
+                group_by(t1.c.a),
+        )
+        self._assert_same(
+            union(select([t1.c.a]).where(t1.c.a == 5),
+                    select([t2.c.c]).where(t2.c.c == 6)),
+            union(select([t1.c.a]).where(t1.c.a == 7),
+                    select([t2.c.c]).where(t2.c.c == 8)),
+        )
+
+    def test_lightweight_table(self):
+        lt1 = table('t1', column('a'), column('b'))
+        lt2 = table('t1', column('a'), column('b'))
+        self._assert_same(
+            select([lt1.c.a]).where(lt1.c.b == 5),
+            select([lt2.c.a]).where(lt2.c.b == 6),
+        )
+
+    def test_text(self):
+        self._assert_same(text("select 1"), text("select 1"))
+        self._assert_different(
+            select([literal_column("1")]),
+            select([literal_column("2")]),
+        )
+
+    def test_dml(self):
+        self._assert_same(
+            t1.update().where(t1.c.a == 5).values(b=bindparam('b')),
+            t1.update().where(t1.c.a == 6).values(b=bindparam('b')),
+        )
+        self._assert_same(t1.delete().where(t1.c.a == 5),
+                        t1.delete().where(t1.c.a == 6))
+        self._assert_different(t1.insert(), t2.insert())
+
+    def test_uncacheable(self):
+        # plain values given to values() become binds at compile time
+        is_(self._key(t1.insert().values(a=5)), None)
+        is_(self._key(t1.insert().values([{'a': 5}, {'a': 6}])), None)
+        is_(self._key(select([t1.c.a]).with_hint(t1, 'foo')), None)
+
+    def test_user_defined_type_identity(self):
+        class MyType(TypeDecorator):
+            impl = String
+
+        self._assert_different(
+            select([t1.c.a]).where(t1.c.b == bindparam('x', type_=MyType())),
+            select([t1.c.a]).where(t1.c.b == bindparam('x', type_=MyType())),
+        )
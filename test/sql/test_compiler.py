@@ -3364,3 +3364,122 @@ class ResultMapTest(fixtures.TestBase):
         is_(
             comp.result_map['t1_a'][1][2], t1.c.a
         )
+
+
+class BindParamPlanTest(fixtures.TestBase):
+    """test the per-compiled bound parameter plans and their
+    application to the parameters passed to the DBAPI."""
+
+    def _fixture(self):
+        class Prefixed(types.TypeDecorator):
+            impl = String
+
+            def process_bind_param(self, value, dialect):
+                return "p:" + value
+
+        return table('t',
+                    column('id', Integer),
+                    column('data', Prefixed()),
+                    column('other', String))
+
+    def _named(self):
+        d = default.DefaultDialect(paramstyle='named')
+        d.supports_unicode_statements = True
+        return d
+
+    def _positional(self):
+        return default.DefaultDialect(paramstyle='qmark')
+
+    def _dbapi_params(self, dialect, stmt, *multiparams):
+        from sqlalchemy.testing.mock import Mock
+
+        keys = list(multiparams[0]) if multiparams else []
+        compiled = stmt.compile(dialect=dialect, column_keys=keys,
+                                inline=len(multiparams) > 1)
+        ctx = dialect.execution_ctx_cls._init_compiled(
+                        dialect, Mock(_execution_options={}), Mock(),
+                        compiled, list(multiparams))
+        return list(ctx.parameters)
+
+    def test_plan(self):
+        t = self._fixture()
+        stmt = select([t]).where(t.c.id == bindparam('x', required=True)).\
+                    where(t.c.data == 'd1')
+        compiled = stmt.compile(dialect=self._named())
+        eq_(
+            sorted((name, required) for bindparam, name, key, required
+                        in compiled._bind_param_plan),
+            [('data_1', False), ('x', True)]
+        )
+        eq_(compiled.construct_params({'x': 5}), {'x': 5, 'data_1': 'd1'})
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "A value is required for bind parameter 'x'",
+            compiled.construct_params
+        )
+
+    def test_positional_processors(self):
+        t = self._fixture()
+        stmt = select([t]).where(t.c.other == bindparam('o')).\
+                    where(t.c.data == bindparam('d')).\
+                    where(t.c.id == bindparam('i'))
+        compiled = stmt.compile(dialect=self._positional())
+        plan = compiled._positional_processors
+        eq_([name for name, processor in plan], ['o', 'd', 'i'])
+        eq_([processor is not None for name, processor in plan],
+                [False, True, False])
+
+    def test_positional_no_processors(self):
+        t = self._fixture()
+        stmt = select([t]).where(t.c.other == bindparam('o')).\
+                    where(t.c.id == bindparam('i'))
+        eq_(
+            self._dbapi_params(self._positional(), stmt, {'o': 'x', 'i': 5}),
+            [('x', 5)]
+        )
+
+    def test_positional_with_processors(self):
+        t = self._fixture()
+        stmt = select([t]).where(t.c.id == bindparam('i')).\
+                    where(t.c.data == bindparam('d'))
+        eq_(
+            self._dbapi_params(self._positional(), stmt, {'i': 5, 'd': 'x'}),
+            [(5, 'p:x')]
+        )
+
+    def test_positional_executemany(self):
+        t = self._fixture()
+        eq_(
+            self._dbapi_params(self._positional(), t.insert(),
+                {'id': 1, 'data': 'a', 'other': 'o1'},
+                {'id': 2, 'data': 'b', 'other': 'o2'}),
+            [(1, 'p:a', 'o1'), (2, 'p:b', 'o2')]
+        )
+
+    def test_named_no_processors(self):
+        t = self._fixture()
+        stmt = select([t]).where(t.c.other == bindparam('o')).\
+                    where(t.c.id == bindparam('i'))
+        eq_(
+            self._dbapi_params(self._named(), stmt, {'o': 'x', 'i': 5}),
+            [{'o': 'x', 'i': 5}]
+        )
+
+    def test_named_with_processors(self):
+        t = self._fixture()
+        stmt = select([t]).where(t.c.id == bindparam('i')).\
+                    where(t.c.data == bindparam('d'))
+        eq_(
+            self._dbapi_params(self._named(), stmt, {'i': 5, 'd': 'x'}),
+            [{'i': 5, 'd': 'p:x'}]
+        )
+
+    def test_named_executemany(self):
+        t = self._fixture()
+        eq_(
+            self._dbapi_params(self._named(), t.insert(),
+                {'id': 1, 'data': 'a', 'other': 'o1'},
+                {'id': 2, 'data': 'b', 'other': 'o2'}),
+            [{'id': 1, 'data': 'p:a', 'other': 'o1'},
+                {'id': 2, 'data': 'p:b', 'other': 'o2'}]
+        )
@@ -4,7 +4,7 @@ from sqlalchemy.testing import fixtures, engines
 from sqlalchemy import util
 import datetime
 from sqlalchemy import *
-from sqlalchemy import exc, sql
+from sqlalchemy import exc, sql, event
 from sqlalchemy.engine import default, result as _result
 from sqlalchemy.testing.schema import Table, Column
 
@@ -245,6 +245,63 @@ class QueryTest(fixtures.TestBase):
             l.append(row)
         self.assert_(len(l) == 3)
 
+    def test_fetch_columns(self):
+        users.insert().execute(
+            {'user_id':7, 'user_name':'jack'},
+            {'user_id':8, 'user_name':'ed'},
+            {'user_id':9, 'user_name':'fred'},
+        )
+        for cls in (
+                    _result.ResultProxy,
+                    _result.BufferedRowResultProxy,
+                    _result.FullyBufferedResultProxy,
+                    _result.BufferedColumnResultProxy):
+            result = users.select().order_by(users.c.user_id).execute()
+            result = cls(result.context)
+            eq_(
+                list(result.fetch_columns(batch_size=2)),
+                [[[7, 8], ['jack', 'ed']], [[9], ['fred']]]
+            )
+            assert result.closed
+
+            result = users.select().order_by(users.c.user_id).execute()
+            result = cls(result.context)
+            eq_(
+                list(result.fetch_columns()),
+                [[[7, 8, 9], ['jack', 'ed', 'fred']]]
+            )
+            assert result.closed
+
+    def test_fetch_columns_processors(self):
+        class MyString(TypeDecorator):
+            impl = String
+
+            def process_result_value(self, value, dialect):
+                return "processed %s" % value
+
+        users.insert().execute(
+            {'user_id':7, 'user_name':'jack'},
+            {'user_id':8, 'user_name':'ed'},
+        )
+        result = select([
+                    users.c.user_id,
+                    cast(users.c.user_name, MyString)
+                ]).order_by(users.c.user_id).execute()
+        eq_(
+            list(result.fetch_columns()),
+            [[[7, 8], ['processed jack', 'processed ed']]]
+        )
+
+    def test_fetch_columns_empty(self):
+        eq_(list(users.select().execute().fetch_columns()), [])
+
+        result = testing.db.execute(users.insert(), user_id=1)
+        assert_raises_message(
+            exc.ResourceClosedError,
+            "This result object does not return rows.",
+            result.fetch_columns
+        )
+
     @testing.requires.subqueries
     def test_anonymous_rows(self):
         users.insert().execute(
@@ -1466,6 +1523,220 @@ class TableInsertTest(fixtures.TablesTest):
             inserted_primary_key=[]
         )
 
+
+class MultivaluesChunkTest(fixtures.TablesTest):
+    """test the execution of a multiple-VALUES INSERT as a series
+    of fixed-size statements."""
+
+    __requires__ = 'multivalues_inserts',
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('foo', metadata,
+                Column('id', Integer, primary_key=True),
+                Column('data', String(50)),
+                Column('x', Integer)
+            )
+
+    def _rows(self, start, count):
+        return [{'id': i, 'data': 'd%d' % i}
+                    for i in range(start, start + count)]
+
+    def _assert_executions(self, conn, stmt, executions):
+        canary = []
+
+        def before_cursor_execute(conn, cursor, statement,
+                        parameters, context, executemany):
+            canary.append(
+                (statement.count('('), executemany,
+                    len(parameters) if executemany else 1)
+            )
+        event.listen(conn, 'before_cursor_execute', before_cursor_execute)
+        result = conn.execute(stmt)
+
+        # the column list, plus one VALUES clause per row
+        eq_(canary, [(rows + 1, executemany, count)
+                        for rows, executemany, count in executions])
+        return result
+
+    def _assert_data(self, ids):
+        foo = self.tables.foo
+        eq_(
+            testing.db.execute(
+                select([foo.c.id, foo.c.data]).order_by(foo.c.id)).fetchall(),
+            [(i, 'd%d' % i) for i in ids]
+        )
+
+    def test_chunk_size_option(self):
+        foo = self.tables.foo
+        conn = testing.db.connect().\
+                execution_options(multivalues_chunk_size=3)
+        result = self._assert_executions(
+            conn,
+            foo.insert().values(self._rows(1, 8)),
+            [(3, True, 2), (2, False, 1)]
+        )
+        eq_(result.rowcount, 8)
+        self._assert_data(range(1, 9))
+
+    def test_chunk_size_statement_option(self):
+        foo = self.tables.foo
+        self._assert_executions(
+            testing.db.connect(),
+            foo.insert().values(self._rows(1, 6)).
+                execution_options(multivalues_chunk_size=2),
+            [(2, True, 3)]
+        )
+        self._assert_data(range(1, 7))
+
+    def test_no_chunking_under_size(self):
+        foo = self.tables.foo
+        conn = testing.db.connect().\
+                execution_options(multivalues_chunk_size=10)
+        self._assert_executions(
+            conn,
+            foo.insert().values(self._rows(1, 5)),
+            [(5, False, 1)]
+        )
+
+    def test_no_chunking_sql_expression(self):
+        foo = self.tables.foo
+        rows = self._rows(1, 5)
+        rows[0]['data'] = literal('d1')
+        conn = testing.db.connect().\
+                execution_options(multivalues_chunk_size=2)
+        self._assert_executions(
+            conn,
+            foo.insert().values(rows),
+            [(5, False, 1)]
+        )
+        self._assert_data(range(1, 6))
+
+    def test_bind_parameter_limit(self):
+        foo = self.tables.foo
+        dialect = testing.db.dialect
+        max_bind_parameters = dialect.max_bind_parameters
+        # two parameters per row plus one for the "x" column
+        dialect.max_bind_parameters = 9
+        try:
+            self._assert_executions(
+                testing.db.connect(),
+                foo.insert().values(self._rows(1, 10)),
+                [(4, True, 2), (2, False, 1)]
+            )
+            # the limit caps a larger chunk size
+            self._assert_executions(
+                testing.db.connect().
+                    execution_options(multivalues_chunk_size=6),
+                foo.insert().values(self._rows(11, 4)),
+                [(4, False, 1)]
+            )
+        finally:
+            dialect.max_bind_parameters = max_bind_parameters
+        self._assert_data(range(1, 15))
+
+    def test_compiled_cache(self):
+        foo = self.tables.foo
+        cache = {}
+        conn = testing.db.connect().execution_options(
+                    compiled_cache=cache, multivalues_chunk_size=3)
+        conn.execute(foo.insert().values(self._rows(1, 7)))
+        eq_(len(cache), 2)
+
+        # same chunk and remainder shapes, different values
+        conn.execute(foo.insert().values(self._rows(8, 4)))
+        eq_(len(cache), 2)
+
+        conn.execute(foo.insert().values(self._rows(12, 5)))
+        eq_(len(cache), 3)
+        self._assert_data(range(1, 17))
+
+    def test_chunks_are_atomic(self):
+        foo = self.tables.foo
+        conn = testing.db.connect().\
+                execution_options(multivalues_chunk_size=2)
+        assert_raises(
+            exc.IntegrityError,
+            conn.execute,
+            foo.insert().values(self._rows(1, 5) + self._rows(1, 1))
+        )
+        self._assert_data([])
+
+
+class MemoizedRowTest(fixtures.TablesTest):
+    """test the memoize_row_values execution option."""
+
+    run_inserts = 'once'
+    run_deletes = None
+
+    @classmethod
+    def define_tables(cls, metadata):
+        global canary
+        canary = []
+
+        class Processed(TypeDecorator):
+            impl = String
+
+            def process_result_value(self, value, dialect):
+                canary.append(value)
+                return "processed %s" % value
+
+        Table('foo', metadata,
+                Column('id', Integer, primary_key=True),
+                Column('data', Processed(50)),
+                Column('x', Integer)
+            )
+
+    @classmethod
+    def insert_data(cls):
+        cls.tables.foo.insert().execute(
+            {'id': 1, 'data': 'd1', 'x': 5},
+            {'id': 2, 'data': 'd2', 'x': 6},
+        )
+
+    def setup(self):
+        del canary[:]
+
+    def _rows(self, memoize):
+        foo = self.tables.foo
+        return testing.db.execute(
+                    foo.select().order_by(foo.c.id).
+                    execution_options(memoize_row_values=memoize)
+                ).fetchall()
+
+    def _access(self, row):
+        foo = self.tables.foo
+        return [row['data'], row[foo.c.data], row.data, row[1],
+                    tuple(row), row[0:2], row.values()]
+
+    def test_processed_once(self):
+        row = self._rows(True)[0]
+        eq_(canary, [])
+        eq_(
+            self._access(row),
+            ['processed d1'] * 4 + [
+                (1, 'processed d1', 5),
+                (1, 'processed d1'),
+                [1, 'processed d1', 5]
+            ]
+        )
+        eq_(canary, ['d1'])
+        is_(row['data'], row[1])
+
+    def test_not_memoized(self):
+        row = self._rows(False)[0]
+        self._access(row)
+        eq_(canary, ['d1'] * 7)
+
+    def test_pickled(self):
+        rows = self._rows(True)
+        rows[1]['data']
+        rows = util.pickle.loads(util.pickle.dumps(rows))
+        eq_(rows, [(1, 'processed d1', 5), (2, 'processed d2', 6)])
+        eq_(rows[1]['data'], 'processed d2')
+        eq_(canary, ['d2', 'd1'])
+
+
 class PercentSchemaNamesTest(fixtures.TestBase):
     """tests using percent signs, spaces in table and column names.
 
@@ -563,6 +563,51 @@ class QuoteTest(fixtures.TestBase, AssertsCompiledSQL):
             'CREATE INDEX foo ON t ("x")'
         )
 
+    def test_compiled_name_per_dialect(self):
+        from sqlalchemy.dialects import mysql
+        m = MetaData()
+        t = Table('t', m, Column('Col', Integer), schema='Sch')
+        stmt = select([t.c.Col])
+
+        for i in range(2):
+            self.assert_compile(
+                stmt,
+                'SELECT "Sch".t."Col" FROM "Sch".t'
+            )
+            self.assert_compile(
+                stmt,
+                'SELECT `Sch`.t.`Col` FROM `Sch`.t',
+                dialect=mysql.dialect()
+            )
+
+    def test_compiled_name_not_pickled(self):
+        from sqlalchemy.testing.util import picklers
+        m = MetaData()
+        t = Table('t', m, Column('Col', Integer))
+        self.assert_compile(select([t.c.Col]), 'SELECT t."Col" FROM t')
+        assert t.c.Col._compiled_name is not None
+
+        for loads, dumps in picklers():
+            t2 = loads(dumps(m)).tables['t']
+            assert t2._compiled_name is None
+            assert t2.c.Col._compiled_name is None
+            self.assert_compile(select([t2.c.Col]), 'SELECT t."Col" FROM t')
+
+    def test_compiled_name_truncated_alias(self):
+        m = MetaData()
+        t = Table('t', m, Column('x', Integer))
+        a = t.alias()
+        stmt = select([a.c.x, t.alias().c.x])
+        self.assert_compile(
+            stmt,
+            "SELECT t_1.x, t_2.x FROM t AS t_1, t AS t_2"
+        )
+        assert a.c.x._compiled_name is None
+        self.assert_compile(
+            select([a.c.x]),
+            "SELECT t_1.x FROM t AS t_1"
+        )
+
 
 
 class PreparerTest(fixtures.TestBase):